@@ -0,0 +1,74 @@
+import argparse
+import tempfile
+import pandas as pd
+from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.enums import BookType
+from data.binance_loader import BinanceDepthUpdateLoader
+from benchmarks.bench_tick_conversion import timeit
+from benchmarks.synthetic_data import write_depth_update_zip
+from examples.book_features import BookFeatures
+
+# N-level imbalance and microprice on every delta: incremental `BookFeatures` vs
+# reading the levels of the `OrderBook` after each update
+# python -m benchmarks.bench_book_features --rows 200000 --levels 5
+
+SYMBOL = "ETHUSDT"
+DATE = "2025-01-01"
+
+
+def book_features(deltas: list, levels: int) -> float:
+    features = BookFeatures(levels)
+    for delta in deltas:
+        features.apply_delta(delta)
+        features.imbalance
+        features.microprice
+    return features.microprice
+
+
+def order_book_levels(deltas: list, levels: int) -> float:
+    book = OrderBook(deltas[0].instrument_id, BookType.L2_MBP)
+    microprice = None
+    for delta in deltas:
+        book.apply_delta(delta)
+        bids = book.bids()[:levels]
+        asks = book.asks()[:levels]
+        bid_depth = sum(level.size() for level in bids)
+        ask_depth = sum(level.size() for level in asks)
+        if bid_depth + ask_depth:
+            imbalance = (bid_depth - ask_depth) / (bid_depth + ask_depth)
+        if bids and asks:
+            microprice = (
+                bids[0].price.as_double() * ask_depth
+                + asks[0].price.as_double() * bid_depth
+            ) / (bid_depth + ask_depth)
+    return microprice
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--levels", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write_depth_update_zip(tmp_dir, SYMBOL, DATE, args.rows)
+        deltas = BinanceDepthUpdateLoader(base_dir=tmp_dir).get_date_symbol_ticks(
+            DATE, f"{SYMBOL}.BINANCE", size_precision=3
+        )
+    assert (
+        abs(book_features(deltas, args.levels) - order_book_levels(deltas, args.levels))
+        < 1e-6
+    )
+    cases = {
+        "BookFeatures": lambda: book_features(deltas, args.levels),
+        "OrderBook.bids()/asks()": lambda: order_book_levels(deltas, args.levels),
+    }
+    results = pd.DataFrame(
+        [
+            {"case": name, "seconds": (seconds := timeit(func, args.repeat))}
+            | {"deltas/s": len(deltas) / seconds}
+            for name, func in cases.items()
+        ]
+    ).set_index("case")
+    print(results.to_string(float_format="{:,.3f}".format))
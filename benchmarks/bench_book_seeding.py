@@ -0,0 +1,80 @@
+import argparse
+import numpy as np
+import pandas as pd
+from nautilus_trader.model import BookOrder, OrderBook
+from nautilus_trader.model.enums import BookType, OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price, Quantity
+from data.order_book import snapshot_deltas
+from benchmarks.bench_tick_conversion import timeit
+
+# Seeding an L3 book one `OrderBook.add` at a time vs one bulk `OrderBookDeltas` batch
+# python -m benchmarks.bench_book_seeding --orders 50000
+
+INSTRUMENT_ID = "BTC-USDT.BINANCE"
+TS = 1_741_780_800_000_000_000
+
+
+def make_orders(num_orders: int, seed: int = 42) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    sides = np.where(rng.random(num_orders) < 0.5, OrderSide.BUY, OrderSide.SELL)
+    ticks = rng.integers(1, 1_000, num_orders)
+    return {
+        "sides": sides,
+        "prices": np.where(sides == OrderSide.BUY, 40_000 - ticks, 40_000 + ticks)
+        * 1.0,
+        "sizes": np.round(rng.exponential(1.0, num_orders) + 0.001, 3),
+        "order_ids": np.arange(1, num_orders + 1),
+    }
+
+
+def add_orders(orders: dict[str, np.ndarray]) -> OrderBook:
+    # The per-order construction of the examples
+    book = OrderBook(InstrumentId.from_str(INSTRUMENT_ID), BookType.L3_MBO)
+    for side, price, size, order_id in zip(
+        orders["sides"].tolist(),
+        orders["prices"].tolist(),
+        orders["sizes"].tolist(),
+        orders["order_ids"].tolist(),
+    ):
+        book.add(
+            BookOrder(OrderSide(side), Price(price, 2), Quantity(size, 3), order_id),
+            TS,
+        )
+    return book
+
+
+def apply_snapshot(orders: dict[str, np.ndarray]) -> OrderBook:
+    book = OrderBook(InstrumentId.from_str(INSTRUMENT_ID), BookType.L3_MBO)
+    book.apply_deltas(
+        snapshot_deltas(
+            INSTRUMENT_ID, ts_event=TS, price_precision=2, size_precision=3, **orders
+        )
+    )
+    return book
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders)
+    # Both ways must give the same book
+    assert add_orders(orders).pprint(10) == apply_snapshot(orders).pprint(10)
+    cases = {
+        "OrderBook.add per order": lambda: add_orders(orders),
+        "snapshot_deltas": lambda: snapshot_deltas(
+            INSTRUMENT_ID, ts_event=TS, price_precision=2, size_precision=3, **orders
+        ),
+        "snapshot_deltas + apply_deltas": lambda: apply_snapshot(orders),
+    }
+    results = pd.DataFrame(
+        [
+            {"case": name, "seconds": (seconds := timeit(func, args.repeat))}
+            | {"orders/s": args.orders / seconds}
+            for name, func in cases.items()
+        ]
+    ).set_index("case")
+    print(results.to_string(float_format="{:,.3f}".format))
@@ -0,0 +1,96 @@
+import argparse
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from nautilus_trader.model import BookOrder, OrderBookDepth10
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price, Quantity
+from data.order_book import depth10_from_arrays
+from benchmarks.bench_tick_conversion import timeit
+
+# Building OrderBookDepth10 snapshots one Decimal at a time vs in bulk from (N, 10) arrays
+# python -m benchmarks.bench_depth_snapshots --rows 100000
+
+INSTRUMENT_ID = "BTC-USDT.BINANCE"
+
+
+def make_levels(rows: int, seed: int = 42) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    mid = (40000 + np.cumsum(rng.normal(0, 1, rows)))[:, None]
+    levels = np.arange(1, 11)
+    return {
+        "bid_prices": np.round(mid * (1 - 0.001 * levels), 3),
+        "ask_prices": np.round(mid * (1 + 0.001 * levels), 3),
+        "bid_sizes": np.round(rng.exponential(2, (rows, 10)), 1),
+        "ask_sizes": np.round(rng.exponential(2, (rows, 10)), 1),
+        "ts_event": 1_735_689_600_000_000_000
+        + np.arange(rows, dtype=np.uint64) * 100_000_000,
+    }
+
+
+def decimal_snapshots(arrays: dict[str, np.ndarray]) -> list[OrderBookDepth10]:
+    # The per-object construction of the examples
+    instrument_id = InstrumentId.from_str(INSTRUMENT_ID)
+    counts = [0] * 10
+    depths = []
+    for i, ts in enumerate(arrays["ts_event"].tolist()):
+        bids = [
+            BookOrder(
+                side=OrderSide.BUY,
+                price=Price(Decimal(str(price)), 3),
+                size=Quantity(Decimal(str(size)), 1),
+                order_id=idx,
+            )
+            for idx, (price, size) in enumerate(
+                zip(arrays["bid_prices"][i], arrays["bid_sizes"][i])
+            )
+        ]
+        asks = [
+            BookOrder(
+                side=OrderSide.SELL,
+                price=Price(Decimal(str(price)), 3),
+                size=Quantity(Decimal(str(size)), 1),
+                order_id=idx,
+            )
+            for idx, (price, size) in enumerate(
+                zip(arrays["ask_prices"][i], arrays["ask_sizes"][i])
+            )
+        ]
+        depths.append(
+            OrderBookDepth10(
+                instrument_id=instrument_id,
+                bids=bids,
+                asks=asks,
+                bid_counts=counts,
+                ask_counts=counts,
+                flags=0,
+                sequence=i,
+                ts_event=ts,
+                ts_init=ts,
+            )
+        )
+    return depths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    arrays = make_levels(args.rows)
+    cases = {
+        "Decimal per BookOrder": lambda: decimal_snapshots(arrays),
+        "depth10_from_arrays": lambda: depth10_from_arrays(
+            INSTRUMENT_ID, price_precision=3, size_precision=1, **arrays
+        ),
+    }
+    results = pd.DataFrame(
+        [
+            {"case": name, "seconds": (seconds := timeit(func, args.repeat))}
+            | {"snapshots/s": args.rows / seconds}
+            for name, func in cases.items()
+        ]
+    ).set_index("case")
+    print(results.to_string(float_format="{:,.3f}".format))
@@ -0,0 +1,117 @@
+import argparse
+import numpy as np
+import pandas as pd
+from nautilus_trader.backtest import models
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.objects import Money, Price, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+from benchmarks.bench_tick_conversion import timeit
+from examples import fee_models
+
+# Commission of many partial fills: the raw fixed-point fee models vs the Nautilus ones
+# and the Decimal/Money fee model formerly in the order book example
+# python -m benchmarks.bench_fee_models --fills 200000
+
+
+class DecimalPerContractFeeModel(models.FeeModel):
+    # The former examples/order_book_snapshot.py fee model
+    def __init__(self, commission: Money):
+        super().__init__()
+        self.commission = commission
+
+    def get_commission(self, order, fill_qty, fill_px, instrument):
+        return Money(self.commission * fill_qty, self.commission.currency)
+
+
+def make_fills(fills: int, seed: int = 42) -> tuple:
+    instrument = TestInstrumentProvider.ethusdt_binance()
+    rng = np.random.default_rng(seed)
+    # Partial fills of a few lots at prices around 3300
+    quantities = [
+        Quantity(qty, instrument.size_precision)
+        for qty in np.round(rng.integers(1, 50, fills) * 0.001, 3)
+    ]
+    prices = [
+        Price(px, instrument.price_precision)
+        for px in np.round(3300 + rng.normal(0, 5, fills), 2)
+    ]
+    order = TestExecStubs.make_accepted_order(instrument=instrument)
+    order.apply(
+        TestEventStubs.order_filled(
+            order,
+            instrument,
+            last_qty=Quantity(0.001, instrument.size_precision),
+            last_px=prices[0],
+            liquidity_side=LiquiditySide.TAKER,
+        )
+    )
+    return instrument, order, quantities, prices
+
+
+def commissions(fee_model, instrument, order, quantities, prices) -> list[Money]:
+    get_commission = fee_model.get_commission
+    return [
+        get_commission(order, qty, px, instrument)
+        for qty, px in zip(quantities, prices)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fills", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    instrument, order, quantities, prices = make_fills(args.fills)
+    per_contract = Money(2.50, USDT)
+    pairs = {
+        "per contract": (
+            [
+                DecimalPerContractFeeModel(per_contract),
+                models.PerContractFeeModel(per_contract),
+            ],
+            fee_models.PerContractFeeModel(per_contract),
+        ),
+        "maker/taker": (
+            [models.MakerTakerFeeModel()],
+            fee_models.MakerTakerFeeModel(),
+        ),
+    }
+    rows = []
+    for name, (references, fee_model) in pairs.items():
+        expected = commissions(fee_model, instrument, order, quantities, prices)
+        for reference in references:
+            # NOTE: Nautilus rounds the float notional * fee, so allow one cent
+            actual = commissions(reference, instrument, order, quantities, prices)
+            assert all(
+                abs(a.as_double() - b.as_double()) <= 0.01
+                for a, b in zip(actual, expected)
+            )
+        for model in references + [fee_model]:
+            seconds = timeit(
+                lambda: commissions(model, instrument, order, quantities, prices),
+                args.repeat,
+            )
+            rows.append(
+                {
+                    "case": f"{name}: {type(model).__module__.split('.')[-1]}.{type(model).__name__}",
+                    "seconds": seconds,
+                    "fills/s": args.fills / seconds,
+                }
+            )
+    bps = fee_models.BpsFeeModel(2.5)
+    seconds = timeit(
+        lambda: commissions(bps, instrument, order, quantities, prices), args.repeat
+    )
+    rows.append(
+        {
+            "case": "bps: fee_models.BpsFeeModel",
+            "seconds": seconds,
+            "fills/s": args.fills / seconds,
+        }
+    )
+    results = pd.DataFrame(rows).set_index("case")
+    print(results.to_string(float_format="{:,.3f}".format))
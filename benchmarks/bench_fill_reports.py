@@ -0,0 +1,194 @@
+import argparse
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig, RiskEngineConfig, StrategyConfig
+from nautilus_trader.model import TradeTick
+from nautilus_trader.model.currencies import ETH, USDT
+from nautilus_trader.model.enums import AccountType, OmsType, OrderSide
+from nautilus_trader.model.identifiers import InstrumentId, Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.trading.strategy import Strategy
+from data.binance_loader import BinanceKlineLoader, BinanceTradesLoader
+from data.reports import (
+    close_series,
+    fills_arrays,
+    from_orders_kwargs,
+    read_arrays,
+    write_arrays,
+)
+from data.stats import portfolio_stats
+from benchmarks.bench_tick_conversion import (
+    SYMBOL_VENUE,
+    make_klines_df,
+    make_trades_df,
+    timeit,
+)
+
+# Engine fills to vectorbt inputs: the fills report written to CSV and read back (as in
+# examples/order_book_snapshot.py + evaluate_orders_report_with_vectorbt.py) vs the
+# fill arrays in-process or through Parquet/Feather, and the fills aligned onto a day of
+# 1-second bars (the close from the `Bar` objects vs from the Arrow table) and their
+# portfolio stats in NumPy (from the fill arrays vs from the fills report)
+# python -m benchmarks.bench_fill_reports --fills 50000
+
+INSTRUMENT = TestInstrumentProvider.ethusdt_binance()
+
+
+class FlipStrategyConfig(StrategyConfig, frozen=True):
+    instrument_id: InstrumentId
+
+
+class FlipStrategy(Strategy):
+    """
+    A market order of alternating side on every trade.
+    """
+
+    def on_start(self):
+        # Above the 10 USDT minimum notional
+        self.quantity = INSTRUMENT.make_qty(0.01)
+        self.buy = True
+        self.subscribe_trade_ticks(self.config.instrument_id)
+
+    def on_trade_tick(self, tick: TradeTick) -> None:
+        self.submit_order(
+            self.order_factory.market(
+                self.config.instrument_id,
+                OrderSide.BUY if self.buy else OrderSide.SELL,
+                self.quantity,
+            )
+        )
+        self.buy = not self.buy
+
+
+def run_engine(fills: int) -> BacktestEngine:
+    engine = BacktestEngine(
+        BacktestEngineConfig(
+            logging=LoggingConfig(log_level="ERROR"),
+            # One trade per millisecond, above the default 100 orders/s
+            risk_engine=RiskEngineConfig(max_order_submit_rate="1000/00:00:01"),
+        )
+    )
+    engine.add_venue(
+        Venue("BINANCE"),
+        OmsType.NETTING,
+        AccountType.CASH,
+        base_currency=None,
+        starting_balances=[Money(1_000_000, USDT), Money(100, ETH)],
+    )
+    engine.add_instrument(INSTRUMENT)
+    engine.add_data(
+        BinanceTradesLoader().df_to_ticks(make_trades_df(fills), SYMBOL_VENUE)
+    )
+    engine.add_strategy(FlipStrategy(FlipStrategyConfig(instrument_id=INSTRUMENT.id)))
+    engine.run()
+    return engine
+
+
+def csv_round_trip(engine: BacktestEngine, path: str) -> tuple[np.ndarray, np.ndarray]:
+    report = engine.trader.generate_order_fills_report()
+    report.to_csv(path)
+    report = pd.read_csv(path)
+    size = report.filled_qty * report.side.map({"BUY": 1, "SELL": -1})
+    return size.to_numpy(), report.avg_px.astype(float).to_numpy()
+
+
+def bar_objects_close(bars: list) -> pd.Series:
+    # The former `USE_DETAIL_PRICE` close of the low-level example
+    close = pd.Series({bar.ts_init: bar.close for bar in bars})
+    close.index = pd.to_datetime(close.index, unit="ns", utc=True)
+    return close.astype(float)
+
+
+def arrays_round_trip(engine: BacktestEngine, path: str | None) -> dict:
+    fills = fills_arrays(engine.cache.orders())
+    if path is not None:
+        fills = read_arrays(write_arrays(fills, path))
+    return from_orders_kwargs(fills)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fills", type=int, default=50_000)
+    parser.add_argument("--bars", type=int, default=86_400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = run_engine(args.fills)
+    loader = BinanceKlineLoader("1s")
+    bars_table = loader.df_to_table(make_klines_df(args.bars), SYMBOL_VENUE)
+    bars = loader.df_to_ticks(make_klines_df(args.bars), SYMBOL_VENUE)
+    assert bar_objects_close(bars).equals(close_series(bars_table))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {
+            suffix: os.path.join(tmp_dir, f"fills.{suffix}")
+            for suffix in ("csv", "parquet", "feather")
+        }
+        size, price = csv_round_trip(engine, paths["csv"])
+        kwargs = arrays_round_trip(engine, paths["feather"])
+        # The report has one row per order (at the average price of its fills)
+        assert np.isclose(kwargs["size"].sum(), size.sum())
+        assert np.isclose(
+            np.abs(kwargs["size"]) @ kwargs["price"], np.abs(size) @ price
+        )
+        fills = len(kwargs["size"])
+        close = close_series(bars_table)
+
+        # (function, rows processed)
+        cases = {
+            "fills report -> CSV -> read_csv": (
+                lambda: csv_round_trip(engine, paths["csv"]),
+                fills,
+            ),
+            "fills_arrays (in-process)": (
+                lambda: arrays_round_trip(engine, None),
+                fills,
+            ),
+            "fills_arrays -> Parquet -> read": (
+                lambda: arrays_round_trip(engine, paths["parquet"]),
+                fills,
+            ),
+            "fills_arrays -> Feather -> memory map": (
+                lambda: arrays_round_trip(engine, paths["feather"]),
+                fills,
+            ),
+            "close from Bar objects": (lambda: bar_objects_close(bars), args.bars),
+            "close_series (Arrow table)": (
+                lambda: close_series(bars_table),
+                args.bars,
+            ),
+            "fills aligned onto the bars": (
+                lambda: from_orders_kwargs(
+                    fills_arrays(engine.cache.orders()), close=close_series(bars_table)
+                ),
+                fills,
+            ),
+            "portfolio_stats (fills_arrays)": (
+                lambda: portfolio_stats(
+                    fills_arrays(engine.cache.orders()), close, 1_000_000
+                ),
+                fills,
+            ),
+            "portfolio_stats (fills report)": (
+                lambda: portfolio_stats(
+                    engine.trader.generate_order_fills_report(), close, 1_000_000
+                ),
+                fills,
+            ),
+        }
+        results = pd.DataFrame(
+            [
+                {
+                    "case": name,
+                    "rows": rows,
+                    "seconds": (seconds := timeit(func, args.repeat)),
+                    "rows/s": rows / seconds,
+                }
+                for name, (func, rows) in cases.items()
+            ]
+        ).set_index("case")
+    engine.dispose()
+    print(results.to_string(float_format="{:,.3f}".format))
@@ -0,0 +1,227 @@
+import argparse
+import json
+import tempfile
+import time
+import zipfile
+import pandas as pd
+import nautilus_trader
+from data.binance_loader import (
+    BinanceAggTradesLoader,
+    BinanceBookSnapshotLoader,
+    BinanceBookTickerLoader,
+    BinanceDepthUpdateLoader,
+    BinanceKlineLoader,
+    BinanceTradesLoader,
+)
+from benchmarks.bench_tick_conversion import timeit
+from benchmarks.phase_profiler import PhaseProfiler
+from benchmarks.synthetic_data import write_dataset
+from examples.backtest_eurusd_bar_low_level_api import (
+    add_venue,
+    get_engine,
+    get_fill_model,
+    get_instrument,
+    get_strategy,
+)
+
+# Loader throughput and end-to-end EMA backtest speed on synthetic Binance-format zips,
+# runs offline and the generated data only depend on --seed and the row counts
+# python -m benchmarks.bench_loaders --trade-rows 1000000 --output bench.json
+
+SYMBOL = "ETHUSDT"
+DATE = "2025-01-01"
+
+
+def measure(name: str, func, repeat: int, rows: int, csv_bytes: int = 0) -> dict:
+    """
+    Best wall time of `repeat` calls of `func`, and the peak RSS growth of one call.
+    """
+    profiler = PhaseProfiler()
+    with profiler.phase(name):
+        func()
+    phase = profiler.phases[0]
+    seconds = (
+        min(phase["wall_seconds"], timeit(func, repeat - 1))
+        if repeat > 1
+        else phase["wall_seconds"]
+    )
+    return {
+        "case": name,
+        "rows": rows,
+        "seconds": seconds,
+        "rows/s": rows / seconds,
+        "MB/s": csv_bytes / 1e6 / seconds,
+        "peak_memory_MB": (phase["peak_rss_bytes"] - phase["rss_before_bytes"]) / 1e6,
+    }
+
+
+def bench_loaders(
+    data_dir: str,
+    cache_dir: str,
+    repeat: int,
+    book: bool = False,
+    chunksize: int = 100_000,
+) -> list[dict]:
+    symbol_venue = get_instrument().id.value
+    records = []
+    loaders = [
+        ("aggTrades", BinanceAggTradesLoader, {}),
+        ("trades", BinanceTradesLoader, {}),
+        ("klines", BinanceKlineLoader, {"freq": "1s"}),
+    ]
+    if book:
+        loaders += [
+            ("bookTicker", BinanceBookTickerLoader, {}),
+            ("bookSnapshot", BinanceBookSnapshotLoader, {}),
+            ("depthUpdate", BinanceDepthUpdateLoader, {}),
+        ]
+    for dataset, loader_cls, kwargs in loaders:
+        base_dir = f"{data_dir}/{dataset}"
+        loader = loader_cls(base_dir=base_dir, cache_dir=None, **kwargs)
+        cached_loader = loader_cls(base_dir=base_dir, cache_dir=cache_dir, **kwargs)
+        with zipfile.ZipFile(loader.get_path(DATE, SYMBOL)) as zf:
+            csv_bytes = zf.infolist()[0].file_size
+        rows = len(cached_loader.get_date_symbol(DATE, SYMBOL))  # warm the cache
+
+        records.append(
+            measure(
+                f"{dataset}: decode",
+                lambda: loader.get_date_symbol(DATE, SYMBOL),
+                repeat,
+                rows,
+                csv_bytes,
+            )
+        )
+        records.append(
+            measure(
+                f"{dataset}: decode (cached)",
+                lambda: cached_loader.get_date_symbol(DATE, SYMBOL),
+                repeat,
+                rows,
+                csv_bytes,
+            )
+        )
+        records.append(
+            measure(
+                f"{dataset}: ticks (cached)",
+                lambda: cached_loader.get_date_symbol_ticks(DATE, symbol_venue),
+                repeat,
+                rows,
+                csv_bytes,
+            )
+        )
+        # Streaming in chunks must give the same objects as the whole day
+        whole = cached_loader.get_date_symbol_ticks(DATE, symbol_venue)
+
+        def streamed():
+            return [
+                tick
+                for batch in cached_loader.iter_date_symbol_ticks(
+                    DATE, symbol_venue, chunksize=chunksize
+                )
+                for tick in batch
+            ]
+
+        assert list(map(repr, streamed())) == list(map(repr, whole)), dataset
+        records.append(
+            measure(
+                f"{dataset}: ticks streamed (cached)",
+                streamed,
+                repeat,
+                rows,
+                csv_bytes,
+            )
+        )
+    return records
+
+
+def bench_backtest(data_dir: str, cache_dir: str, repeat: int) -> dict:
+    instrument = get_instrument()
+    bars = BinanceKlineLoader(
+        "1s", base_dir=f"{data_dir}/klines", cache_dir=cache_dir
+    ).get_date_symbol_ticks(
+        DATE,
+        instrument.id.value,
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+    )
+
+    best = None
+    for _ in range(repeat):
+        engine = get_engine(log_level="ERROR")
+        add_venue(engine, instrument, 10_000, get_fill_model())
+        engine.add_instrument(instrument)
+        engine.add_data(bars)
+        engine.add_strategy(strategy=get_strategy(instrument, strategy_name="ema"))
+        start_time = time.perf_counter()
+        engine.run()
+        seconds = time.perf_counter() - start_time
+        result = engine.get_result()
+        engine.dispose()
+        if best is None or seconds < best["seconds"]:
+            best = {
+                "case": "backtest: EMACross on 1s bars",
+                "rows": len(bars),
+                "seconds": seconds,
+                "rows/s": len(bars) / seconds,
+                "events/s": result.total_events / seconds,
+                "total_events": result.total_events,
+                "total_orders": result.total_orders,
+            }
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the loaders and the EMA backtest on synthetic data"
+    )
+    parser.add_argument("--trade-rows", type=int, default=1_000_000)
+    parser.add_argument("--kline-rows", type=int, default=86_400)
+    parser.add_argument(
+        "--book-rows", type=int, default=0, help="also bench the order book loaders"
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=100_000, help="rows per streamed batch"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-backtest", action="store_true")
+    parser.add_argument("--output", help="JSON report path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = f"{tmp_dir}/data"
+        cache_dir = f"{tmp_dir}/cache"
+        write_dataset(
+            data_dir,
+            SYMBOL,
+            DATE,
+            trade_rows=args.trade_rows,
+            kline_rows=args.kline_rows,
+            book_rows=args.book_rows,
+            seed=args.seed,
+        )
+        records = bench_loaders(
+            data_dir,
+            cache_dir,
+            args.repeat,
+            book=args.book_rows > 0,
+            chunksize=args.chunksize,
+        )
+        if not args.no_backtest:
+            records.append(bench_backtest(data_dir, cache_dir, args.repeat))
+
+    results = pd.DataFrame(records).set_index("case")
+    pd.set_option("display.width", None)
+    print(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "nautilus_trader": nautilus_trader.__version__,
+                    "args": vars(args),
+                    "results": records,
+                },
+                f,
+                indent=2,
+            )
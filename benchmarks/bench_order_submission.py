@@ -0,0 +1,156 @@
+import argparse
+import time
+from decimal import Decimal
+import numpy as np
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import OrderBookDepth10
+from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.enums import (
+    AccountType,
+    BookType,
+    OmsType,
+    OrderSide,
+    TimeInForce,
+)
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from data.order_book import depth10_from_arrays
+from examples.order_batching import depth_prices, limit_orders
+from examples.order_book_strategy import OrderBookStrategy, OrderBookStrategyConfig
+
+# Order throughput through the RiskEngine and the matching engine of a market making
+# strategy quoting a ladder on the 10 depth levels of both sides at every update:
+# one command per order vs one `OrderList` per side vs only replacing the moved quotes
+# python -m benchmarks.bench_order_submission --updates 2000 --levels 10
+
+INSTRUMENT = TestInstrumentProvider.ethusdt_perp_binance()
+
+
+class LadderStrategyConfig(OrderBookStrategyConfig, frozen=True):
+    levels: int = 10
+    mode: str = "ladder"
+
+
+class LadderStrategy(OrderBookStrategy):
+    """
+    Quote a ladder on the depth levels of each side at every depth update:
+    - "per order": cancel and submit every order one command at a time
+    - "batch": one `BatchCancelOrders` and one `OrderList` per side
+    - "ladder": only replace the quotes which moved (`quote_ladder`)
+    """
+
+    def on_instrument_ready(self, instrument):
+        self.quantity = self.values.quantity(instrument.min_quantity.raw)
+
+    def on_depth(self, depth: OrderBookDepth10) -> None:
+        levels = self.config.levels
+        sides = ((OrderSide.BUY, depth.bids), (OrderSide.SELL, depth.asks))
+        if self.config.mode == "ladder":
+            for side, orders in sides:
+                self.quote_ladder(side, depth_prices(orders, levels), self.quantity)
+        elif self.config.mode == "batch":
+            open_orders = self.cache.orders_open(instrument_id=self.instrument_id)
+            if open_orders:
+                self.cancel_orders(open_orders)
+            for side, orders in sides:
+                self.submit_orders(
+                    limit_orders(
+                        self.order_factory,
+                        self.instrument_id,
+                        side,
+                        depth_prices(orders, levels),
+                        self.quantity,
+                        post_only=True,
+                    )
+                )
+        else:
+            # The per-order style of the examples
+            for order in self.cache.orders_open(instrument_id=self.instrument_id):
+                self.cancel_order(order)
+            for side, orders in sides:
+                for book_order in orders[:levels]:
+                    if not book_order.size.raw:
+                        continue
+                    order = self.order_factory.limit(
+                        instrument_id=self.instrument_id,
+                        order_side=side,
+                        quantity=Quantity(Decimal("0.001"), self.size_precision),
+                        price=self.instrument.make_price(book_order.price.as_double()),
+                        time_in_force=TimeInForce.GTC,
+                        post_only=True,
+                    )
+                    self.orders_submitted += 1
+                    self.submit_order(order)
+
+
+def make_depths(updates: int, seed: int = 42) -> list[OrderBookDepth10]:
+    rng = np.random.default_rng(seed)
+    mid = np.round(3300 + np.cumsum(rng.normal(0, 0.05, updates)), 2)[:, None]
+    levels = np.arange(10)
+    return depth10_from_arrays(
+        INSTRUMENT.id.value,
+        bid_prices=mid - 0.01 * (levels + 1),
+        ask_prices=mid + 0.01 * (levels + 1),
+        bid_sizes=np.round(rng.exponential(2, (updates, 10)) + 0.001, 3),
+        ask_sizes=np.round(rng.exponential(2, (updates, 10)) + 0.001, 3),
+        # One update per second, within the default RiskEngine submit rate limit
+        ts_event=1_735_689_600_000_000_000
+        + np.arange(updates, dtype=np.uint64) * 1_000_000_000,
+        price_precision=INSTRUMENT.price_precision,
+        size_precision=INSTRUMENT.size_precision,
+    )
+
+
+def run(depths: list[OrderBookDepth10], levels: int, mode: str) -> dict:
+    engine = BacktestEngine(
+        BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"))
+    )
+    engine.add_venue(
+        Venue("BINANCE"),
+        OmsType.NETTING,
+        AccountType.MARGIN,
+        base_currency=None,
+        starting_balances=[Money(1_000_000, USDT)],
+        book_type=BookType.L2_MBP,
+    )
+    engine.add_instrument(INSTRUMENT)
+    engine.add_data(depths)
+    strategy = LadderStrategy(
+        LadderStrategyConfig(
+            instrument_id=INSTRUMENT.id,
+            subscribe_deltas=False,
+            subscribe_depth=True,
+            levels=levels,
+            mode=mode,
+        )
+    )
+    engine.add_strategy(strategy)
+    start = time.perf_counter()
+    engine.run()
+    seconds = time.perf_counter() - start
+    orders = strategy.orders_submitted
+    assert len(engine.cache.orders_open()) <= 2 * levels
+    engine.dispose()
+    return {
+        "mode": mode,
+        "seconds": seconds,
+        "updates/s": len(depths) / seconds,
+        "orders": orders,
+        "orders/s": orders / seconds,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--updates", type=int, default=2_000)
+    parser.add_argument("--levels", type=int, default=10)
+    args = parser.parse_args()
+
+    depths = make_depths(args.updates)
+    results = pd.DataFrame(
+        [run(depths, args.levels, mode) for mode in ("per order", "batch", "ladder")]
+    ).set_index("mode")
+    print(results.to_string(float_format="{:,.3f}".format))
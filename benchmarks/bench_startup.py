@@ -0,0 +1,95 @@
+import argparse
+import subprocess
+import sys
+import pandas as pd
+from benchmarks.bench_tick_conversion import timeit
+
+# Startup cost of the entry points (sweep workers, CLI ingestion jobs, examples): the
+# `python -X importtime` total of importing each module in a fresh interpreter, the wall
+# time of the whole process, and which of the heavy optional dependencies got loaded
+# python -m benchmarks.bench_startup --repeat 5
+
+MODULES = [
+    "data.fixed_point",
+    "data.binance_loader",
+    "data.reports",
+    "data.stats",
+    "data.order_book",
+    "examples.backtest_eurusd_bar_low_level_api",
+    "examples.engine_harness",
+    "examples.sweep_backtest_eurusd_bar",
+]
+
+# Loaded on first use only (if installed)
+HEAVY = [
+    "nautilus_trader.model",
+    "vectorbt",
+    "numba",
+    "plotly",
+    "ipdb",
+    "talib",
+]
+
+
+def import_time(module: str) -> tuple[float, list[str]]:
+    """
+    Seconds spent importing `module` (and everything it imports) as reported by
+    `-X importtime`, and the `HEAVY` modules it loaded.
+    """
+    code = f"import sys, {module}; print(*[m for m in {HEAVY!r} if m in sys.modules])"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # "import time: self [us] | cumulative | imported package", nested imports are
+    # indented so the top-level lines add up to the whole import
+    microseconds = sum(
+        int(line.split("|")[1])
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:")
+        and not line.split("|")[2].startswith("  ")
+        and line.split("|")[1].strip().isdigit()
+    )
+    return microseconds / 1e6, process.stdout.split()
+
+
+def run_process(args: list[str]) -> None:
+    subprocess.run([sys.executable, *args], capture_output=True, check=True, text=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # (interpreter arguments, module imported for `-X importtime` or None)
+    cases = {
+        "python -c pass": (["-c", "pass"], None),
+        **{
+            f"import {module}": (["-c", f"import {module}"], module)
+            for module in MODULES
+        },
+        "data.binance_loader ingest --help": (
+            ["-m", "data.binance_loader", "ingest", "--help"],
+            None,
+        ),
+    }
+    rows = []
+    for name, (process_args, module) in cases.items():
+        seconds, heavy = float("nan"), []
+        if module is not None:
+            # Best of `repeat`
+            runs = [import_time(module) for _ in range(args.repeat)]
+            seconds, heavy = min(seconds for seconds, _ in runs), runs[0][1]
+        rows.append(
+            {
+                "case": name,
+                "import (s)": seconds,
+                "process (s)": timeit(lambda: run_process(process_args), args.repeat),
+                "heavy modules": " ".join(heavy),
+            }
+        )
+    results = pd.DataFrame(rows).set_index("case")
+    print(results.to_string(float_format="{:,.3f}".format))
@@ -0,0 +1,126 @@
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from nautilus_trader.model import TradeTick, Bar
+from nautilus_trader.persistence.wranglers_v2 import (
+    TradeTickDataWranglerV2,
+    BarDataWranglerV2,
+)
+from data.binance_loader import BinanceKlineLoader, BinanceTradesLoader
+
+# Compare the pyo3 and legacy (Cython) object conversion paths of the loaders on synthetic data
+# python -m benchmarks.bench_tick_conversion --rows 1000000
+
+SYMBOL_VENUE = "ETHUSDT.BINANCE"
+BAR_TYPE = f"{SYMBOL_VENUE}-1-SECOND-LAST-EXTERNAL"
+
+
+def make_trades_df(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "trade_id": np.arange(rows, dtype=np.int64),
+            "price": np.round(3300 + np.cumsum(rng.normal(0, 0.1, rows)), 2),
+            "quantity": np.round(rng.exponential(0.5, rows) + 0.0001, 4),
+            "timestamp": pd.to_datetime(
+                1_735_689_600_000_000 + np.arange(rows, dtype=np.int64) * 1_000,
+                unit="us",
+            ),
+            "buyer_maker": rng.random(rows) < 0.5,
+        }
+    )
+
+
+def make_klines_df(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(3300 + np.cumsum(rng.normal(0, 0.5, rows)), 2)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(
+                1_735_689_600_000_000 + np.arange(rows, dtype=np.int64) * 1_000_000,
+                unit="us",
+            ),
+            "open": close,
+            "high": close + 0.5,
+            "low": close - 0.5,
+            "close": close,
+            "volume": np.round(rng.exponential(2, rows), 4),
+        }
+    )
+
+
+def pyo3_trades(df: pd.DataFrame) -> list:
+    df = df.assign(ts_recv=df["timestamp"])
+    return TradeTickDataWranglerV2(
+        instrument_id=SYMBOL_VENUE, price_precision=2, size_precision=5
+    ).from_pandas(df)
+
+
+def pyo3_bars(df: pd.DataFrame) -> list:
+    df = df.assign(
+        ts_recv=df["timestamp"], volume=(df["volume"] * 1e9).astype(np.uint64)
+    )
+    return BarDataWranglerV2(
+        bar_type=BAR_TYPE, price_precision=2, size_precision=5
+    ).from_pandas(df)
+
+
+def timeit(func, repeat: int) -> float:
+    # Best of `repeat` to reduce the noise of other processes
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    trades_df = make_trades_df(args.rows)
+    klines_df = make_klines_df(args.rows)
+    trades_loader = BinanceTradesLoader()
+    klines_loader = BinanceKlineLoader()
+
+    cases = {
+        "trades: pyo3 wrangler from_pandas": lambda: pyo3_trades(trades_df),
+        "trades: pyo3 fixed-point arrow (use_pyo3=True)": lambda: trades_loader.df_to_ticks(
+            trades_df, SYMBOL_VENUE, use_pyo3=True
+        ),
+        "trades: pyo3 wrangler + from_pyo3 comprehension": lambda: [
+            TradeTick.from_pyo3(tick) for tick in pyo3_trades(trades_df)
+        ],
+        "trades: pyo3 wrangler + from_pyo3_list": lambda: TradeTick.from_pyo3_list(
+            pyo3_trades(trades_df)
+        ),
+        "trades: fixed-point arrow + from_pyo3_list (use_pyo3=False)": lambda: trades_loader.df_to_ticks(
+            trades_df, SYMBOL_VENUE
+        ),
+        "bars: pyo3 wrangler from_pandas": lambda: pyo3_bars(klines_df),
+        "bars: pyo3 fixed-point arrow (use_pyo3=True)": lambda: klines_loader.df_to_ticks(
+            klines_df, SYMBOL_VENUE, use_pyo3=True
+        ),
+        "bars: pyo3 wrangler + from_pyo3 comprehension": lambda: [
+            Bar.from_pyo3(bar) for bar in pyo3_bars(klines_df)
+        ],
+        "bars: pyo3 wrangler + from_pyo3_list": lambda: Bar.from_pyo3_list(
+            pyo3_bars(klines_df)
+        ),
+        "bars: fixed-point arrow + from_pyo3_list (use_pyo3=False)": lambda: klines_loader.df_to_ticks(
+            klines_df, SYMBOL_VENUE
+        ),
+    }
+
+    results = pd.DataFrame(
+        [
+            {"case": name, "seconds": (seconds := timeit(func, args.repeat))}
+            | {"rows/s": args.rows / seconds}
+            for name, func in cases.items()
+        ]
+    ).set_index("case")
+    print(results.to_string(float_format="{:,.3f}".format))
@@ -0,0 +1,141 @@
+import json
+import platform
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+import nautilus_trader
+
+# Wall time, CPU time and peak RSS per phase of a backtest, written as a JSON report
+# to track regressions across nautilus-trader upgrades
+
+
+def _peak_rss_bytes() -> int:
+    """
+    Peak resident set size of the process, since the last `_reset_peak_rss` on Linux.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _reset_peak_rss() -> bool:
+    """
+    Reset the peak RSS to the current RSS (Linux only), so each phase reports its own peak.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class PhaseProfiler:
+    """
+    Record wall time, CPU time and peak RSS of each `phase`, and optionally
+    a sampling profile of it (pyinstrument if installed, otherwise cProfile).
+
+    >>> profiler = PhaseProfiler()
+    >>> with profiler.phase("engine.run", profile=True):
+    ...     engine.run()
+    >>> profiler.write_json("profile.json")
+    """
+
+    def __init__(self, profile_dir: str | Path | None = None):
+        self.profile_dir = Path(profile_dir) if profile_dir is not None else None
+        self.phases: list[dict] = []
+
+    @contextmanager
+    def phase(self, name: str, profile: bool = False):
+        sampler = self._start_profile() if profile else None
+        per_phase_peak = _reset_peak_rss()
+        rss_before = _peak_rss_bytes()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                "name": name,
+                "wall_seconds": time.perf_counter() - wall_start,
+                "cpu_seconds": time.process_time() - cpu_start,
+                "peak_rss_bytes": _peak_rss_bytes(),
+                "rss_before_bytes": rss_before,
+                # Without a per-phase reset this is the peak of the whole process so far
+                "per_phase_peak": per_phase_peak,
+            }
+            if sampler is not None:
+                record["profile"] = self._stop_profile(sampler, name)
+            self.phases.append(record)
+
+    def _start_profile(self):
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            import cProfile
+
+            sampler = cProfile.Profile()
+            sampler.enable()
+            return sampler
+        sampler = Profiler(interval=0.001)
+        sampler.start()
+        return sampler
+
+    def _stop_profile(self, sampler, name: str) -> str | None:
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            Profiler = None
+        if Profiler is not None and isinstance(sampler, Profiler):
+            sampler.stop()
+            text = sampler.output_text(unicode=False, color=False)
+        else:
+            # NOTE: cProfile is a deterministic profiler, the time spent in Cython/Rust
+            # only shows up under the Python functions calling into it
+            import io
+            import pstats
+
+            sampler.disable()
+            stream = io.StringIO()
+            stats = pstats.Stats(sampler, stream=stream)
+            stats.sort_stats("cumulative").print_stats(40)
+            text = stream.getvalue()
+        if self.profile_dir is None:
+            print(text)
+            return None
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        path = self.profile_dir / f"{name.replace('/', '_')}.txt"
+        path.write_text(text)
+        return str(path)
+
+    def report(self, **info) -> dict:
+        """
+        Machine-readable report of the phases, with the versions they were measured on
+        and any extra `info` (e.g. the number of rows).
+        """
+        return {
+            "nautilus_trader": nautilus_trader.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "info": info,
+            "phases": self.phases,
+            "total_wall_seconds": sum(phase["wall_seconds"] for phase in self.phases),
+            "total_cpu_seconds": sum(phase["cpu_seconds"] for phase in self.phases),
+            "peak_rss_bytes": max(
+                (phase["peak_rss_bytes"] for phase in self.phases), default=0
+            ),
+        }
+
+    def write_json(self, path: str | Path, **info) -> dict:
+        report = self.report(**info)
+        Path(path).write_text(json.dumps(report, indent=2))
+        return report
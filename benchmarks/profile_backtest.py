@@ -0,0 +1,143 @@
+import argparse
+import json
+from nautilus_trader.model import Bar
+from data.binance_loader import BinanceKlineLoader, table_to_ticks
+from data.reports import check_numba_jit, fills_arrays, from_orders_kwargs
+from benchmarks.phase_profiler import PhaseProfiler
+from examples.backtest_eurusd_bar_low_level_api import (
+    add_venue,
+    get_engine,
+    get_fill_model,
+    get_instrument,
+    get_strategy,
+    run_streaming,
+)
+
+# Phase by phase profile of the low-level bar backtest (one day of 1s klines)
+# python -m benchmarks.profile_backtest --output profile.json --profile-run
+# or decoded and run batch by batch in streaming mode (`run_streaming`)
+# python -m benchmarks.profile_backtest --output profile.json --streaming 10000
+
+
+def profile_backtest(
+    profiler: PhaseProfiler,
+    date_str: str = "2025-01-01",
+    base_dir: str | None = None,
+    init_cash: int = 10_000,
+    profile_run: bool = False,
+    vectorbt: bool = True,
+    streaming: int | None = None,
+) -> dict:
+    instrument = get_instrument()
+    symbol = instrument.id.symbol.value
+    loader_kwargs = {"base_dir": base_dir} if base_dir else {}
+    # No cache, so the CSV is decoded every time
+    loader = BinanceKlineLoader("1s", cache_dir=None, **loader_kwargs)
+
+    kwargs = dict(
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+    )
+    if streaming:
+        # Decoding and wrangling happen batch by batch inside the run
+        rows = 0
+
+        def batches():
+            nonlocal rows
+            for batch in loader.iter_date_symbol_ticks(
+                date_str, instrument.id.value, chunksize=streaming, **kwargs
+            ):
+                rows += len(batch)
+                yield batch
+
+    else:
+        with profiler.phase("csv_decode"):
+            df = loader.get_date_symbol(date_str, symbol)
+        with profiler.phase("wrangling"):
+            pyo3_bars = table_to_ticks(
+                loader.df_to_table(df, instrument.id.value, **kwargs), use_pyo3=True
+            )
+        with profiler.phase("pyo3_to_cython"):
+            bars = Bar.from_pyo3_list(pyo3_bars)
+        rows = len(df)
+
+    with profiler.phase("engine_setup"):
+        engine = get_engine(log_level="ERROR")
+        add_venue(engine, instrument, init_cash, get_fill_model())
+        engine.add_instrument(instrument)
+    if not streaming:
+        with profiler.phase("engine.add_data"):
+            engine.add_data(bars)
+    engine.add_strategy(strategy=get_strategy(instrument, strategy_name="ema"))
+    if streaming:
+        with profiler.phase("engine.run (streaming)", profile=profile_run):
+            run_streaming(engine, batches())
+    else:
+        with profiler.phase("engine.run", profile=profile_run):
+            engine.run()
+    with profiler.phase("reports"):
+        engine.trader.generate_account_report(instrument.venue)
+        engine.trader.generate_order_fills_report()
+        engine.trader.generate_positions_report()
+    with profiler.phase("fills_arrays"):
+        # NOTE: read from the cache before it is disposed, one row per fill
+        fills = fills_arrays(engine.cache.orders())
+    result = engine.get_result()
+    engine.dispose()
+
+    if vectorbt:
+        try:
+            import vectorbt as vbt
+        except ImportError:
+            print("vectorbt is not installed, skipping the vectorbt phase")
+        else:
+            with profiler.phase("vectorbt"):
+                # The engine commissions as fixed fees, as in the examples
+                pf = vbt.Portfolio.from_orders(
+                    **from_orders_kwargs(fills), init_cash=init_cash, freq="1s"
+                )
+                pf.stats()
+            check_numba_jit(compiled=True)
+
+    return {
+        "date": date_str,
+        "rows": rows,
+        "total_events": result.total_events,
+        "total_orders": result.total_orders,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Profile the phases of the low-level bar backtest"
+    )
+    parser.add_argument("--date", default="2025-01-01")
+    parser.add_argument("--base-dir", help="download directory of the klines")
+    parser.add_argument("--output", default="profile.json", help="JSON report path")
+    parser.add_argument(
+        "--profile-run",
+        action="store_true",
+        help="profile engine.run (pyinstrument if installed, else cProfile)",
+    )
+    parser.add_argument("--no-vectorbt", action="store_true")
+    parser.add_argument(
+        "--streaming",
+        type=int,
+        metavar="CHUNKSIZE",
+        help="run in streaming mode over batches of CHUNKSIZE bars",
+    )
+    args = parser.parse_args()
+
+    profiler = PhaseProfiler(
+        profile_dir=f"{args.output.removesuffix('.json')}-profiles"
+    )
+    info = profile_backtest(
+        profiler,
+        date_str=args.date,
+        base_dir=args.base_dir,
+        profile_run=args.profile_run,
+        vectorbt=not args.no_vectorbt,
+        streaming=args.streaming,
+    )
+    report = profiler.write_json(args.output, **info)
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,289 @@
+import zipfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Deterministic synthetic daily files in the Binance Public Data layout and CSV format,
+# so the loaders and the examples can be benchmarked offline
+# (same seed and row count => byte-identical zips)
+
+DAY_US = 86_400_000_000
+
+
+def _write_zip(path: Path, df: pd.DataFrame, header: bool = False) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    csv = df.to_csv(header=header, index=False, float_format="%.8f")
+    # A fixed timestamp keeps the archive byte-identical between runs
+    info = zipfile.ZipInfo(f"{path.stem}.csv", date_time=(2025, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(info, csv)
+    return path
+
+
+def _day_start_us(date_str: str) -> int:
+    return int(pd.Timestamp(date_str, tz="UTC").value // 1_000)
+
+
+def _trade_columns(rows: int, date_str: str, seed: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    price = np.round(3300 + np.cumsum(rng.normal(0, 0.05, rows)), 2)
+    quantity = np.round(rng.exponential(0.5, rows) + 0.0001, 4)
+    # Sorted timestamps spread over the day
+    timestamp = _day_start_us(date_str) + np.sort(
+        rng.integers(0, DAY_US, rows, dtype=np.int64)
+    )
+    return {
+        "price": price,
+        "quantity": quantity,
+        "timestamp": timestamp,
+        "buyer_maker": np.where(rng.random(rows) < 0.5, "True", "False"),
+    }
+
+
+def write_aggtrades_zip(
+    base_dir: str | Path, symbol: str, date_str: str, rows: int, seed: int = 42
+) -> Path:
+    columns = _trade_columns(rows, date_str, seed)
+    trade_id = np.arange(rows, dtype=np.int64)
+    df = pd.DataFrame(
+        {
+            "trade_id": trade_id,
+            "price": columns["price"],
+            "quantity": columns["quantity"],
+            "first tradeId": trade_id * 2,
+            "last tradeId": trade_id * 2 + 1,
+            "timestamp": columns["timestamp"],
+            "buyer_maker": columns["buyer_maker"],
+            "was the trade the best price match": "True",
+        }
+    )
+    return _write_zip(
+        Path(base_dir) / symbol / f"{symbol}-aggTrades-{date_str}.zip", df
+    )
+
+
+def write_trades_zip(
+    base_dir: str | Path, symbol: str, date_str: str, rows: int, seed: int = 42
+) -> Path:
+    columns = _trade_columns(rows, date_str, seed)
+    df = pd.DataFrame(
+        {
+            "trade_id": np.arange(rows, dtype=np.int64),
+            "price": columns["price"],
+            "quantity": columns["quantity"],
+            "quoteQty": columns["price"] * columns["quantity"],
+            "timestamp": columns["timestamp"],
+            "buyer_maker": columns["buyer_maker"],
+            "isBestMatch": "True",
+        }
+    )
+    return _write_zip(Path(base_dir) / symbol / f"{symbol}-trades-{date_str}.zip", df)
+
+
+def write_klines_zip(
+    base_dir: str | Path,
+    symbol: str,
+    date_str: str,
+    rows: int = 86_400,
+    freq: str = "1s",
+    seed: int = 42,
+) -> Path:
+    """
+    `rows` consecutive klines of `freq` from the start of the day
+    (86,400 rows of 1s klines is a full day).
+    """
+    rng = np.random.default_rng(seed)
+    step_us = int(pd.Timedelta(freq).value // 1_000)
+    open_time = _day_start_us(date_str) + np.arange(rows, dtype=np.int64) * step_us
+    close = np.round(3300 + np.cumsum(rng.normal(0, 0.5, rows)), 2)
+    open_ = np.round(np.concatenate([[close[0]], close[:-1]]), 2)
+    spread = np.round(np.abs(rng.normal(0, 0.2, (2, rows))), 2)
+    volume = np.round(rng.exponential(2.0, rows), 4)
+    df = pd.DataFrame(
+        {
+            "timestamp": open_time,
+            "open": open_,
+            "high": np.maximum(open_, close) + spread[0],
+            "low": np.minimum(open_, close) - spread[1],
+            "close": close,
+            "volume": volume,
+            "close time": open_time + step_us - 1,
+            "quote asset volume": volume * close,
+            "number of trades": rng.integers(1, 100, rows),
+            "taker buy base asset volume": np.round(volume / 2, 4),
+            "taker buy quote asset volume": np.round(volume / 2, 4) * close,
+            "ignore": 0,
+        }
+    )
+    return _write_zip(
+        Path(base_dir) / symbol / freq / f"{symbol}-{freq}-{date_str}.zip", df
+    )
+
+
+def _book_levels(
+    rows: int, levels: int, seed: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (rows, levels) bid/ask prices around a random walk mid, one tick apart, and sizes.
+    """
+    rng = np.random.default_rng(seed)
+    mid = np.round(3300 + np.cumsum(rng.normal(0, 0.05, rows)), 2)[:, None]
+    offsets = 0.01 * np.arange(levels)
+    bid_prices = np.round(mid - 0.01 - offsets, 2)
+    ask_prices = np.round(mid + 0.01 + offsets, 2)
+    bid_sizes, ask_sizes = np.round(rng.exponential(2.0, (2, rows, levels)) + 0.001, 3)
+    return bid_prices, bid_sizes, ask_prices, ask_sizes
+
+
+def _sorted_timestamps(rows: int, date_str: str, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed + 1)
+    return _day_start_us(date_str) + np.sort(
+        rng.integers(0, DAY_US, rows, dtype=np.int64)
+    )
+
+
+def write_book_ticker_zip(
+    base_dir: str | Path, symbol: str, date_str: str, rows: int, seed: int = 42
+) -> Path:
+    """
+    Futures bookTicker dump (header row, millisecond timestamps).
+    """
+    bid_prices, bid_sizes, ask_prices, ask_sizes = _book_levels(rows, 1, seed)
+    timestamp = _sorted_timestamps(rows, date_str, seed) // 1_000
+    df = pd.DataFrame(
+        {
+            "update_id": np.arange(rows, dtype=np.int64),
+            "best_bid_price": bid_prices[:, 0],
+            "best_bid_qty": bid_sizes[:, 0],
+            "best_ask_price": ask_prices[:, 0],
+            "best_ask_qty": ask_sizes[:, 0],
+            "transaction_time": timestamp,
+            "event_time": timestamp + 1,
+        }
+    )
+    return _write_zip(
+        Path(base_dir) / symbol / f"{symbol}-bookTicker-{date_str}.zip", df, True
+    )
+
+
+def write_book_snapshot_zip(
+    base_dir: str | Path,
+    symbol: str,
+    date_str: str,
+    rows: int,
+    levels: int = 25,
+    seed: int = 42,
+) -> Path:
+    """
+    Recorded top-`levels` snapshots (`book_snapshot_{levels}` layout).
+    """
+    bid_prices, bid_sizes, ask_prices, ask_sizes = _book_levels(rows, levels, seed)
+    timestamp = _sorted_timestamps(rows, date_str, seed)
+    columns = {
+        "exchange": "binance",
+        "symbol": symbol.lower(),
+        "timestamp": timestamp,
+        "local_timestamp": timestamp + 1_000,
+    }
+    for level in range(levels):
+        columns[f"asks[{level}].price"] = ask_prices[:, level]
+        columns[f"asks[{level}].amount"] = ask_sizes[:, level]
+        columns[f"bids[{level}].price"] = bid_prices[:, level]
+        columns[f"bids[{level}].amount"] = bid_sizes[:, level]
+    return _write_zip(
+        Path(base_dir) / symbol / f"{symbol}-bookSnapshot-{date_str}.zip",
+        pd.DataFrame(columns),
+        True,
+    )
+
+
+def write_depth_update_zip(
+    base_dir: str | Path,
+    symbol: str,
+    date_str: str,
+    rows: int,
+    levels: int = 20,
+    seed: int = 42,
+) -> Path:
+    """
+    Recorded incremental L2 updates (`incremental_book_L2` layout): a snapshot of
+    `levels` levels per side, then `rows` level updates of which ~10% remove the level.
+    """
+    rng = np.random.default_rng(seed)
+    bid_prices, bid_sizes, ask_prices, ask_sizes = _book_levels(1, levels, seed)
+    start_us = _day_start_us(date_str)
+    is_bid = rng.random(rows) < 0.5
+    level = rng.integers(0, levels, rows)
+    amount = np.round(rng.exponential(2.0, rows) + 0.001, 3)
+    amount[rng.random(rows) < 0.1] = 0.0
+    # Updates come in events of a few levels sharing the same timestamp
+    timestamp = _sorted_timestamps(rows, date_str, seed)
+    timestamp = timestamp[np.minimum(np.arange(rows) // 4 * 4, rows - 1)]
+    df = pd.DataFrame(
+        {
+            "exchange": "binance",
+            "symbol": symbol.lower(),
+            "timestamp": np.concatenate([np.full(2 * levels, start_us), timestamp]),
+            "local_timestamp": 0,
+            "is_snapshot": np.r_[np.full(2 * levels, "true"), np.full(rows, "false")],
+            "side": np.r_[
+                np.full(levels, "bid"),
+                np.full(levels, "ask"),
+                np.where(is_bid, "bid", "ask"),
+            ],
+            "price": np.concatenate(
+                [
+                    bid_prices[0],
+                    ask_prices[0],
+                    np.where(is_bid, bid_prices[0][level], ask_prices[0][level]),
+                ]
+            ),
+            "amount": np.concatenate([bid_sizes[0], ask_sizes[0], amount]),
+        }
+    )
+    df["local_timestamp"] = df["timestamp"] + 1_000
+    return _write_zip(
+        Path(base_dir) / symbol / f"{symbol}-depthUpdate-{date_str}.zip", df, True
+    )
+
+
+def write_dataset(
+    data_dir: str | Path,
+    symbol: str = "ETHUSDT",
+    date_str: str = "2025-01-01",
+    trade_rows: int = 1_000_000,
+    kline_rows: int = 86_400,
+    book_rows: int = 0,
+    seed: int = 42,
+) -> dict[str, Path]:
+    """
+    Write one day of aggTrades, trades and 1s klines (and of bookTicker, bookSnapshot
+    and depthUpdate if `book_rows`) under `data_dir/{dataset}`, the base directories
+    of the loaders.
+    """
+    data_dir = Path(data_dir)
+    paths = {
+        "aggTrades": write_aggtrades_zip(
+            data_dir / "aggTrades", symbol, date_str, trade_rows, seed
+        ),
+        "trades": write_trades_zip(
+            data_dir / "trades", symbol, date_str, trade_rows, seed
+        ),
+        "klines": write_klines_zip(
+            data_dir / "klines", symbol, date_str, kline_rows, "1s", seed
+        ),
+    }
+    if book_rows:
+        paths |= {
+            "bookTicker": write_book_ticker_zip(
+                data_dir / "bookTicker", symbol, date_str, book_rows, seed
+            ),
+            "bookSnapshot": write_book_snapshot_zip(
+                data_dir / "bookSnapshot", symbol, date_str, book_rows, seed=seed
+            ),
+            "depthUpdate": write_depth_update_zip(
+                data_dir / "depthUpdate", symbol, date_str, book_rows, seed=seed
+            ),
+        }
+    return paths
@@ -1,19 +1,51 @@
-from typing import Literal
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator, Literal
+import argparse
+import inspect
+import json
+import os
+import sys
+import tempfile
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 from pathlib import Path
-from nautilus_trader.persistence.wranglers_v2 import (
-    TradeTickDataWranglerV2,
-    BarDataWranglerV2,
-)
-from nautilus_trader.core.nautilus_pyo3 import (
-    TradeTick as TradeTickV2,
-    Bar as BarV2,
-)
-from nautilus_trader.model import TradeTick, Bar
+from nautilus_trader.core.nautilus_pyo3 import convert_to_snake_case
+
+# NOTE: the same enums as `nautilus_trader.model.enums`, without loading the whole
+# `nautilus_trader.model` package (about a second), which only `table_to_ticks` needs
+# so that the CLI ingestion (DataFrame -> Arrow -> Parquet) starts fast
+from nautilus_trader.core.rust.model import BookAction, OrderSide, RecordFlag
+
+if TYPE_CHECKING:
+    from nautilus_trader.core.nautilus_pyo3 import (
+        TradeTick as TradeTickV2,
+        Bar as BarV2,
+        QuoteTick as QuoteTickV2,
+        OrderBookDelta as OrderBookDeltaV2,
+    )
+    from nautilus_trader.model import (
+        TradeTick,
+        Bar,
+        QuoteTick,
+        OrderBookDelta,
+        OrderBookDepth10,
+    )
 import numpy as np
+from data.fixed_point import to_raw
 
 # from nautilus_trader.persistence.wranglers import BarDataWrangler, TradeTickDataWrangler, QuoteTickDataWrangler
 
+# Shared memory is a tmpfs on Linux, elsewhere fall back to the temp directory
+SHARED_DIR = Path("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir())
+
+ENGINE_TYPE = Literal["c", "pyarrow"]
+
 FREQ_TYPE = Literal[
     "1s",
     "1m",
@@ -34,6 +66,338 @@ FREQ_TYPE = Literal[
 ]
 
 
+def _open_csv(path: Path):
+    """
+    Open the CSV as a binary file object (Binance zips hold a single CSV member).
+    """
+    if path.suffix != ".zip":
+        return open(path, "rb")
+    zf = zipfile.ZipFile(path)
+    return zf.open(zf.namelist()[0])
+
+
+def _rebatch(reader: pa.RecordBatchReader, chunksize: int) -> Iterator[pa.Table]:
+    """
+    Regroup the record batches of a streaming reader into tables of `chunksize` rows
+    (the last one may be shorter).
+    """
+    batches = []
+    num_rows = 0
+    for batch in reader:
+        batches.append(batch)
+        num_rows += batch.num_rows
+        while num_rows >= chunksize:
+            table = pa.Table.from_batches(batches)
+            yield table.slice(0, chunksize)
+            rest = table.slice(chunksize)
+            batches = rest.to_batches()
+            num_rows = rest.num_rows
+    if num_rows:
+        yield pa.Table.from_batches(batches)
+
+
+def _to_unix_nanos(timestamps: pd.Series) -> np.ndarray:
+    return timestamps.to_numpy("datetime64[ns]").view(np.uint64)
+
+
+def _with_catalog_schema(table: pa.Table, metadata: dict[str, str]) -> pa.Table:
+    """
+    Attach the non-nullable fields and schema metadata written by `ParquetDataCatalog`.
+    """
+    schema = pa.schema(
+        [field.with_nullable(False) for field in table.schema], metadata=metadata
+    )
+    return pa.Table.from_arrays(table.columns, schema=schema)
+
+
+def _trade_df_to_arrow(
+    trade_df: pd.DataFrame,
+    instrument_id: str,
+    ts_init_delta: int,
+    price_precision: int,
+    size_precision: int,
+) -> pa.Table:
+    """
+    Build the Arrow table of `TradeTick` (as expected by `TradeTickDataWranglerV2.from_arrow`
+    and stored by `ParquetDataCatalog`), with exact fixed-point prices/sizes
+    (instead of the per-row conversion of `from_pandas`).
+    """
+    ts_events = _to_unix_nanos(trade_df["timestamp"])
+    table = pa.table(
+        {
+            "price": to_raw(trade_df["price"].to_numpy(), price_precision),
+            "size": to_raw(trade_df["quantity"].to_numpy(), size_precision),
+            # NOTE: same mapping as TradeTickDataWranglerV2 (buyer_maker => AggressorSide.BUYER)
+            "aggressor_side": np.where(trade_df["buyer_maker"].to_numpy(), 1, 2).astype(
+                np.uint8
+            ),
+            "trade_id": pa.array(trade_df["trade_id"].to_numpy()).cast(pa.string()),
+            "ts_event": ts_events,
+            "ts_init": ts_events + np.uint64(ts_init_delta),
+        }
+    )
+    return _with_catalog_schema(
+        table,
+        {
+            "instrument_id": instrument_id,
+            "price_precision": str(price_precision),
+            "size_precision": str(size_precision),
+        },
+    )
+
+
+def _ohlcv_df_to_arrow(
+    ohlcv_df: pd.DataFrame,
+    bar_type: str,
+    ts_init_delta: int,
+    price_precision: int,
+    size_precision: int,
+) -> pa.Table:
+    """
+    Build the Arrow table of `Bar` (as expected by `BarDataWranglerV2.from_arrow`
+    and stored by `ParquetDataCatalog`).
+    NOTE: volume is converted with `size_precision` (instead of the former float `* 1e9` to UInt64)
+    """
+    ts_events = _to_unix_nanos(ohlcv_df["timestamp"])
+    table = pa.table(
+        {
+            "open": to_raw(ohlcv_df["open"].to_numpy(), price_precision),
+            "high": to_raw(ohlcv_df["high"].to_numpy(), price_precision),
+            "low": to_raw(ohlcv_df["low"].to_numpy(), price_precision),
+            "close": to_raw(ohlcv_df["close"].to_numpy(), price_precision),
+            "volume": to_raw(ohlcv_df["volume"].to_numpy(), size_precision),
+            "ts_event": ts_events,
+            "ts_init": ts_events + np.uint64(ts_init_delta),
+        }
+    )
+    return _with_catalog_schema(
+        table,
+        {
+            "bar_type": bar_type,
+            "instrument_id": bar_type.split("-")[0],
+            "price_precision": str(price_precision),
+            "size_precision": str(size_precision),
+        },
+    )
+
+
+def _quote_df_to_arrow(
+    quote_df: pd.DataFrame,
+    instrument_id: str,
+    ts_init_delta: int,
+    price_precision: int,
+    size_precision: int,
+) -> pa.Table:
+    """
+    Build the Arrow table of `QuoteTick` from best bid/ask columns.
+    """
+    ts_events = _to_unix_nanos(quote_df["transaction_time"])
+    table = pa.table(
+        {
+            "bid_price": to_raw(quote_df["best_bid_price"].to_numpy(), price_precision),
+            "ask_price": to_raw(quote_df["best_ask_price"].to_numpy(), price_precision),
+            "bid_size": to_raw(quote_df["best_bid_qty"].to_numpy(), size_precision),
+            "ask_size": to_raw(quote_df["best_ask_qty"].to_numpy(), size_precision),
+            "ts_event": ts_events,
+            "ts_init": ts_events + np.uint64(ts_init_delta),
+        }
+    )
+    return _with_catalog_schema(
+        table,
+        {
+            "instrument_id": instrument_id,
+            "price_precision": str(price_precision),
+            "size_precision": str(size_precision),
+        },
+    )
+
+
+def _snapshot_df_to_arrow(
+    snapshot_df: pd.DataFrame,
+    instrument_id: str,
+    ts_init_delta: int,
+    price_precision: int,
+    size_precision: int,
+    sequence_start: int = 0,
+) -> pa.Table:
+    """
+    Build the Arrow table of `OrderBookDepth10` from the `bids[i]`/`asks[i]` columns
+    of top-of-book snapshots, numbered from `sequence_start` (the number of snapshots
+    of the previous chunks when streaming).
+    """
+    # NOTE: imported here as data.order_book depends on this module
+    from data.order_book import DEPTH, depth10_table
+
+    levels = {}
+    for side in ("bids", "asks"):
+        prices = snapshot_df[[f"{side}[{i}].price" for i in range(DEPTH)]]
+        sizes = snapshot_df[[f"{side}[{i}].amount" for i in range(DEPTH)]]
+        # Missing levels (thin books) repeat the last price with a zero size
+        levels[side] = (
+            prices.ffill(axis=1).fillna(0.0).to_numpy(np.float64),
+            sizes.fillna(0.0).to_numpy(np.float64),
+        )
+    ts_events = _to_unix_nanos(snapshot_df["timestamp"])
+    return depth10_table(
+        instrument_id,
+        bid_prices=levels["bids"][0],
+        bid_sizes=levels["bids"][1],
+        ask_prices=levels["asks"][0],
+        ask_sizes=levels["asks"][1],
+        ts_event=ts_events,
+        ts_init=ts_events + np.uint64(ts_init_delta),
+        price_precision=price_precision,
+        size_precision=size_precision,
+        sequence=np.arange(
+            sequence_start, sequence_start + len(ts_events), dtype=np.uint64
+        ),
+    )
+
+
+def _delta_df_to_arrow(
+    delta_df: pd.DataFrame,
+    instrument_id: str,
+    ts_init_delta: int,
+    price_precision: int,
+    size_precision: int,
+    continues_snapshot: bool = False,
+    next_ts_event: int | None = None,
+    sequence_start: int = 0,
+) -> pa.Table:
+    """
+    Build the Arrow table of `OrderBookDelta` from incremental L2 level updates
+    (one row per price level, a zero amount removes the level).
+
+    Snapshot rows become ADDs after a CLEAR of the book, the other rows UPDATEs or DELETEs.
+    The last delta of each event (rows sharing a timestamp) is flagged `F_LAST`, so the
+    book is only published once the whole event is applied.
+
+    For a chunk of a streamed day, the state at its boundaries: `continues_snapshot` if
+    the previous chunk ended in snapshot rows (no CLEAR before the first rows),
+    `next_ts_event` of the first row of the next chunk (None for the last chunk) and
+    `sequence_start` the number of deltas of the previous chunks.
+    """
+    is_snapshot = delta_df["is_snapshot"].to_numpy(bool)
+    amount = delta_df["amount"].to_numpy(np.float64)
+    action = np.where(
+        is_snapshot,
+        BookAction.ADD,
+        np.where(amount == 0, BookAction.DELETE, BookAction.UPDATE),
+    ).astype(np.uint8)
+    side = np.where(
+        delta_df["side"].to_numpy() == "bid", OrderSide.BUY, OrderSide.SELL
+    ).astype(np.uint8)
+    flags = np.where(is_snapshot, RecordFlag.F_SNAPSHOT, 0).astype(np.uint8)
+    price = delta_df["price"].to_numpy(np.float64)
+    ts_events = _to_unix_nanos(delta_df["timestamp"])
+
+    # A CLEAR opens each block of snapshot rows (but not its continuation in this chunk)
+    starts = np.flatnonzero(
+        is_snapshot & ~np.append(continues_snapshot, is_snapshot[:-1])
+    )
+    action = np.insert(action, starts, BookAction.CLEAR)
+    side = np.insert(side, starts, OrderSide.NO_ORDER_SIDE)
+    flags = np.insert(flags, starts, RecordFlag.F_SNAPSHOT)
+    price = np.insert(price, starts, 0.0)
+    amount = np.insert(amount, starts, 0.0)
+    ts_events = np.insert(ts_events, starts, ts_events[starts])
+
+    # The event of the last row may go on in the next chunk
+    is_last = np.append(
+        ts_events[1:] != ts_events[:-1],
+        next_ts_event is None or ts_events[-1] != next_ts_event,
+    )
+    flags |= np.where(is_last, RecordFlag.F_LAST, 0).astype(np.uint8)
+    table = pa.table(
+        {
+            "action": action,
+            "side": side,
+            "price": to_raw(price, price_precision),
+            "size": to_raw(amount, size_precision),
+            "order_id": np.zeros(len(action), dtype=np.uint64),
+            "flags": flags,
+            "sequence": np.arange(
+                sequence_start, sequence_start + len(action), dtype=np.uint64
+            ),
+            "ts_event": ts_events,
+            "ts_init": ts_events + np.uint64(ts_init_delta),
+        }
+    )
+    return _with_catalog_schema(
+        table,
+        {
+            "instrument_id": instrument_id,
+            "price_precision": str(price_precision),
+            "size_precision": str(size_precision),
+        },
+    )
+
+
+def table_to_ticks(
+    table: pa.Table, use_pyo3: bool = False
+) -> (
+    list[TradeTick | TradeTickV2]
+    | list[Bar | BarV2]
+    | list[QuoteTick | QuoteTickV2]
+    | list[OrderBookDelta | OrderBookDeltaV2]
+    | list[OrderBookDepth10]
+):
+    """
+    Convert an Arrow table of `df_to_table` (or a catalog file of `ingest_to_catalog`)
+    into ticks, the wrangler is set up from the schema metadata and column names.
+
+    NOTE: there is no `OrderBookDepth10` wrangler, depths are decoded by the Rust
+    backend of the catalog and always returned as legacy objects
+    """
+    from nautilus_trader.model import Bar, OrderBookDelta, QuoteTick, TradeTick
+    from nautilus_trader.persistence.wranglers_v2 import (
+        BarDataWranglerV2,
+        OrderBookDeltaDataWranglerV2,
+        QuoteTickDataWranglerV2,
+        TradeTickDataWranglerV2,
+    )
+
+    metadata = table.schema.metadata
+    price_precision = int(metadata[b"price_precision"])
+    size_precision = int(metadata[b"size_precision"])
+    if b"bar_type" in metadata:
+        wrangler = BarDataWranglerV2(
+            bar_type=metadata[b"bar_type"].decode(),
+            price_precision=price_precision,
+            size_precision=size_precision,
+        )
+        to_legacy = Bar.from_pyo3_list
+    elif "bid_price_0" in table.column_names:
+        from data.order_book import decode_table
+        from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
+
+        return decode_table(table, NautilusDataType.OrderBookDepth10)
+    else:
+        # The first column tells the data type apart
+        wrangler_cls, to_legacy = {
+            "action": (OrderBookDeltaDataWranglerV2, OrderBookDelta.from_pyo3_list),
+            "bid_price": (QuoteTickDataWranglerV2, QuoteTick.from_pyo3_list),
+            "price": (TradeTickDataWranglerV2, TradeTick.from_pyo3_list),
+        }[table.column_names[0]]
+        wrangler = wrangler_cls(
+            instrument_id=metadata[b"instrument_id"].decode(),
+            price_precision=price_precision,
+            size_precision=size_precision,
+        )
+    ticks = wrangler.from_arrow(table)
+    if use_pyo3:
+        return ticks
+    # Converting the whole list in one Cython call
+    return to_legacy(ticks)
+
+
+def attach_table(path: str | Path) -> pa.Table:
+    """
+    Zero-copy view of a table published by `BaseLoader.publish_date_symbol`.
+    """
+    return feather.read_table(path, memory_map=True)
+
+
 class BaseLoader:
     """
     A base class to define the common structure for data loaders.
@@ -45,28 +409,345 @@ class BaseLoader:
     These pyo3 provided data objects are not compatible where the legacy Cython objects are currently used (adding directly to a BacktestEngine etc).
     """
 
-    def __init__(self, base_dir: str):
+    # Name of the Binance dataset, used to lay out the cache directory
+    dataset: str = ""
+    # Name of the Nautilus data type produced by the loader (e.g. "TradeTick")
+    data_type: str = ""
+    # CSV column names, the dtype of each column and the columns parsed by default
+    # (intended to be overridden by child classes)
+    header: list[str] = []
+    dtypes: dict[str, str] = {}
+    usecols: list[str] = []
+    # Epoch integer columns (in `time_unit`) converted to datetime
+    date_columns: list[str] = []
+    time_unit: str = "us"
+    # Files starting with a header row are read by column name (so they may hold more columns)
+    has_header: bool = False
+
+    def __init__(
+        self,
+        base_dir: str,
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
+    ):
         # Store the base directory (by default using Path)
         self.base_dir = Path(base_dir)
+        # Decoded daily files are cached here (caching is disabled when None)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # "pyarrow" uses the multithreaded pyarrow CSV reader, "c" the pandas C engine
+        self.engine = engine
+        # Columns that are not listed here are never materialized
+        if usecols is not None:
+            self.usecols = [col for col in self.header if col in usecols]
 
-    @staticmethod
-    def _load_single(path: str | Path, parse_date: bool = True) -> pd.DataFrame:
+    def _load_single(self, path: str | Path, parse_date: bool = True) -> pd.DataFrame:
         """
-        Method intended to be overridden by child classes.
-        Reads and returns a DataFrame.
+        Reads a single CSV (possibly zipped) into a DataFrame with the loader `dtypes`,
+        only parsing the `usecols` columns.
+        Time columns are parsed as datetime (in `time_unit`) if `parse_date`.
+        """
+        path = Path(path)
+        if self.engine == "pyarrow":
+            with _open_csv(path) as f:
+                table = pa_csv.read_csv(
+                    f,
+                    read_options=self._read_options(),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={
+                            col: pa.from_numpy_dtype(np.dtype(self.dtypes[col]))
+                            for col in self.usecols
+                        },
+                        include_columns=self.usecols,
+                    ),
+                )
+            df = table.to_pandas()
+        else:
+            df = pd.read_csv(
+                path,
+                header=0 if self.has_header else None,
+                names=None if self.has_header else self.header,
+                usecols=self.usecols,
+                dtype={col: self.dtypes[col] for col in self.usecols},
+                engine="c",
+            )
+        if parse_date:
+            self._parse_date(df)
+        return df
+
+    def _read_options(self) -> pa_csv.ReadOptions:
+        if self.has_header:
+            return pa_csv.ReadOptions()
+        return pa_csv.ReadOptions(column_names=self.header)
+
+    def _parse_date(self, df: pd.DataFrame) -> pd.DataFrame:
+        for col in self.date_columns:
+            if col in df:
+                df[col] = pd.to_datetime(df[col], unit=self.time_unit)
+        return df
+
+    def _iter_single(self, path: str | Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Same as `_load_single` but reads the CSV incrementally, yielding DataFrames of
+        at most `chunksize` rows, so only one chunk is decoded in memory at a time.
+        """
+        path = Path(path)
+        if self.engine == "pyarrow":
+            with _open_csv(path) as f:
+                reader = pa_csv.open_csv(
+                    f,
+                    read_options=self._read_options(),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={
+                            col: pa.from_numpy_dtype(np.dtype(self.dtypes[col]))
+                            for col in self.usecols
+                        },
+                        include_columns=self.usecols,
+                    ),
+                )
+                for table in _rebatch(reader, chunksize):
+                    yield self._parse_date(table.to_pandas())
+        else:
+            with pd.read_csv(
+                path,
+                header=0 if self.has_header else None,
+                names=None if self.has_header else self.header,
+                usecols=self.usecols,
+                dtype={col: self.dtypes[col] for col in self.usecols},
+                engine="c",
+                chunksize=chunksize,
+            ) as reader:
+                for df in reader:
+                    yield self._parse_date(df)
+
+    def get_path(self, date_str: str, symbol: str) -> Path:
+        """
+        Given the date and symbol, return the path of the (zipped) CSV file.
+        This is also intended to be overridden by child classes.
         """
         raise NotImplementedError(
-            "Please implement the `_load_single` method in your loader subclass."
+            "Please implement the `get_path` method in your loader subclass."
+        )
+
+    def get_cache_path(self, path: str | Path) -> Path:
+        """
+        Cache file of a source file, keyed by (dataset, symbol, freq, date) through the
+        file name and by the source file mtime/size, so re-downloaded files are re-decoded.
+        """
+        path = Path(path)
+        stat = path.stat()
+        # Loaders parsing different columns must not share the cached files
+        columns_key = f"{zlib.crc32(','.join(self.usecols).encode()):08x}"
+        return (
+            self.cache_dir
+            / self.dataset
+            / path.parent.relative_to(self.base_dir)
+            / f"{path.stem}-{columns_key}-{stat.st_mtime_ns}-{stat.st_size}.arrow"
         )
 
+    def _load(self, path: str | Path) -> pd.DataFrame:
+        """
+        Load through the on-disk cache (if enabled).
+
+        The normalized DataFrame is stored as an uncompressed Arrow IPC (Feather v2) file,
+        so cache hits are memory-mapped instead of parsing the CSV again.
+        """
+        if self.cache_dir is None:
+            return self._load_single(path)
+
+        cache_path = self.get_cache_path(path)
+        if cache_path.exists():
+            return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+        df = self._load_single(path)
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so that concurrent workers never see a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        feather.write_feather(df, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+        # Drop entries of older versions of the same source file
+        stale_pattern = cache_path.name.rsplit("-", 2)[0] + "-*.arrow"
+        for stale_path in cache_path.parent.glob(stale_pattern):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
+        return df
+
     def get_date_symbol(self, date_str: str, symbol: str) -> pd.DataFrame:
         """
-        Given the date, symbol, and frequency, load the DataFrame.
-        This is also intended to be overridden by child classes.
+        Given the date and symbol, load the DataFrame.
+        """
+        return self._load(self.get_path(date_str, symbol))
+
+    def iter_date_symbol(
+        self, date_str: str, symbol: str, chunksize: int = 1_000_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Given the date and symbol, yield the DataFrame in chunks of at most `chunksize` rows.
+        Cached files are sliced out of the memory-mapped cache instead of being decoded.
+        """
+        path = self.get_path(date_str, symbol)
+        if self.cache_dir is not None and (
+            (cache_path := self.get_cache_path(path)).exists()
+        ):
+            table = feather.read_table(cache_path, memory_map=True)
+            for offset in range(0, table.num_rows, chunksize):
+                yield table.slice(offset, chunksize).to_pandas()
+        else:
+            yield from self._iter_single(path, chunksize)
+
+    def df_to_table(self, df: pd.DataFrame, symbol_venue: str, **kwargs) -> pa.Table:
+        """
+        Convert a DataFrame returned by `get_date_symbol` into the Arrow table of `data_type`,
+        using the same schema as the `ParquetDataCatalog`.
+        This is intended to be overridden by child classes.
         """
         raise NotImplementedError(
-            "Please implement the `get_date_symbol` method in your loader subclass."
+            "Please implement the `df_to_table` method in your loader subclass."
+        )
+
+    def df_to_ticks(self, df: pd.DataFrame, symbol_venue: str, **kwargs) -> list:
+        """
+        Convert a DataFrame returned by `get_date_symbol` into Nautilus objects.
+        This is intended to be overridden by child classes.
+        """
+        raise NotImplementedError(
+            "Please implement the `df_to_ticks` method in your loader subclass."
+        )
+
+    def get_catalog_id(self, symbol_venue: str, **kwargs) -> str:
+        """
+        The instrument ID (or bar type) the data is stored under in the catalog.
+        """
+        return symbol_venue
+
+    def get_date_symbol_ticks(self, date_str: str, symbol_venue: str, **kwargs) -> list:
+        """
+        Load a whole day as Nautilus objects, see `df_to_ticks` of the loader for `kwargs`.
+        """
+        symbol, venue = symbol_venue.split(".")
+        return self.df_to_ticks(
+            self.get_date_symbol(date_str=date_str, symbol=symbol),
+            symbol_venue,
+            **kwargs,
+        )
+
+    def publish_date_symbol(
+        self,
+        date_str: str,
+        symbol_venue: str,
+        shared_dir: str | Path | None = None,
+        **kwargs,
+    ) -> Path:
+        """
+        Decode a day once and publish its engine-ready Arrow table (see `df_to_table` of
+        the loader for `kwargs`) as an uncompressed Arrow IPC file under `shared_dir`
+        (`/dev/shm` by default, i.e. shared memory on Linux).
+
+        Other processes `attach_table` the returned path zero-copy and build the engine
+        data with `table_to_ticks`, instead of each re-reading and re-converting the zip.
+        Publishing a day which is already published only returns its path.
+        Remove the file once the workers are done with it.
+        """
+        symbol, venue = symbol_venue.split(".")
+        path = self.get_path(date_str, symbol)
+        stat = path.stat()
+        key = zlib.crc32(
+            f"{self.get_catalog_id(symbol_venue, **kwargs)}{sorted(kwargs.items())}"
+            f"{stat.st_mtime_ns}{stat.st_size}".encode()
+        )
+        shared_path = (
+            Path(shared_dir or SHARED_DIR)
+            / self.dataset
+            / f"{path.stem}-{key:08x}.arrow"
         )
+        if shared_path.exists():
+            return shared_path
+
+        table = self.df_to_table(self._load(path), symbol_venue, **kwargs)
+        shared_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so that attaching processes never see a partial file
+        tmp_path = shared_path.with_suffix(f".{os.getpid()}.tmp")
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, shared_path)
+        return shared_path
+
+    def iter_date_symbol_ticks(
+        self,
+        date_str: str,
+        symbol_venue: str,
+        chunksize: int = 1_000_000,
+        **kwargs,
+    ) -> Iterator[list]:
+        """
+        Streaming version of `get_date_symbol_ticks`, yielding time-ordered batches
+        of at most `chunksize` Nautilus objects.
+        Only one batch (and its DataFrame chunk) is alive at a time, so memory use is
+        bounded by `chunksize` instead of the size of the day.
+        """
+        symbol, venue = symbol_venue.split(".")
+        for df in self.iter_date_symbol(date_str, symbol, chunksize=chunksize):
+            yield self.df_to_ticks(df, symbol_venue, **kwargs)
+
+    def iter_range_ticks(
+        self,
+        start: str,
+        end: str,
+        symbol_venue: str,
+        chunksize: int = 1_000_000,
+        **kwargs,
+    ) -> Iterator[list]:
+        """
+        Streaming over every day from `start` to `end` (both inclusive), in time order.
+        """
+        for date_str in pd.date_range(start, end, freq="D").strftime("%Y-%m-%d"):
+            yield from self.iter_date_symbol_ticks(
+                date_str, symbol_venue, chunksize=chunksize, **kwargs
+            )
+
+    def get_range(
+        self,
+        start: str,
+        end: str,
+        symbols: str | list[str],
+        max_workers: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Load every daily file of `symbols` from `start` to `end` (both inclusive)
+        and return them as a single DataFrame ordered by time.
+
+        The files are decoded in parallel over a process pool (one file per task),
+        use `max_workers=1` to load them serially in the current process.
+        A categorical `symbol` column is added to tell the symbols apart.
+
+        NOTE: a process pool needs the caller to be guarded by `if __name__ == "__main__":`
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        dates = pd.date_range(start, end, freq="D").strftime("%Y-%m-%d")
+        tasks = [(date_str, symbol) for date_str in dates for symbol in symbols]
+        paths = [self.get_path(date_str, symbol) for date_str, symbol in tasks]
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        if max_workers <= 1:
+            frames = [self._load(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                frames = list(executor.map(self._load, paths))
+
+        df = pd.concat(frames, ignore_index=True)
+        df["symbol"] = pd.Categorical.from_codes(
+            np.repeat(
+                [symbols.index(symbol) for _, symbol in tasks],
+                [len(frame) for frame in frames],
+            ),
+            categories=symbols,
+        )
+        if len(symbols) == 1:
+            # Daily files are already in time order
+            return df
+        # Stable sort keeps the symbol order for rows sharing the same timestamp
+        return df.sort_values(self.date_columns[0], kind="stable", ignore_index=True)
 
 
 class BinanceAggTradesLoader(BaseLoader):
@@ -80,49 +761,62 @@ class BinanceAggTradesLoader(BaseLoader):
         "buyer_maker",
         "was the trade the best price match",
     ]
+    dtypes = {
+        "trade_id": "int64",
+        "price": "float64",
+        "quantity": "float64",
+        "first tradeId": "int64",
+        "last tradeId": "int64",
+        "timestamp": "int64",
+        "buyer_maker": "bool",
+        "was the trade the best price match": "bool",
+    }
+    usecols = header[:-1]
     date_columns = ["timestamp"]
+    dataset = "aggTrades"
+    data_type = "TradeTick"
 
     def __init__(
         self,
         base_dir: str = "submodules/binance-public-data/python/data/spot/daily/aggTrades",
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
     ):
-        super().__init__(base_dir=base_dir)
+        super().__init__(
+            base_dir=base_dir, cache_dir=cache_dir, engine=engine, usecols=usecols
+        )
 
-    @staticmethod
-    def _load_single(path: str | Path, parse_date: bool = True) -> pd.DataFrame:
-        df = pd.read_csv(path, header=None, names=BinanceAggTradesLoader.header)
-        if parse_date:
-            for col in BinanceAggTradesLoader.date_columns:
-                df[col] = pd.to_datetime(df[col], unit="us")
-        return df
+    def get_path(self, date_str: str, symbol: str) -> Path:
+        return self.base_dir / symbol / f"{symbol}-aggTrades-{date_str}.zip"
 
-    def get_date_symbol(self, date_str: str, symbol: str) -> pd.DataFrame:
-        return self._load_single(
-            self.base_dir / symbol / f"{symbol}-aggTrades-{date_str}.zip"
+    def df_to_table(
+        self,
+        trade_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        price_precision: int = 2,
+        size_precision: int = 5,
+    ) -> pa.Table:
+        return _trade_df_to_arrow(
+            trade_df, symbol_venue, ts_init_delta, price_precision, size_precision
         )
 
-    def get_date_symbol_ticks(
+    def df_to_ticks(
         self,
-        date_str: str,
+        trade_df: pd.DataFrame,
         symbol_venue: str,
         ts_init_delta: int = 0,
         use_pyo3: bool = False,
         price_precision: int = 2,
         size_precision: int = 5,
     ) -> list[TradeTick | TradeTickV2]:
-        symbol, venue = symbol_venue.split(".")
-        trade_df = self.get_date_symbol(date_str=date_str, symbol=symbol)
-        trade_df["ts_recv"] = trade_df[
-            "timestamp"
-        ]  # TODO: maybe add simulate_recv_latency_us
-        ticks = TradeTickDataWranglerV2(
-            instrument_id=symbol_venue,
-            price_precision=price_precision,
-            size_precision=size_precision,
-        ).from_pandas(trade_df, ts_init_delta=ts_init_delta)
-        if use_pyo3:
-            return ticks
-        return [TradeTick.from_pyo3(tick) for tick in ticks]
+        return table_to_ticks(
+            self.df_to_table(
+                trade_df, symbol_venue, ts_init_delta, price_precision, size_precision
+            ),
+            use_pyo3,
+        )
 
 
 class BinanceKlineLoader(BaseLoader):
@@ -140,40 +834,83 @@ class BinanceKlineLoader(BaseLoader):
         "taker buy quote asset volume",
         "ignore",
     ]
+    dtypes = {
+        "timestamp": "int64",
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "volume": "float64",
+        "close time": "int64",
+        "quote asset volume": "float64",
+        "number of trades": "int64",
+        "taker buy base asset volume": "float64",
+        "taker buy quote asset volume": "float64",
+        "ignore": "int64",
+    }
+    usecols = header[:-1]
     date_columns = ["timestamp", "close time"]
+    dataset = "klines"
+    data_type = "Bar"
 
     def __init__(
         self,
         freq: FREQ_TYPE = "1s",
         base_dir: str = "submodules/binance-public-data/python/data/spot/daily/klines",
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
     ):
         self.freq = freq
-        super().__init__(base_dir=base_dir)
+        super().__init__(
+            base_dir=base_dir, cache_dir=cache_dir, engine=engine, usecols=usecols
+        )
 
-    @staticmethod
-    def _load_single(path: str | Path, parse_date: bool = True) -> pd.DataFrame:
+    def get_path(self, date_str: str, symbol: str) -> Path:
         """
-        Reads a single kline CSV (possibly compressed), returning a DataFrame
-        with time columns parsed as datetime (microseconds).
-        """
-        df = pd.read_csv(path, header=None, names=BinanceKlineLoader.header)
-        if parse_date:
-            for col in BinanceKlineLoader.date_columns:
-                df[col] = pd.to_datetime(df[col], unit="us")
-        return df
-
-    def get_date_symbol(self, date_str: str, symbol: str) -> pd.DataFrame:
+        Builds the file path from the base directory, symbol, freq, and date.
         """
-        Builds the file path from the base directory, symbol, freq, and date,
-        then loads the file using `_load_single`.
-        """
-        return self._load_single(
+        return (
             self.base_dir / symbol / self.freq / f"{symbol}-{self.freq}-{date_str}.zip"
         )
 
-    def get_date_symbol_ticks(
+    @staticmethod
+    def get_bar_type(
+        symbol_venue: str, target_freq: str = "1-SECOND", need_agg: bool = False
+    ) -> str:
+        # TODO: able to use different aggregation rules
+        return f"{symbol_venue}-{target_freq}-LAST-{'EXTERNAL' if not need_agg else 'INTERNAL'}"
+
+    def get_catalog_id(
         self,
-        date_str: str,
+        symbol_venue: str,
+        target_freq: str = "1-SECOND",
+        need_agg: bool = False,
+        **kwargs,
+    ) -> str:
+        return self.get_bar_type(symbol_venue, target_freq, need_agg)
+
+    def df_to_table(
+        self,
+        ohlcv_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        target_freq: str = "1-SECOND",
+        need_agg: bool = False,
+        price_precision: int = 2,
+        size_precision: int = 5,
+    ) -> pa.Table:
+        return _ohlcv_df_to_arrow(
+            ohlcv_df,
+            self.get_bar_type(symbol_venue, target_freq, need_agg),
+            ts_init_delta,
+            price_precision,
+            size_precision,
+        )
+
+    def df_to_ticks(
+        self,
+        ohlcv_df: pd.DataFrame,
         symbol_venue: str,
         ts_init_delta: int = 0,
         use_pyo3: bool = False,
@@ -194,22 +931,18 @@ class BinanceKlineLoader(BaseLoader):
         QuoteTickDataWrangler.process_bar_data()
         => Bar.is_single_price() == False
         """
-        symbol, venue = symbol_venue.split(".")
-        ohlcv_df = self.get_date_symbol(date_str=date_str, symbol=symbol)
-        ohlcv_df["ts_recv"] = ohlcv_df[
-            "timestamp"
-        ]  # TODO: maybe add simulate_recv_latency_us
-        # ValueError: Invalid column type `volume` at index 4: expected UInt64, found Float64
-        ohlcv_df["volume"] = (ohlcv_df["volume"] * 1e9).astype(np.uint64)
-        # TODO: able to use different aggregation rules
-        ticks = BarDataWranglerV2(
-            bar_type=f"{symbol_venue}-{target_freq}-LAST-{'EXTERNAL' if not need_agg else 'INTERNAL'}",
-            price_precision=price_precision,
-            size_precision=size_precision,
-        ).from_pandas(ohlcv_df, ts_init_delta=ts_init_delta)
-        if use_pyo3:
-            return ticks
-        return [Bar.from_pyo3(tick) for tick in ticks]
+        return table_to_ticks(
+            self.df_to_table(
+                ohlcv_df,
+                symbol_venue,
+                ts_init_delta,
+                target_freq,
+                need_agg,
+                price_precision,
+                size_precision,
+            ),
+            use_pyo3,
+        )
 
 
 class BinanceTradesLoader(BaseLoader):
@@ -222,52 +955,593 @@ class BinanceTradesLoader(BaseLoader):
         "buyer_maker",
         "isBestMatch",
     ]
+    dtypes = {
+        "trade_id": "int64",
+        "price": "float64",
+        "quantity": "float64",
+        "quoteQty": "float64",
+        "timestamp": "int64",
+        "buyer_maker": "bool",
+        "isBestMatch": "bool",
+    }
+    usecols = header[:-1]
     date_columns = ["timestamp"]
+    dataset = "trades"
+    data_type = "TradeTick"
 
     def __init__(
         self,
         base_dir: str = "submodules/binance-public-data/python/data/spot/daily/trades",
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
     ):
-        super().__init__(base_dir=base_dir)
+        super().__init__(
+            base_dir=base_dir, cache_dir=cache_dir, engine=engine, usecols=usecols
+        )
 
-    @staticmethod
-    def _load_single(path: str | Path, parse_date: bool = True) -> pd.DataFrame:
-        df = pd.read_csv(path, header=None, names=BinanceTradesLoader.header)
-        if parse_date:
-            for col in BinanceTradesLoader.date_columns:
-                df[col] = pd.to_datetime(df[col], unit="us")
-        return df
+    def get_path(self, date_str: str, symbol: str) -> Path:
+        return self.base_dir / symbol / f"{symbol}-trades-{date_str}.zip"
 
-    def get_date_symbol(self, date_str: str, symbol: str) -> pd.DataFrame:
-        return self._load_single(
-            self.base_dir / symbol / f"{symbol}-trades-{date_str}.zip"
+    def df_to_table(
+        self,
+        trade_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        price_precision: int = 2,
+        size_precision: int = 5,
+    ) -> pa.Table:
+        return _trade_df_to_arrow(
+            trade_df, symbol_venue, ts_init_delta, price_precision, size_precision
         )
 
-    def get_date_symbol_ticks(
+    def df_to_ticks(
         self,
-        date_str: str,
+        trade_df: pd.DataFrame,
         symbol_venue: str,
         ts_init_delta: int = 0,
         use_pyo3: bool = False,
         price_precision: int = 2,
         size_precision: int = 5,
     ) -> list[TradeTick | TradeTickV2]:
+        return table_to_ticks(
+            self.df_to_table(
+                trade_df, symbol_venue, ts_init_delta, price_precision, size_precision
+            ),
+            use_pyo3,
+        )
+
+
+class BinanceBookTickerLoader(BaseLoader):
+    """
+    Best bid/ask updates (the bookTicker stream) of the USD-M futures daily dumps,
+    as `QuoteTick`.
+
+    NOTE: Binance Public Data only publishes bookTicker for futures, the files have a
+    header row and millisecond timestamps
+    """
+
+    header = [
+        "update_id",
+        "best_bid_price",
+        "best_bid_qty",
+        "best_ask_price",
+        "best_ask_qty",
+        "transaction_time",
+        "event_time",
+    ]
+    dtypes = {
+        "update_id": "int64",
+        "best_bid_price": "float64",
+        "best_bid_qty": "float64",
+        "best_ask_price": "float64",
+        "best_ask_qty": "float64",
+        "transaction_time": "int64",
+        "event_time": "int64",
+    }
+    usecols = header[1:6]
+    date_columns = ["transaction_time", "event_time"]
+    time_unit = "ms"
+    has_header = True
+    dataset = "bookTicker"
+    data_type = "QuoteTick"
+
+    def __init__(
+        self,
+        base_dir: str = "submodules/binance-public-data/python/data/futures/um/daily/bookTicker",
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
+    ):
+        super().__init__(
+            base_dir=base_dir, cache_dir=cache_dir, engine=engine, usecols=usecols
+        )
+
+    def get_path(self, date_str: str, symbol: str) -> Path:
+        return self.base_dir / symbol / f"{symbol}-bookTicker-{date_str}.zip"
+
+    def df_to_table(
+        self,
+        quote_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        price_precision: int = 2,
+        size_precision: int = 3,
+    ) -> pa.Table:
+        return _quote_df_to_arrow(
+            quote_df, symbol_venue, ts_init_delta, price_precision, size_precision
+        )
+
+    def df_to_ticks(
+        self,
+        quote_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        use_pyo3: bool = False,
+        price_precision: int = 2,
+        size_precision: int = 3,
+    ) -> list[QuoteTick | QuoteTickV2]:
+        return table_to_ticks(
+            self.df_to_table(
+                quote_df, symbol_venue, ts_init_delta, price_precision, size_precision
+            ),
+            use_pyo3,
+        )
+
+
+class BinanceBookSnapshotLoader(BaseLoader):
+    """
+    Top of the book snapshots recorded from the partial depth streams, as `OrderBookDepth10`.
+
+    Binance does not publish order book dumps, this reads daily CSVs in the layout of the
+    usual recorders (e.g. tardis.dev `book_snapshot_25`): a header row, microsecond
+    timestamps and `asks[i].price, asks[i].amount, bids[i].price, bids[i].amount` per level.
+    Only the 10 best levels are parsed, deeper ones are ignored.
+    """
+
+    header = ["exchange", "symbol", "timestamp", "local_timestamp"] + [
+        f"{side}[{level}].{field}"
+        for level in range(10)
+        for side in ("asks", "bids")
+        for field in ("price", "amount")
+    ]
+    dtypes = {
+        "exchange": "str",
+        "symbol": "str",
+        "timestamp": "int64",
+        "local_timestamp": "int64",
+    } | {col: "float64" for col in header[4:]}
+    usecols = header[2:]
+    date_columns = ["timestamp", "local_timestamp"]
+    has_header = True
+    dataset = "bookSnapshot"
+    data_type = "OrderBookDepth10"
+
+    def __init__(
+        self,
+        base_dir: str = "recordings/binance/bookSnapshot",
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
+    ):
+        super().__init__(
+            base_dir=base_dir, cache_dir=cache_dir, engine=engine, usecols=usecols
+        )
+
+    def get_path(self, date_str: str, symbol: str) -> Path:
+        return self.base_dir / symbol / f"{symbol}-bookSnapshot-{date_str}.zip"
+
+    def df_to_table(
+        self,
+        snapshot_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        price_precision: int = 2,
+        size_precision: int = 5,
+        sequence_start: int = 0,
+    ) -> pa.Table:
+        return _snapshot_df_to_arrow(
+            snapshot_df,
+            symbol_venue,
+            ts_init_delta,
+            price_precision,
+            size_precision,
+            sequence_start,
+        )
+
+    def df_to_ticks(
+        self,
+        snapshot_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        use_pyo3: bool = False,
+        price_precision: int = 2,
+        size_precision: int = 5,
+    ) -> list[OrderBookDepth10]:
+        # NOTE: depths are always legacy objects (see `table_to_ticks`), `use_pyo3` is
+        # accepted for the common interface of the loaders
+        return table_to_ticks(
+            self.df_to_table(
+                snapshot_df,
+                symbol_venue,
+                ts_init_delta,
+                price_precision,
+                size_precision,
+            ),
+            use_pyo3,
+        )
+
+    def iter_date_symbol_ticks(
+        self,
+        date_str: str,
+        symbol_venue: str,
+        chunksize: int = 1_000_000,
+        use_pyo3: bool = False,
+        **kwargs,
+    ) -> Iterator[list[OrderBookDepth10]]:
+        """
+        Streaming version of `get_date_symbol_ticks`, with the same depths as the whole
+        day: the sequence numbers carry on from one chunk to the next.
+        """
         symbol, venue = symbol_venue.split(".")
-        trade_df = self.get_date_symbol(date_str=date_str, symbol=symbol)
-        trade_df["ts_recv"] = trade_df[
-            "timestamp"
-        ]  # TODO: maybe add simulate_recv_latency_us
-        ticks = TradeTickDataWranglerV2(
-            instrument_id=symbol_venue,
-            price_precision=price_precision,
-            size_precision=size_precision,
-        ).from_pandas(trade_df, ts_init_delta=ts_init_delta)
-        if use_pyo3:
-            return ticks
-        return [TradeTick.from_pyo3(tick) for tick in ticks]
+        sequence_start = 0
+        for snapshot_df in self.iter_date_symbol(date_str, symbol, chunksize=chunksize):
+            table = self.df_to_table(
+                snapshot_df, symbol_venue, sequence_start=sequence_start, **kwargs
+            )
+            yield table_to_ticks(table, use_pyo3)
+            sequence_start += table.num_rows
+
+
+class BinanceDepthUpdateLoader(BaseLoader):
+    """
+    Incremental L2 updates recorded from the diff. depth stream, as `OrderBookDelta`.
+
+    Daily CSVs in the layout of the usual recorders (e.g. tardis.dev `incremental_book_L2`):
+    a header row, microsecond timestamps and one row per updated level, where the initial
+    snapshot rows are flagged by `is_snapshot` and a zero amount removes the level.
+    """
+
+    header = [
+        "exchange",
+        "symbol",
+        "timestamp",
+        "local_timestamp",
+        "is_snapshot",
+        "side",
+        "price",
+        "amount",
+    ]
+    dtypes = {
+        "exchange": "str",
+        "symbol": "str",
+        "timestamp": "int64",
+        "local_timestamp": "int64",
+        "is_snapshot": "bool",
+        "side": "str",
+        "price": "float64",
+        "amount": "float64",
+    }
+    usecols = header[2:]
+    date_columns = ["timestamp", "local_timestamp"]
+    has_header = True
+    dataset = "depthUpdate"
+    data_type = "OrderBookDelta"
+
+    def __init__(
+        self,
+        base_dir: str = "recordings/binance/depthUpdate",
+        cache_dir: str | None = None,
+        engine: ENGINE_TYPE = "pyarrow",
+        usecols: list[str] | None = None,
+    ):
+        super().__init__(
+            base_dir=base_dir, cache_dir=cache_dir, engine=engine, usecols=usecols
+        )
+
+    def get_path(self, date_str: str, symbol: str) -> Path:
+        return self.base_dir / symbol / f"{symbol}-depthUpdate-{date_str}.zip"
+
+    def df_to_table(
+        self,
+        delta_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        price_precision: int = 2,
+        size_precision: int = 5,
+        continues_snapshot: bool = False,
+        next_ts_event: int | None = None,
+        sequence_start: int = 0,
+    ) -> pa.Table:
+        return _delta_df_to_arrow(
+            delta_df,
+            symbol_venue,
+            ts_init_delta,
+            price_precision,
+            size_precision,
+            continues_snapshot,
+            next_ts_event,
+            sequence_start,
+        )
+
+    def df_to_ticks(
+        self,
+        delta_df: pd.DataFrame,
+        symbol_venue: str,
+        ts_init_delta: int = 0,
+        use_pyo3: bool = False,
+        price_precision: int = 2,
+        size_precision: int = 5,
+    ) -> list[OrderBookDelta | OrderBookDeltaV2]:
+        return table_to_ticks(
+            self.df_to_table(
+                delta_df, symbol_venue, ts_init_delta, price_precision, size_precision
+            ),
+            use_pyo3,
+        )
+
+    def iter_date_symbol_ticks(
+        self,
+        date_str: str,
+        symbol_venue: str,
+        chunksize: int = 1_000_000,
+        use_pyo3: bool = False,
+        **kwargs,
+    ) -> Iterator[list[OrderBookDelta | OrderBookDeltaV2]]:
+        """
+        Streaming version of `get_date_symbol_ticks`, with the same deltas as the whole
+        day: snapshots and events split over two chunks carry on in the next one.
+        """
+        symbol, venue = symbol_venue.split(".")
+        chunks = self.iter_date_symbol(date_str, symbol, chunksize=chunksize)
+        delta_df = next(chunks, None)
+        continues_snapshot = False
+        sequence_start = 0
+        while delta_df is not None:
+            # One chunk ahead, for the event of the last row
+            next_df = next(chunks, None)
+            table = self.df_to_table(
+                delta_df,
+                symbol_venue,
+                continues_snapshot=continues_snapshot,
+                next_ts_event=(
+                    None
+                    if next_df is None
+                    else int(_to_unix_nanos(next_df["timestamp"].iloc[:1])[0])
+                ),
+                sequence_start=sequence_start,
+                **kwargs,
+            )
+            yield table_to_ticks(table, use_pyo3)
+            continues_snapshot = bool(delta_df["is_snapshot"].iloc[-1])
+            sequence_start += table.num_rows
+            delta_df = next_df
+
+
+LOADERS: dict[str, type[BaseLoader]] = {
+    "aggTrades": BinanceAggTradesLoader,
+    "klines": BinanceKlineLoader,
+    "trades": BinanceTradesLoader,
+    "bookTicker": BinanceBookTickerLoader,
+    "bookSnapshot": BinanceBookSnapshotLoader,
+    "depthUpdate": BinanceDepthUpdateLoader,
+}
+
+
+def _ingest_day(
+    loader: BaseLoader,
+    date_str: str,
+    symbol_venue: str,
+    file_path: Path,
+    row_group_size: int,
+    kwargs: dict,
+) -> int:
+    symbol, venue = symbol_venue.split(".")
+    table = loader.df_to_table(
+        loader.get_date_symbol(date_str, symbol), symbol_venue, **kwargs
+    )
+    # Write then rename so that an interrupted run never leaves a partial day behind
+    tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path, row_group_size=row_group_size)
+    os.replace(tmp_path, file_path)
+    return table.num_rows
+
+
+def ingest_to_catalog(
+    loader: BaseLoader,
+    catalog_path: str | Path,
+    start: str,
+    end: str,
+    symbol_venue: str,
+    max_workers: int | None = None,
+    overwrite: bool = False,
+    row_group_size: int = 5_000,
+    **kwargs,
+) -> dict[str, int]:
+    """
+    Convert the daily files of `symbol_venue` from `start` to `end` (both inclusive)
+    straight into `ParquetDataCatalog` files, one `{date}.parquet` per day under the
+    catalog directory of `loader.data_type`, see `df_to_table` of the loader for `kwargs`.
+
+    The days are converted in parallel over a process pool and go from DataFrame to the
+    catalog Arrow schema directly, without creating any Nautilus objects.
+    Days which are already in the catalog (recorded in its manifest, see `read_manifest`)
+    are skipped unless `overwrite`, so re-running only ingests the missing days.
+    Raises a `ValueError` if the catalog directory holds data files which are not
+    in the manifest (e.g. written by `ParquetDataCatalog.write_data`), or days ingested
+    from another dataset or at other precisions (e.g. trades then aggTrades, which share
+    the trade tick directory). With `overwrite`, the days of other settings are removed.
+
+    NOTE: instruments are not written, use `ParquetDataCatalog.write_data([instrument])`
+
+    Returns the number of rows written for each ingested day.
+    """
+    # NOTE: as `class_to_filename` and `urisafe_instrument_id` of
+    # `nautilus_trader.persistence.funcs` (for the Nautilus data classes), without
+    # importing the Nautilus model
+    directory = (
+        Path(catalog_path)
+        / "data"
+        / convert_to_snake_case(loader.data_type)
+        / loader.get_catalog_id(symbol_venue, **kwargs).replace("/", "")
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    partition = directory.relative_to(Path(catalog_path) / "data").as_posix()
+    settings = _manifest_settings(loader, kwargs)
+    entry = read_manifest(catalog_path).get(partition, {})
+    coverage = entry.get("days", {})
+    file_paths = {
+        date_str: directory / f"{date_str}.parquet"
+        for date_str in pd.date_range(start, end, freq="D").strftime("%Y-%m-%d")
+    }
+    # Files of another writer (e.g. the `part-0.parquet` of `catalog.write_data`) would
+    # be read together with the ingested days, i.e. the same ticks twice
+    unknown = sorted(
+        path.name
+        for path in directory.glob("*.parquet")
+        if path.stem not in coverage and path.stem not in file_paths
+    )
+    if unknown:
+        raise ValueError(
+            f"{directory} holds data files which are not in the catalog manifest "
+            f"{unknown}, remove them (or ingest into an empty catalog) so that their "
+            "data is not read twice"
+        )
+    recorded = {key: entry.get(key) for key in settings}
+    if coverage and recorded != settings:
+        if not overwrite:
+            raise ValueError(
+                f"{partition} was ingested with {recorded}, not {settings}: ingest into "
+                "another catalog, or overwrite to replace its days"
+            )
+        # Days of other settings would be read together with the new ones
+        for date_str in coverage:
+            (directory / f"{date_str}.parquet").unlink(missing_ok=True)
+        coverage = {}
+    if not overwrite:
+        file_paths = {
+            date_str: file_path
+            for date_str, file_path in file_paths.items()
+            if date_str not in coverage or not file_path.exists()
+        }
+    if not file_paths:
+        return {}
+
+    args = (
+        [loader] * len(file_paths),
+        list(file_paths),
+        [symbol_venue] * len(file_paths),
+        list(file_paths.values()),
+        [row_group_size] * len(file_paths),
+        [kwargs] * len(file_paths),
+    )
+    max_workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+    if max_workers <= 1:
+        num_rows = list(map(_ingest_day, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            num_rows = list(executor.map(_ingest_day, *args))
+    written = dict(zip(file_paths, num_rows))
+    update_manifest(catalog_path, partition, written, settings)
+    return written
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _manifest_settings(loader: BaseLoader, kwargs: dict) -> dict:
+    # The dataset and the precisions (defaults of the loader if not given) of the days
+    parameters = inspect.signature(loader.df_to_table).parameters
+    return {"dataset": loader.dataset} | {
+        name: kwargs.get(name, parameters[name].default)
+        for name in ("price_precision", "size_precision")
+    }
+
+
+def read_manifest(catalog_path: str | Path) -> dict[str, dict]:
+    """
+    Coverage of the days ingested by `ingest_to_catalog`, as
+    {"<data type>/<instrument or bar type>": {"dataset": str, "price_precision": int,
+    "size_precision": int, "days": {date: rows}}}.
+
+    NOTE: entries of the former {date: rows} layout are read with unknown settings
+    """
+    manifest_path = Path(catalog_path) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    return {
+        partition: entry if "days" in entry else {"days": entry}
+        for partition, entry in json.loads(manifest_path.read_text()).items()
+    }
+
+
+def update_manifest(
+    catalog_path: str | Path, partition: str, written: dict[str, int], settings: dict
+) -> None:
+    if not written:
+        return
+    manifest = read_manifest(catalog_path)
+    entry = manifest.get(partition, {})
+    # Days of other settings are replaced (see `ingest_to_catalog`)
+    same = all(entry.get(key) == value for key, value in settings.items())
+    coverage = entry.get("days", {}) if same else {}
+    coverage.update(written)
+    manifest[partition] = settings | {"days": dict(sorted(coverage.items()))}
+    manifest_path = Path(catalog_path) / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, manifest_path)
+
+
+def ingest_main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m data.binance_loader ingest",
+        description="Ingest downloaded Binance daily zips into a ParquetDataCatalog",
+    )
+    parser.add_argument("dataset", choices=list(LOADERS))
+    parser.add_argument("symbol_venue", help="e.g. ETHUSDT.BINANCE")
+    parser.add_argument("start", help="first date (YYYY-MM-DD)")
+    parser.add_argument("end", help="last date (YYYY-MM-DD), inclusive")
+    parser.add_argument("--catalog", default="catalog", help="catalog path")
+    parser.add_argument("--base-dir", help="download directory of the dataset")
+    parser.add_argument("--freq", default="1s", help="kline interval to read")
+    parser.add_argument(
+        "--target-freq", default="1-SECOND", help="bar step and aggregation of klines"
+    )
+    parser.add_argument("--price-precision", type=int, default=2)
+    parser.add_argument("--size-precision", type=int, default=5)
+    parser.add_argument("--workers", type=int, help="number of processes")
+    parser.add_argument("--overwrite", action="store_true", help="re-ingest days")
+    args = parser.parse_args(argv)
+
+    loader_kwargs = {"base_dir": args.base_dir} if args.base_dir else {}
+    kwargs = {}
+    if args.dataset == "klines":
+        loader_kwargs["freq"] = args.freq
+        kwargs["target_freq"] = args.target_freq
+    written = ingest_to_catalog(
+        LOADERS[args.dataset](**loader_kwargs),
+        args.catalog,
+        args.start,
+        args.end,
+        args.symbol_venue,
+        max_workers=args.workers,
+        overwrite=args.overwrite,
+        price_precision=args.price_precision,
+        size_precision=args.size_precision,
+        **kwargs,
+    )
+    for date_str, num_rows in written.items():
+        print(f"{date_str}: {num_rows:_} rows")
+    print(f"Ingested {len(written)} day(s) into {args.catalog}")
 
 
 if __name__ == "__main__":
+    # python -m data.binance_loader ingest klines ETHUSDT.BINANCE 2025-01-01 2025-01-31
+    if sys.argv[1:2] == ["ingest"]:
+        ingest_main(sys.argv[2:])
+        sys.exit()
+
     # python -m data.binance_loader
     print(
         aggTrades_df := BinanceAggTradesLoader().get_date_symbol(
@@ -290,6 +1564,9 @@ if __name__ == "__main__":
             "2025-01-01", "ETHUSDT.BINANCE", use_pyo3=False
         )[:10]
     )
+    from nautilus_trader.core.nautilus_pyo3 import Bar as BarV2
+    from nautilus_trader.model import Bar
+
     print(
         isinstance(bar_ticks_1s[0], BarV2),
         isinstance(bar_ticks_1s_v1[0], Bar),
@@ -300,12 +1577,19 @@ if __name__ == "__main__":
             "2025-01-01", "ETHUSDT.BINANCE", target_freq="1-MINUTE", need_agg=True
         )[:10]
     )
+    print(
+        kline_range_df := BinanceKlineLoader("1s").get_range(
+            "2025-01-01", "2025-01-02", ["ETHUSDT", "BTCUSDT"]
+        )
+    )
     print(trades_df := BinanceTradesLoader().get_date_symbol("2025-01-01", "ETHUSDT"))
     print(
         trades_ticks := BinanceTradesLoader().get_date_symbol_ticks(
             "2025-01-01", "ETHUSDT.BINANCE"
         )[:10]
     )
-    import ipdb
+    # The debugger is only opened (and imported) from a terminal
+    if sys.stdin.isatty():
+        import ipdb
 
-    ipdb.set_trace()
+        ipdb.set_trace()
@@ -0,0 +1,113 @@
+import numpy as np
+import pyarrow as pa
+
+# NOTE: from the Rust core rather than `nautilus_trader.model.objects` (same values),
+# which would load the whole `nautilus_trader.model` package
+from nautilus_trader.core.nautilus_pyo3 import FIXED_PRECISION
+from nautilus_trader.core.nautilus_pyo3 import PRECISION_BYTES as FIXED_PRECISION_BYTES
+
+# Vectorized conversion of price/size columns into Nautilus fixed-point raw values
+# (value * 10^FIXED_PRECISION, stored as 8 or 16 bytes little-endian integers depending on the build).
+# https://nautilustrader.io/docs/latest/concepts/overview#value-types
+
+
+def to_fixed_int(
+    values: np.ndarray, precision: int, scaled: bool = False
+) -> np.ndarray:
+    """
+    Convert decimal values into int64 counts of 10^-precision (e.g. 3300.03 @ 2 => 330003,
+    3 @ 2 => 300), or with `scaled` take integer counts already scaled by 10^precision.
+
+    Float inputs are rounded to the nearest unit of the precision, which is exact for
+    values parsed from CSV text with at most `precision` decimals.
+    Ties are rounded half away from zero like `Price`/`Quantity` (e.g. 0.5 @ 0 => 1).
+    Raises a `ValueError` for NaN/infinite values or counts beyond int64.
+    """
+    values = np.asarray(values)
+    if scaled:
+        if values.dtype.kind not in "iu":
+            raise ValueError(f"scaled values must be integers, not {values.dtype}")
+        return values.astype(np.int64, copy=False)
+    # Scale and round in a single temporary buffer (integers included, for the range check)
+    scaled_values = np.multiply(values, 10.0**precision, dtype=np.float64)
+    sign = np.sign(scaled_values)
+    np.abs(scaled_values, out=scaled_values)
+    # NOTE: NaN compares False, it would otherwise be cast to INT64_MIN
+    if not np.all(scaled_values < 2.0**63):
+        raise ValueError(
+            f"values must be finite and within int64 at precision {precision}"
+        )
+    if values.dtype.kind in "iu":
+        return values.astype(np.int64) * np.int64(10**precision)
+    scaled_values += 0.5
+    np.floor(scaled_values, out=scaled_values)
+    scaled_values *= sign
+    return scaled_values.astype(np.int64)
+
+
+def fixed_int_to_raw(fixed: np.ndarray, precision: int) -> pa.FixedSizeBinaryArray:
+    """
+    Convert int64 counts of 10^-precision into a `fixed_size_binary` Arrow array of
+    Nautilus raw values, as expected by the Arrow schemas of the v2 wranglers.
+    """
+    if not 0 <= precision <= FIXED_PRECISION:
+        raise ValueError(
+            f"precision {precision} must be between 0 and FIXED_PRECISION {FIXED_PRECISION}"
+        )
+    fixed = np.ascontiguousarray(fixed, dtype=np.int64)
+    if FIXED_PRECISION_BYTES == 8:
+        raw = fixed * np.int64(10 ** (FIXED_PRECISION - precision))
+        data = pa.py_buffer(raw)
+    else:
+        # The storage of a decimal128 with scale s is the little-endian 128-bit integer
+        # value * 10^s, i.e. exactly the raw value for s = FIXED_PRECISION - precision
+        decimals = pa.array(fixed).cast(pa.decimal128(38, FIXED_PRECISION - precision))
+        data = decimals.buffers()[1]
+    return pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(FIXED_PRECISION_BYTES), len(fixed), [None, data]
+    )
+
+
+def to_raw(
+    values: np.ndarray, precision: int, scaled: bool = False
+) -> pa.FixedSizeBinaryArray:
+    """
+    Convert a price/size column into Nautilus raw values at `precision`
+    (see `to_fixed_int` for `scaled`).
+    """
+    return fixed_int_to_raw(to_fixed_int(values, precision, scaled), precision)
+
+
+def raw_to_fixed_int(
+    raw: pa.FixedSizeBinaryArray | pa.ChunkedArray, precision: int
+) -> np.ndarray:
+    """
+    Inverse of `fixed_int_to_raw`: int64 counts of 10^-precision of a column of Nautilus
+    raw values (e.g. the `close` of a bar table).
+    """
+    if isinstance(raw, pa.ChunkedArray):
+        raw = raw.combine_chunks()
+    data = raw.buffers()[1]
+    if FIXED_PRECISION_BYTES == 8:
+        values = np.frombuffer(
+            data, dtype=np.int64, count=len(raw), offset=raw.offset * 8
+        )
+        return values // np.int64(10 ** (FIXED_PRECISION - precision))
+    # Viewed as a decimal128 with scale FIXED_PRECISION - precision, the value is the count
+    decimals = pa.Array.from_buffers(
+        pa.decimal128(38, FIXED_PRECISION - precision),
+        len(raw),
+        [None, data],
+        offset=raw.offset,
+    )
+    return decimals.cast(pa.int64()).to_numpy()
+
+
+def raw_to_float(
+    raw: pa.FixedSizeBinaryArray | pa.ChunkedArray, precision: int
+) -> np.ndarray:
+    """
+    A column of Nautilus raw values as float64, the nearest float of each decimal value
+    (`Price.as_double` divides the raw value and may be one ulp off).
+    """
+    return raw_to_fixed_int(raw, precision) / 10.0**precision
@@ -0,0 +1,237 @@
+import os
+import uuid
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from nautilus_trader.core import nautilus_pyo3
+from nautilus_trader.model.data import (
+    OrderBookDelta,
+    OrderBookDeltas,
+    OrderBookDepth10,
+    capsule_to_list,
+)
+from nautilus_trader.model.enums import BookAction, OrderSide, RecordFlag
+from nautilus_trader.model.identifiers import InstrumentId
+from data.binance_loader import SHARED_DIR
+from data.fixed_point import to_raw
+
+# Bulk construction of order book data from NumPy arrays: the columns are converted to
+# Nautilus raw values in NumPy/Arrow, and the objects are built by the Rust decoder of
+# the catalog instead of one `Price(Decimal(str(...)))` at a time
+
+DEPTH = 10
+
+
+def decode_table(table: pa.Table, data_type: nautilus_pyo3.NautilusDataType) -> list:
+    """
+    Decode an Arrow table in the catalog schema of `data_type` into Nautilus objects
+    with the Rust backend (the rows must be ordered by `ts_init`).
+
+    The backend only reads files, so the table goes through an uncompressed Parquet
+    file in shared memory which is removed right after.
+    """
+    path = SHARED_DIR / f"nautilus-decode-{os.getpid()}-{uuid.uuid4().hex}.parquet"
+    pq.write_table(table, path, compression="none")
+    try:
+        session = nautilus_pyo3.DataBackendSession()
+        session.add_file(data_type, "data", str(path))
+        data = []
+        for chunk in session.to_query_result():
+            # NOTE: `OrderBookDepth10.list_from_capsule` crashes, the catalog uses this instead
+            data.extend(capsule_to_list(chunk))
+        return data
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _levels(values: np.ndarray, name: str, rows: int) -> np.ndarray:
+    values = np.asarray(values)
+    if values.shape != (rows, DEPTH):
+        raise ValueError(
+            f"{name} must have shape ({rows}, {DEPTH}), was {values.shape}"
+        )
+    return values
+
+
+def depth10_table(
+    instrument_id: str,
+    bid_prices: np.ndarray,
+    bid_sizes: np.ndarray,
+    ask_prices: np.ndarray,
+    ask_sizes: np.ndarray,
+    ts_event: np.ndarray,
+    price_precision: int,
+    size_precision: int,
+    bid_counts: np.ndarray | None = None,
+    ask_counts: np.ndarray | None = None,
+    ts_init: np.ndarray | None = None,
+    sequence: np.ndarray | None = None,
+    flags: int = 0,
+) -> pa.Table:
+    """
+    Arrow table of N `OrderBookDepth10` in the catalog schema, from (N, 10) arrays of
+    prices, sizes and counts per level (best level first) and N timestamps.
+
+    Prices/sizes are decimal values (floats rounded to the precisions, or integers), see
+    `data.fixed_point.to_fixed_int`.
+    Counts default to zeros, `ts_init` to `ts_event` and `sequence` to 0..N-1.
+    """
+    ts_event = np.asarray(ts_event, dtype=np.uint64)
+    rows = len(ts_event)
+    zeros = np.zeros((rows, DEPTH), dtype=np.uint32)
+    levels = {
+        "bid_price": (_levels(bid_prices, "bid_prices", rows), price_precision),
+        "ask_price": (_levels(ask_prices, "ask_prices", rows), price_precision),
+        "bid_size": (_levels(bid_sizes, "bid_sizes", rows), size_precision),
+        "ask_size": (_levels(ask_sizes, "ask_sizes", rows), size_precision),
+    }
+    counts = {
+        "bid_count": bid_counts if bid_counts is not None else zeros,
+        "ask_count": ask_counts if ask_counts is not None else zeros,
+    }
+
+    columns = {}
+    for name, (values, precision) in levels.items():
+        for level in range(DEPTH):
+            columns[f"{name}_{level}"] = to_raw(values[:, level], precision)
+    for name, values in counts.items():
+        values = _levels(values, f"{name}s", rows).astype(np.uint32, copy=False)
+        for level in range(DEPTH):
+            columns[f"{name}_{level}"] = pa.array(values[:, level])
+    columns["flags"] = pa.array(np.full(rows, flags, dtype=np.uint8))
+    columns["sequence"] = pa.array(
+        np.asarray(sequence, dtype=np.uint64)
+        if sequence is not None
+        else np.arange(rows, dtype=np.uint64)
+    )
+    columns["ts_event"] = pa.array(ts_event)
+    columns["ts_init"] = pa.array(
+        np.asarray(ts_init, dtype=np.uint64) if ts_init is not None else ts_event
+    )
+
+    # The decoder reads the columns by position, so follow the order of the schema
+    fields = nautilus_pyo3.OrderBookDepth10.get_fields()
+    return pa.table({name: columns[name] for name in fields}).replace_schema_metadata(
+        {
+            "instrument_id": instrument_id,
+            "price_precision": str(price_precision),
+            "size_precision": str(size_precision),
+        }
+    )
+
+
+def depth10_from_arrays(*args, **kwargs) -> list[OrderBookDepth10]:
+    """
+    Build N `OrderBookDepth10` in bulk, see `depth10_table` for the arguments.
+    """
+    return decode_table(
+        depth10_table(*args, **kwargs),
+        nautilus_pyo3.NautilusDataType.OrderBookDepth10,
+    )
+
+
+def deltas_table(
+    instrument_id: str,
+    action: np.ndarray,
+    side: np.ndarray,
+    price: np.ndarray,
+    size: np.ndarray,
+    order_id: np.ndarray,
+    flags: np.ndarray,
+    ts_event: np.ndarray,
+    price_precision: int,
+    size_precision: int,
+    ts_init: np.ndarray | None = None,
+    sequence: np.ndarray | None = None,
+) -> pa.Table:
+    """
+    Arrow table of N `OrderBookDelta` in the catalog schema, from N-long columns
+    (`BookAction`/`OrderSide`/`RecordFlag` values for action, side and flags).
+
+    Prices/sizes are converted as in `depth10_table`.
+    `ts_init` defaults to `ts_event` and `sequence` to 0..N-1.
+    """
+    ts_event = np.asarray(ts_event, dtype=np.uint64)
+    rows = len(ts_event)
+    columns = {
+        "action": pa.array(np.asarray(action, dtype=np.uint8)),
+        "side": pa.array(np.asarray(side, dtype=np.uint8)),
+        "price": to_raw(np.asarray(price), price_precision),
+        "size": to_raw(np.asarray(size), size_precision),
+        "order_id": pa.array(np.asarray(order_id, dtype=np.uint64)),
+        "flags": pa.array(np.asarray(flags, dtype=np.uint8)),
+        "sequence": pa.array(
+            np.asarray(sequence, dtype=np.uint64)
+            if sequence is not None
+            else np.arange(rows, dtype=np.uint64)
+        ),
+        "ts_event": pa.array(ts_event),
+        "ts_init": pa.array(
+            np.asarray(ts_init, dtype=np.uint64) if ts_init is not None else ts_event
+        ),
+    }
+    fields = nautilus_pyo3.OrderBookDelta.get_fields()
+    return pa.table({name: columns[name] for name in fields}).replace_schema_metadata(
+        {
+            "instrument_id": instrument_id,
+            "price_precision": str(price_precision),
+            "size_precision": str(size_precision),
+        }
+    )
+
+
+def snapshot_deltas_table(
+    instrument_id: str,
+    sides: np.ndarray,
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    order_ids: np.ndarray,
+    ts_event: int,
+    price_precision: int,
+    size_precision: int,
+    ts_init: int | None = None,
+) -> pa.Table:
+    """
+    Arrow table of the deltas seeding a whole book at `ts_event`: a CLEAR then one ADD
+    per resting order (`OrderSide` values, prices, sizes and order IDs of the orders).
+
+    Every delta is flagged `F_SNAPSHOT` and the last one `F_LAST`, so the book is
+    published once, after all the orders are in.
+    """
+    rows = len(order_ids) + 1
+    flags = np.full(rows, RecordFlag.F_SNAPSHOT, dtype=np.uint8)
+    flags[-1] |= RecordFlag.F_LAST
+    return deltas_table(
+        instrument_id,
+        action=np.r_[BookAction.CLEAR, np.full(rows - 1, BookAction.ADD)],
+        side=np.r_[OrderSide.NO_ORDER_SIDE, np.asarray(sides)],
+        price=np.r_[0.0, np.asarray(prices, dtype=np.float64)],
+        size=np.r_[0.0, np.asarray(sizes, dtype=np.float64)],
+        order_id=np.r_[0, np.asarray(order_ids)],
+        flags=flags,
+        ts_event=np.full(rows, ts_event, dtype=np.uint64),
+        ts_init=np.full(rows, ts_init if ts_init is not None else ts_event),
+        price_precision=price_precision,
+        size_precision=size_precision,
+    )
+
+
+def deltas_from_arrays(*args, **kwargs) -> list[OrderBookDelta]:
+    """
+    Build N `OrderBookDelta` in bulk, see `deltas_table` for the arguments.
+    """
+    return decode_table(
+        deltas_table(*args, **kwargs), nautilus_pyo3.NautilusDataType.OrderBookDelta
+    )
+
+
+def snapshot_deltas(instrument_id: str, *args, **kwargs) -> OrderBookDeltas:
+    """
+    Seed a whole book as one `OrderBookDeltas` batch, see `snapshot_deltas_table` for
+    the arguments. Unlike an `OrderBook`, the batch is data for `BacktestEngine.add_data`.
+    """
+    deltas = decode_table(
+        snapshot_deltas_table(instrument_id, *args, **kwargs),
+        nautilus_pyo3.NautilusDataType.OrderBookDelta,
+    )
+    return OrderBookDeltas(InstrumentId.from_str(instrument_id), deltas)
@@ -0,0 +1,227 @@
+from collections.abc import Iterable
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.orders import Order
+from nautilus_trader.model.position import Position
+from data.fixed_point import raw_to_float
+from data.stats import align_fills
+
+# Engine fills and positions as columnar NumPy arrays (one dict of aligned arrays), read
+# straight from the orders/positions of the cache instead of the string `DataFrame`s of
+# `generate_*_report`, to feed vectorbt in-process (per fill or aligned onto the bars)
+# or persist as Parquet/Feather files (instead of a CSV round-trip)
+
+_BUY = int(OrderSide.BUY)
+
+
+def _instrument_codes(instrument_ids: list) -> tuple[np.ndarray, np.ndarray]:
+    # Each distinct instrument ID is formatted once
+    codes: dict = {}
+    indices = np.fromiter(
+        (
+            codes.setdefault(instrument_id, len(codes))
+            for instrument_id in instrument_ids
+        ),
+        dtype=np.int32,
+        count=len(instrument_ids),
+    )
+    names = np.array([str(instrument_id) for instrument_id in codes], dtype=object)
+    return indices, names
+
+
+def fills_arrays(orders: Iterable[Order]) -> dict[str, np.ndarray]:
+    """
+    One row per `OrderFilled` event of the orders, sorted by `ts_event`:
+    - ts_event: int64 UNIX nanoseconds
+    - instrument_id: str (object)
+    - side: int8, 1 for BUY and -1 for SELL
+    - quantity, price, commission: float64 (commission in its own currency)
+    - liquidity_side: int8, 1 for MAKER, 2 for TAKER (0 if none)
+
+    E.g. `fills_arrays(engine.cache.orders())` after `engine.run()`
+    (and before `engine.reset()`).
+    """
+    ts_event = []
+    instrument_ids = []
+    side = []
+    quantity = []
+    price = []
+    commission = []
+    liquidity_side = []
+    for order in orders:
+        if not order.filled_qty.raw:
+            continue
+        for event in order.events:
+            if type(event) is not OrderFilled:
+                continue
+            ts_event.append(event.ts_event)
+            instrument_ids.append(event.instrument_id)
+            side.append(1 if event.order_side == _BUY else -1)
+            quantity.append(event.last_qty.as_double())
+            price.append(event.last_px.as_double())
+            commission.append(event.commission.as_double())
+            liquidity_side.append(event.liquidity_side)
+    codes, names = _instrument_codes(instrument_ids)
+    arrays = {
+        "ts_event": np.array(ts_event, dtype=np.int64),
+        "instrument_id": names[codes],
+        "side": np.array(side, dtype=np.int8),
+        "quantity": np.array(quantity, dtype=np.float64),
+        "price": np.array(price, dtype=np.float64),
+        "commission": np.array(commission, dtype=np.float64),
+        "liquidity_side": np.array(liquidity_side, dtype=np.int8),
+    }
+    # Orders are iterated one after the other, fills interleave in time
+    order = np.argsort(arrays["ts_event"], kind="stable")
+    return {name: values[order] for name, values in arrays.items()}
+
+
+def positions_arrays(positions: Iterable[Position]) -> dict[str, np.ndarray]:
+    """
+    One row per position (e.g. `engine.cache.positions()`), sorted by `ts_opened`:
+    - ts_opened, ts_closed: int64 UNIX nanoseconds (ts_closed is 0 while open)
+    - instrument_id: str (object)
+    - entry: int8, 1 for long and -1 for short
+    - peak_qty, avg_px_open, avg_px_close: float64 (avg_px_close is NaN while open)
+    - realized_pnl: float64 (in the settlement currency), realized_return: float64
+    """
+    positions = list(positions)
+    codes, names = _instrument_codes([position.instrument_id for position in positions])
+    arrays = {
+        "ts_opened": np.array([p.ts_opened for p in positions], dtype=np.int64),
+        "ts_closed": np.array([p.ts_closed or 0 for p in positions], dtype=np.int64),
+        "instrument_id": names[codes],
+        "entry": np.array(
+            [1 if p.entry == _BUY else -1 for p in positions], dtype=np.int8
+        ),
+        "peak_qty": np.array(
+            [p.peak_qty.as_double() for p in positions], dtype=np.float64
+        ),
+        "avg_px_open": np.array([p.avg_px_open for p in positions], dtype=np.float64),
+        "avg_px_close": np.array(
+            [p.avg_px_close if p.is_closed else np.nan for p in positions],
+            dtype=np.float64,
+        ),
+        "realized_pnl": np.array(
+            [
+                p.realized_pnl.as_double() if p.realized_pnl is not None else 0.0
+                for p in positions
+            ],
+            dtype=np.float64,
+        ),
+        "realized_return": np.array(
+            [p.realized_return for p in positions], dtype=np.float64
+        ),
+    }
+    order = np.argsort(arrays["ts_opened"], kind="stable")
+    return {name: values[order] for name, values in arrays.items()}
+
+
+def close_series(bars: pa.Table) -> pd.Series:
+    """
+    The close prices of a bar table (`df_to_table`, `attach_table`, ...) as float64
+    indexed by `ts_init` (UTC), e.g. the 86,400 bars of a day of 1-second bars, without
+    building the `Bar` objects.
+    """
+    precision = int(bars.schema.metadata[b"price_precision"])
+    return pd.Series(
+        raw_to_float(bars.column("close"), precision),
+        index=pd.DatetimeIndex(
+            pd.to_datetime(
+                bars.column("ts_init").to_numpy().astype(np.int64), unit="ns", utc=True
+            )
+        ),
+        name="close",
+    )
+
+
+def _float64(values) -> np.ndarray:
+    # vectorbt's numba functions only compile for numeric arrays (not the object columns
+    # of the reports) and write into some of them (not the read-only memory maps)
+    return np.require(values, dtype=np.float64, requirements=["C", "W"])
+
+
+def from_orders_kwargs(
+    fills: dict[str, np.ndarray], close: pd.Series | None = None
+) -> dict:
+    """
+    `vbt.Portfolio.from_orders` arguments of the fills (of a single instrument), with
+    the engine commissions as fixed fees: one row per fill at its price, or the fills
+    aggregated onto the `close` series (see `align_fills`, e.g. with `close_series`).
+    All of them are writable C-contiguous float64, so vectorbt runs JIT-compiled
+    (see `check_numba_jit`).
+
+    E.g. `vbt.Portfolio.from_orders(**from_orders_kwargs(fills), init_cash=1_000_000)`
+    """
+    if close is not None:
+        aligned = align_fills(fills, close.index)
+        close_values = _float64(close.to_numpy())
+        # Rows without orders default to the close price
+        price = np.where(np.isnan(aligned["price"]), close_values, aligned["price"])
+        return {
+            "close": pd.Series(close_values, index=close.index, name=close.name),
+            "size": _float64(aligned["size"]),
+            "price": _float64(price),
+            "fixed_fees": _float64(aligned["fixed_fees"]),
+        }
+    index = pd.DatetimeIndex(pd.to_datetime(fills["ts_event"], unit="ns", utc=True))
+    return {
+        "close": pd.Series(_float64(fills["price"]), index=index),
+        "size": _float64(fills["side"] * fills["quantity"]),
+        "price": _float64(fills["price"]),
+        "fixed_fees": _float64(fills["commission"]),
+    }
+
+
+def check_numba_jit(compiled: bool = False) -> None:
+    """
+    Raise a `RuntimeError` if vectorbt would simulate in pure Python: numba JIT disabled
+    (e.g. by `NUMBA_DISABLE_JIT=1`), or with `compiled=True` (after `from_orders`) if
+    its simulation was not compiled.
+    """
+    import numba
+    from numba.core.dispatcher import Dispatcher
+    from vectorbt.portfolio.nb import simulate_from_orders_nb
+
+    if numba.config.DISABLE_JIT or not isinstance(simulate_from_orders_nb, Dispatcher):
+        raise RuntimeError(
+            "numba JIT is disabled (NUMBA_DISABLE_JIT=1), vectorbt runs in pure Python"
+        )
+    if compiled and not simulate_from_orders_nb.signatures:
+        raise RuntimeError("vectorbt `simulate_from_orders_nb` was not JIT-compiled")
+
+
+def write_arrays(arrays: dict[str, np.ndarray], path: str | Path) -> Path:
+    """
+    Persist the arrays as Parquet (`.parquet`) or as an uncompressed Feather file which
+    `read_arrays` memory-maps (any other suffix, e.g. `.feather`/`.arrow`).
+    """
+    path = Path(path)
+    table = pa.table(arrays)
+    if path.suffix == ".parquet":
+        pq.write_table(table, path)
+    else:
+        feather.write_feather(table, path, compression="uncompressed")
+    return path
+
+
+def read_arrays(path: str | Path) -> dict[str, np.ndarray]:
+    """
+    The arrays of `write_arrays` (zero-copy views of a Feather file for the numeric
+    columns).
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        table = pq.read_table(path)
+    else:
+        table = feather.read_table(path, memory_map=True)
+    return {
+        name: column.to_numpy()
+        for name, column in zip(table.column_names, table.itercolumns())
+    }
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+# Portfolio statistics of a backtest in plain NumPy, from the engine fills (see
+# `data.reports.fills_arrays`, or the `generate_order_fills_report()` output) and a
+# close series (see `data.reports.close_series`): light enough for the sweep workers,
+# without importing vectorbt (nor the Nautilus model)
+
+YEAR_NS = 365 * 24 * 60 * 60 * 1_000_000_000
+
+
+def _money_amounts(values: pd.Series) -> np.ndarray:
+    # "1.5 USDT" strings (or lists of them, summed) of the reports as float64
+    amounts = values.reset_index(drop=True).explode()
+    amounts = pd.to_numeric(amounts.str.split(" ", n=1).str[0]).fillna(0.0)
+    return amounts.groupby(level=0).sum().to_numpy(dtype=np.float64)
+
+
+def fills_from_report(report: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    The fill arrays (as `fills_arrays`) of a `generate_order_fills_report()`: one row
+    per order at its average price, with its summed commissions.
+
+    NOTE: the `avg_px` of the orders is not exactly the VWAP of their fills, prefer
+    `fills_arrays(engine.cache.orders())` for an exact cash flow
+    """
+    ts_event = report["ts_last"]
+    if isinstance(ts_event.dtype, pd.DatetimeTZDtype):
+        ts_event = ts_event.dt.tz_convert("UTC").dt.tz_localize(None)
+    arrays = {
+        "ts_event": ts_event.to_numpy().astype(np.int64),
+        "side": np.where(report["side"].to_numpy() == "BUY", 1, -1).astype(np.int8),
+        "quantity": report["filled_qty"].to_numpy(dtype=np.float64),
+        "price": report["avg_px"].to_numpy(dtype=np.float64),
+        "commission": _money_amounts(report["commissions"]),
+    }
+    order = np.argsort(arrays["ts_event"], kind="stable")
+    return {name: values[order] for name, values in arrays.items()}
+
+
+def realized_pnls(positions: pd.DataFrame | dict[str, np.ndarray]) -> np.ndarray:
+    """
+    The realized PnL of each position of a `generate_positions_report()` (or of
+    `positions_arrays`) as float64.
+    """
+    if isinstance(positions, pd.DataFrame):
+        return _money_amounts(positions["realized_pnl"])
+    return positions["realized_pnl"]
+
+
+def align_fills(
+    fills: dict[str, np.ndarray], index: pd.DatetimeIndex
+) -> dict[str, np.ndarray]:
+    """
+    Aggregate the fills (of a single instrument) onto the rows of a sorted `index`,
+    each fill into the last row at or before it (the first row for earlier fills):
+    - size: float64 net signed quantity (NaN for the rows without fills)
+    - price: float64 price of the net quantity keeping the cash flow of the fills
+      (their VWAP when on one side, NaN for the rows without fills)
+    - fixed_fees: float64 sum of the commissions
+    - cash_flow: float64 cash received by the fills of the row, before fees
+    - fill_count: int64 number of fills
+
+    NOTE: fills on both sides of a row net out, a row netting to 0 is no order for
+    vectorbt (its round-trip PnL and fees are lost, `cash_flow` keeps them)
+    """
+    rows = len(index)
+    timestamps = index.asi8
+    positions = np.searchsorted(timestamps, fills["ts_event"], side="right") - 1
+    np.clip(positions, 0, rows - 1, out=positions)
+    signed = fills["side"] * fills["quantity"]
+    size = np.bincount(positions, weights=signed, minlength=rows)
+    cash = np.bincount(positions, weights=signed * fills["price"], minlength=rows)
+    fill_count = np.bincount(positions, minlength=rows)
+    filled = fill_count > 0
+    price = np.full(rows, np.nan)
+    netted = filled & (size != 0)
+    price[netted] = cash[netted] / size[netted]
+    size[~filled] = np.nan
+    return {
+        "size": size,
+        "price": price,
+        "fixed_fees": np.bincount(
+            positions, weights=fills["commission"], minlength=rows
+        ),
+        "cash_flow": -cash,
+        "fill_count": fill_count,
+    }
+
+
+def equity_curve(
+    fills: dict[str, np.ndarray], close: pd.Series, init_cash: float
+) -> np.ndarray:
+    """
+    Value of the cash and the position at every close, with the fills aggregated onto
+    the close rows (see `align_fills`).
+    """
+    aligned = align_fills(fills, close.index)
+    position = np.cumsum(np.nan_to_num(aligned["size"]))
+    cash = init_cash + np.cumsum(aligned["cash_flow"] - aligned["fixed_fees"])
+    return cash + position * close.to_numpy(dtype=np.float64)
+
+
+def drawdown(equity: np.ndarray) -> np.ndarray:
+    """
+    Relative distance (<= 0) of the equity to its running maximum.
+    """
+    return equity / np.maximum.accumulate(equity) - 1
+
+
+def portfolio_stats(
+    fills: dict[str, np.ndarray] | pd.DataFrame,
+    close: pd.Series,
+    init_cash: float,
+    positions: pd.DataFrame | dict[str, np.ndarray] | None = None,
+    periods_per_year: float | None = None,
+) -> dict[str, float]:
+    """
+    Statistics of the fills (`fills_arrays` or a `generate_order_fills_report()`) of a
+    single instrument valued at the `close` series, e.g. the bars of the backtest:
+    equity, return, maximum drawdown, annualized Sharpe/Sortino ratios of the per-row
+    returns (annualized from the median spacing of `close` if no `periods_per_year`),
+    turnover (traded notional / mean equity) and fees, plus the count, realized PnL and
+    win rate of the `positions` (`positions_arrays` or a `generate_positions_report()`,
+    with the snapshots of the NETTING positions).
+    """
+    if isinstance(fills, pd.DataFrame):
+        fills = fills_from_report(fills)
+    equity = equity_curve(fills, close, init_cash)
+    returns = np.diff(equity) / equity[:-1]
+    if periods_per_year is None:
+        spacing = np.median(np.diff(close.index.asi8)) if len(close) > 1 else 0
+        periods_per_year = YEAR_NS / spacing if spacing else 1.0
+    annualization = np.sqrt(periods_per_year)
+    volatility = returns.std(ddof=1) if len(returns) > 1 else np.nan
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2)) if len(returns) else 0
+    notional = fills["quantity"] @ fills["price"]
+    stats = {
+        "start_value": float(init_cash),
+        "end_value": float(equity[-1]) if len(equity) else float(init_cash),
+        "total_return": float(equity[-1] / init_cash - 1) if len(equity) else 0.0,
+        "max_drawdown": float(drawdown(equity).min()) if len(equity) else 0.0,
+        "sharpe_ratio": (
+            float(returns.mean() / volatility * annualization) if volatility else np.nan
+        ),
+        "sortino_ratio": (
+            float(returns.mean() / downside * annualization) if downside else np.nan
+        ),
+        "annualized_volatility": float(volatility * annualization),
+        "total_fills": len(fills["quantity"]),
+        "turnover": float(notional / equity.mean()) if len(equity) else 0.0,
+        "total_fees": float(fills["commission"].sum()),
+    }
+    if positions is not None:
+        pnls = realized_pnls(positions)
+        stats.update(
+            total_trades=len(pnls),
+            realized_pnl=float(pnls.sum()),
+            win_rate=float((pnls > 0).mean()) if len(pnls) else np.nan,
+        )
+    return stats
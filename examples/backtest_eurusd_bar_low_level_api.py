@@ -1,3 +1,4 @@
+import sys
 from typing import Literal
 from nautilus_trader.model import BarType, Money
 from nautilus_trader.model.instruments import Instrument
@@ -40,35 +41,107 @@ def get_engine(log_level: str = "ERROR"):
     return engine
 
 
-def get_data(instrument: Instrument, use_1m: bool = False):
-    # Add data
-    from data.binance_loader import BinanceKlineLoader
+def get_fill_model(
+    prob_fill_on_limit: float = 0.2,
+    prob_fill_on_stop: float = 0.95,
+    prob_slippage: float = 0.5,
+    random_seed: int | None = 42,
+):
+    from nautilus_trader.backtest.models import FillModel
+
+    return FillModel(
+        prob_fill_on_limit=prob_fill_on_limit,
+        prob_fill_on_stop=prob_fill_on_stop,
+        prob_slippage=prob_slippage,
+        random_seed=random_seed,
+    )
+
+
+def add_venue(engine, instrument: Instrument, init_cash: int, fill_model=None) -> None:
+    from nautilus_trader.model.enums import AccountType, OmsType
+
+    engine.add_venue(
+        venue=instrument.venue,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.CASH,
+        base_currency=None,
+        starting_balances=[
+            Money(1_000_000, instrument.base_currency),
+            Money(init_cash, instrument.quote_currency),
+        ],
+        fill_model=fill_model,
+    )
+
+
+def run_streaming(engine, batches, start=None, end=None) -> None:
+    """
+    Run the engine over batches of data (e.g. `BinanceTradesLoader().iter_range_ticks(...)`)
+    in streaming mode, so only one batch is held by the engine at a time.
+    Venue, instruments and strategies have to be added beforehand.
+    """
+    for batch in batches:
+        engine.add_data(batch)
+        engine.run(start=start, end=end, streaming=True)
+        engine.clear_data()
+    engine.end()
 
+
+def get_data_table(
+    instrument: Instrument,
+    use_1m: bool = False,
+    cache_dir: str | None = "cache",
+    shared_dir: str | None = None,
+):
+    """
+    The columnar (Arrow) bars of the day, see `get_data` for the objects.
+    """
+    from data.binance_loader import BinanceKlineLoader, attach_table
+
+    # NOTE: decoded klines are cached under `cache_dir` (relative to cwd), later runs skip the CSV parsing
+    loader = BinanceKlineLoader("1s", cache_dir=cache_dir)
+
+    kwargs = dict(
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+    )
     if use_1m:
         # BUG: not able to trigger the "internal aggregation"
-        ticks = BinanceKlineLoader("1s").get_date_symbol_ticks(
-            "2025-01-01",
-            instrument.id.value,
+        kwargs.update(
             target_freq="1-MINUTE",
             # ValueError: 'bar_type.aggregation_source' <flag 'AggregationSource'> of 2 was not equal to 'required source' <flag 'AggregationSource'> of 1
             need_agg=False,
-            price_precision=instrument.price_precision,
-            size_precision=instrument.size_precision,
         )
-    else:
-        ticks = BinanceKlineLoader("1s").get_date_symbol_ticks(
-            "2025-01-01",
-            instrument.id.value,
-            price_precision=instrument.price_precision,
-            size_precision=instrument.size_precision,
+
+    if shared_dir is not None:
+        # NOTE: the day is decoded once into shared memory, other processes attach to it zero-copy
+        return attach_table(
+            loader.publish_date_symbol(
+                "2025-01-01", instrument.id.value, shared_dir=shared_dir, **kwargs
+            )
         )
-    return ticks
+    symbol, venue = instrument.id.value.split(".")
+    return loader.df_to_table(
+        loader.get_date_symbol("2025-01-01", symbol), instrument.id.value, **kwargs
+    )
+
+
+def get_data(
+    instrument: Instrument,
+    use_1m: bool = False,
+    cache_dir: str | None = "cache",
+    shared_dir: str | None = None,
+):
+    from data.binance_loader import table_to_ticks
+
+    return table_to_ticks(get_data_table(instrument, use_1m, cache_dir, shared_dir))
 
 
 def get_strategy(
     instrument: Instrument,
     use_1m: bool = False,
     strategy_name: Literal["ema", "talib"] = "ema",
+    fast_ema_period: int = 10,
+    slow_ema_period: int = 20,
 ):
     from decimal import Decimal
 
@@ -87,8 +160,8 @@ def get_strategy(
                     if not use_1m
                     else BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-INTERNAL")
                 ),
-                fast_ema_period=10,
-                slow_ema_period=20,
+                fast_ema_period=fast_ema_period,
+                slow_ema_period=slow_ema_period,
                 trade_size=Decimal(1),
             )
 
@@ -125,33 +198,24 @@ if __name__ == "__main__":
     # Add venue
     # nautilus_trader.common.config.InvalidConfiguration: Cannot add an `Instrument` object without first adding its associated venue. Add the BINANCE venue using the `add_venue` method.
     # We need to add venue before adding instruments
-    from nautilus_trader.backtest.models import FillModel
-    from nautilus_trader.model.enums import AccountType, OmsType
-
-    fill_model = FillModel(
+    fill_model = get_fill_model(
         prob_fill_on_limit=0.2,
         prob_fill_on_stop=0.95,
         prob_slippage=0.5,
         random_seed=42,
     )
 
-    engine.add_venue(
-        venue=ETHUSDT_BINANCE.venue,
-        oms_type=OmsType.NETTING,
-        account_type=AccountType.CASH,
-        base_currency=None,
-        starting_balances=[
-            Money(1_000_000, ETHUSDT_BINANCE.base_currency),
-            Money(INIT_CASH, ETHUSDT_BINANCE.quote_currency),
-        ],
-        fill_model=fill_model,
-    )
+    add_venue(engine, ETHUSDT_BINANCE, INIT_CASH, fill_model)
 
     # Add instruments
     engine.add_instrument(ETHUSDT_BINANCE)
 
     # Add data
-    ticks = get_data(ETHUSDT_BINANCE, use_1m=USE_1M)
+    from data.binance_loader import table_to_ticks
+
+    # NOTE: the table is kept for the close prices of the analysis
+    bars = get_data_table(ETHUSDT_BINANCE, use_1m=USE_1M)
+    ticks = table_to_ticks(bars)
     engine.add_data(ticks)
 
     # Add strategy
@@ -180,80 +244,81 @@ if __name__ == "__main__":
     # BlockingIOError: [Errno 35] write could not complete without blocking
     print(positions_report := engine.trader.generate_positions_report())
 
+    from data.reports import (
+        check_numba_jit,
+        close_series,
+        fills_arrays,
+        from_orders_kwargs,
+    )
+
+    # NOTE: read from the cache (before it is reset), one row per fill
+    fills = fills_arrays(engine.cache.orders())
+
     # For repeated backtest runs make sure to reset the engine
     engine.reset()
 
     # Good practice to dispose of the object when done
     engine.dispose()
 
-    import os
-
-    # BUG (solved by disable numba): numba.core.errors.TypingError: Failed in nopython mode pipeline (step: nopython frontend)
-    os.environ["NUMBA_DISABLE_JIT"] = "1"
-    import vectorbt as vbt
-    import numpy as np
+    # NOTE: vectorbt (with numba and plotly) takes seconds to import, without it the
+    # stats are computed from the fills in NumPy (see `data.stats`)
+    USE_VECTORBT = True
+    if USE_VECTORBT:
+        import vectorbt as vbt
+
+        # NOTE: (fixed) numba.core.errors.TypingError: Failed in nopython mode pipeline (step: nopython frontend)
+        # came from the object columns of the fills report, it was worked around with
+        # NUMBA_DISABLE_JIT=1 (pure Python), the fill arrays are float64
+        USE_DETAIL_PRICE = False
+        if USE_DETAIL_PRICE:
+            # Every bar of the day, the fills aggregated onto the bars
+            # NOTE: (fixed) building the close from the `Bar` objects and passing the fills
+            # as is failed with a broadcast shape mismatch, there are fewer fills than bars
+            # and duplicate ts_init among them
+            pf = vbt.Portfolio.from_orders(
+                **from_orders_kwargs(fills, close=close_series(bars)),
+                init_cash=INIT_CASH,
+                freq="1s" if not USE_1M else "1m",
+            )
+        else:
+            # The engine commissions as fixed fees, fill prices already include slippage
+            pf = vbt.Portfolio.from_orders(
+                **from_orders_kwargs(fills),
+                init_cash=INIT_CASH,
+                freq="1s" if not USE_1M else "1m",
+            )
 
-    USE_TIME_INDEX = True
-    if USE_TIME_INDEX:
-        order_df = order_fills_report.reset_index().set_index("ts_init")
-    else:
-        order_df = order_fills_report
-
-    USE_DETAIL_PRICE = False
-    if USE_DETAIL_PRICE:
-        import pandas as pd
-        from vectorbt.base.reshape_fns import broadcast_to
-
-        close_price = pd.Series({tick.ts_init: tick.close for tick in ticks})
-        close_price.index = pd.to_datetime(close_price.index, unit="ns", utc=True)
-
-        # TODO: solve this
-        # BUG: ValueError: shape mismatch: objects cannot be broadcast to a single shape.  Mismatch is between arg 0 with shape (4756,) and arg 16 with shape (86400,).
-        # NOTE: there exist duplicate ts_init among different orders (non-unique)
-        pf = vbt.Portfolio.from_orders(
-            close=close_price,
-            price=order_df.avg_px.astype(float),
-            size=order_df.filled_qty.astype(float)
-            * np.where(order_df.side.eq("BUY"), 1, -1),
-            fees=ETHUSDT_BINANCE.taker_fee,
-            slippage=order_df.slippage.astype(float),
-            init_cash=INIT_CASH,
-            freq="1s" if not USE_1M else "1m",
-        )
+        check_numba_jit(compiled=True)
+
+        print(pf.stats())
+        pf.plot().show()
+        # pf.plot(
+        #     subplots=[
+        #         "orders",
+        #         "trade_pnl",
+        #         "cum_returns",
+        #         "drawdowns",
+        #         "underwater",
+        #         "asset_flow",
+        #         "asset_value",
+        #         "assets",
+        #         "cash",
+        #         "cash_flow",
+        #         "gross_exposure",
+        #         "net_exposure",
+        #         # "position_pnl",
+        #         # "positions",
+        #         "trades",
+        #         "value",
+        #     ]
+        # ).show()
     else:
-        pf = vbt.Portfolio.from_orders(
-            order_df.avg_px.astype(float),
-            size=order_df.filled_qty.astype(float)
-            * np.where(order_df.side.eq("BUY"), 1, -1),
-            fees=ETHUSDT_BINANCE.taker_fee,
-            slippage=order_df.slippage.astype(float),
-            init_cash=INIT_CASH,
-            freq="1s" if not USE_1M else "1m",
-        )
+        from data.stats import portfolio_stats
+
+        print(portfolio_stats(fills, close_series(bars), INIT_CASH))
+
+    # The debugger is only opened (and imported) from a terminal
+    if sys.stdin.isatty():
+        import ipdb
 
-    print(pf.stats())
-    pf.plot().show()
-    # pf.plot(
-    #     subplots=[
-    #         "orders",
-    #         "trade_pnl",
-    #         "cum_returns",
-    #         "drawdowns",
-    #         "underwater",
-    #         "asset_flow",
-    #         "asset_value",
-    #         "assets",
-    #         "cash",
-    #         "cash_flow",
-    #         "gross_exposure",
-    #         "net_exposure",
-    #         # "position_pnl",
-    #         # "positions",
-    #         "trades",
-    #         "value",
-    #     ]
-    # ).show()
-
-    import ipdb
-
-    ipdb.set_trace()
+        ipdb.set_trace()
@@ -1,3 +1,4 @@
+import sys
 from decimal import Decimal
 from nautilus_trader.model.instruments import Instrument
 from pathlib import Path
@@ -25,22 +26,38 @@ def get_instrument() -> Instrument:
     return ETHUSDT_BINANCE
 
 
-def prepare_data(instrument: Instrument) -> ParquetDataCatalog:
-    from data.binance_loader import BinanceAggTradesLoader
+def prepare_data(
+    instrument: Instrument, start: str = "2025-01-01", end: str = "2025-01-01"
+) -> ParquetDataCatalog:
+    """
+    Incrementally prepare the catalog: only the days of ticks which are not yet
+    in the catalog manifest are loaded and written, one file per day.
+
+    NOTE: the ticks of a catalog written by the former version (`part-0.parquet`) are
+    not in the manifest, `ingest_to_catalog` refuses to add days next to them
+    """
+    from data.binance_loader import BinanceAggTradesLoader, ingest_to_catalog
 
-    ticks = BinanceAggTradesLoader().get_date_symbol_ticks(
-        "2025-01-01", instrument.id.value
-    )
     catalog_path = Path.cwd() / "catalog"
 
     # Create a catalog instance
     catalog = ParquetDataCatalog(catalog_path)
 
     # Write instrument to the catalog
-    catalog.write_data([instrument])
-
-    # Write ticks to catalog
-    catalog.write_data(ticks)
+    if not catalog.instruments(instrument_ids=[instrument.id.value]):
+        catalog.write_data([instrument])
+
+    # Write missing days of ticks to catalog
+    written = ingest_to_catalog(
+        BinanceAggTradesLoader(),
+        catalog_path,
+        start,
+        end,
+        instrument.id.value,
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+    )
+    print(f"Ingested {len(written)} new day(s) of ticks: {written}")
 
     print(catalog.instruments())
 
@@ -93,6 +110,8 @@ if __name__ == "__main__":
     results = node.run()
     print(results)
 
-    import ipdb
+    # The debugger is only opened (and imported) from a terminal
+    if sys.stdin.isatty():
+        import ipdb
 
-    ipdb.set_trace()
+        ipdb.set_trace()
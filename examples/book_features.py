@@ -0,0 +1,176 @@
+from bisect import bisect_left, insort
+import numpy as np
+from nautilus_trader.model import OrderBookDelta, OrderBookDeltas, OrderBookDepth10
+from nautilus_trader.model.enums import BookAction, OrderSide
+from nautilus_trader.model.objects import FIXED_SCALAR
+
+# Top of book features maintained incrementally from the book updates, so order book
+# strategies can read them on every delta instead of querying the `OrderBook`
+
+BID, ASK = 0, 1
+# Plain ints compare faster than the enum members in the update path
+_CLEAR = int(BookAction.CLEAR)
+_DELETE = int(BookAction.DELETE)
+_BUY = int(OrderSide.BUY)
+FEATURES = ["mid", "spread", "weighted_mid", "imbalance", "microprice"]
+
+
+class BookFeatures:
+    """
+    Mid, spread, weighted mid, `levels`-level imbalance and microprice of an L2 book,
+    updated from `OrderBookDelta`/`OrderBookDepth10` in O(1) per changed level
+    (plus a bisection of the side).
+
+    - weighted_mid: best bid/ask weighted by the opposite best sizes
+    - imbalance: (bid depth - ask depth) / (bid depth + ask depth) over `levels` levels
+    - microprice: best bid/ask weighted by the opposite `levels`-level depths
+
+    Each side is a sorted list of raw prices (negated for bids, so both are best first)
+    with the raw size of each level, and the raw depth of its first `levels` levels.
+    Raw integers keep the incremental depths exact.
+    Features are NaN while a side is empty.
+    """
+
+    def __init__(self, levels: int = 5):
+        self.levels = levels
+        self._keys: tuple[list[int], list[int]] = ([], [])
+        self._sizes: tuple[dict[int, int], dict[int, int]] = ({}, {})
+        self._depth = [0, 0]
+
+    def clear(self) -> None:
+        for side in (BID, ASK):
+            self._keys[side].clear()
+            self._sizes[side].clear()
+        self._depth = [0, 0]
+
+    def apply_delta(self, delta: OrderBookDelta) -> None:
+        action = delta.action
+        if action == _CLEAR:
+            self.clear()
+            return
+        order = delta.order
+        if order.side == _BUY:
+            side = BID
+            key = -order.price.raw
+        else:
+            side = ASK
+            key = order.price.raw
+        size = order.size.raw
+        if action == _DELETE or size == 0:
+            self._delete(side, key)
+        else:
+            self._set(side, key, size)
+
+    def apply_deltas(self, deltas: OrderBookDeltas) -> None:
+        for delta in deltas.deltas:
+            self.apply_delta(delta)
+
+    def apply_depth(self, depth: OrderBookDepth10) -> None:
+        """
+        Replace the book by the (up to 10) levels of the depth snapshot.
+        """
+        self.clear()
+        for side, orders, sign in ((BID, depth.bids, -1), (ASK, depth.asks, 1)):
+            keys = self._keys[side]
+            sizes = self._sizes[side]
+            for order in orders:
+                size = order.size.raw
+                # Padding levels have a zero size
+                if size:
+                    key = sign * order.price.raw
+                    if key not in sizes:
+                        keys.append(key)
+                    sizes[key] = size
+            keys.sort()
+            self._depth[side] = sum(sizes[key] for key in keys[: self.levels])
+
+    def _set(self, side: int, key: int, size: int) -> None:
+        keys = self._keys[side]
+        sizes = self._sizes[side]
+        levels = self.levels
+        old_size = sizes.get(key)
+        sizes[key] = size
+        if old_size is not None:
+            if len(keys) <= levels or key <= keys[levels - 1]:
+                self._depth[side] += size - old_size
+            return
+        insort(keys, key)
+        if len(keys) <= levels:
+            self._depth[side] += size
+        elif key <= keys[levels - 1]:
+            # The new level pushes the last one out of the first `levels`
+            self._depth[side] += size - sizes[keys[levels]]
+
+    def _delete(self, side: int, key: int) -> None:
+        sizes = self._sizes[side]
+        old_size = sizes.pop(key, None)
+        if old_size is None:
+            return
+        keys = self._keys[side]
+        levels = self.levels
+        index = bisect_left(keys, key)
+        del keys[index]
+        if index < levels:
+            # The next level (if any) moves into the first `levels`
+            self._depth[side] += -old_size + (
+                sizes[keys[levels - 1]] if len(keys) >= levels else 0
+            )
+
+    @property
+    def best_bid(self) -> float:
+        keys = self._keys[BID]
+        return -keys[0] / FIXED_SCALAR if keys else np.nan
+
+    @property
+    def best_ask(self) -> float:
+        keys = self._keys[ASK]
+        return keys[0] / FIXED_SCALAR if keys else np.nan
+
+    @property
+    def mid(self) -> float:
+        return (self.best_bid + self.best_ask) / 2
+
+    @property
+    def spread(self) -> float:
+        return self.best_ask - self.best_bid
+
+    @property
+    def weighted_mid(self) -> float:
+        bid_keys, ask_keys = self._keys
+        if not bid_keys or not ask_keys:
+            return np.nan
+        bid_size = self._sizes[BID][bid_keys[0]]
+        ask_size = self._sizes[ASK][ask_keys[0]]
+        return (-bid_keys[0] * ask_size + ask_keys[0] * bid_size) / (
+            (bid_size + ask_size) * FIXED_SCALAR
+        )
+
+    @property
+    def imbalance(self) -> float:
+        bid_depth, ask_depth = self._depth
+        total = bid_depth + ask_depth
+        return (bid_depth - ask_depth) / total if total else np.nan
+
+    @property
+    def microprice(self) -> float:
+        bid_keys, ask_keys = self._keys
+        if not bid_keys or not ask_keys:
+            return np.nan
+        bid_depth, ask_depth = self._depth
+        return (-bid_keys[0] * ask_depth + ask_keys[0] * bid_depth) / (
+            (bid_depth + ask_depth) * FIXED_SCALAR
+        )
+
+    def to_array(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        The `FEATURES` as a float64 array (written into `out` if given, e.g. a row of a
+        preallocated feature matrix).
+        """
+        if out is None:
+            out = np.empty(len(FEATURES))
+        out[0] = self.mid
+        out[1] = self.spread
+        out[2] = self.weighted_mid
+        out[3] = self.imbalance
+        out[4] = self.microprice
+        return out
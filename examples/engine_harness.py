@@ -0,0 +1,109 @@
+import time
+from contextlib import contextmanager
+import pandas as pd
+from nautilus_trader.backtest.results import BacktestResult
+from nautilus_trader.model.instruments import Instrument
+from examples.backtest_eurusd_bar_low_level_api import add_venue, get_engine
+
+
+class EngineHarness:
+    """
+    Keep a `BacktestEngine` with its venue, instrument and sorted data loaded,
+    and run one strategy after another on it with warm `reset()` restarts.
+
+    Every phase is timed, see `timings`.
+    """
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        data: list,
+        init_cash: int = 10_000,
+        fill_model=None,
+        log_level: str = "ERROR",
+    ):
+        self.instrument = instrument
+        self.runs = 0
+        self._timings: list[dict] = []
+
+        with self._timed("build_engine"):
+            self.engine = get_engine(log_level=log_level)
+        with self._timed("add_venue"):
+            add_venue(self.engine, instrument, init_cash, fill_model)
+        with self._timed("add_instrument"):
+            self.engine.add_instrument(instrument)
+        # Data are sorted once here, `reset()` keeps them
+        with self._timed("add_data"):
+            self.engine.add_data(data)
+
+    @contextmanager
+    def _timed(self, phase: str):
+        start_time = time.perf_counter()
+        yield
+        self._timings.append(
+            {
+                "run": self.runs,
+                "phase": phase,
+                "seconds": time.perf_counter() - start_time,
+            }
+        )
+
+    @property
+    def timings(self) -> pd.DataFrame:
+        """
+        Seconds spent per phase, `run` 0 is the setup and the runs are numbered from 1.
+        """
+        return pd.DataFrame(self._timings)
+
+    def run(self, strategy, fill_model=None) -> BacktestResult:
+        """
+        Run `strategy` (a fresh instance per run) over the loaded data,
+        optionally with a different `fill_model` for the venue.
+
+        The reports of the run are available from `engine.trader` until the next run.
+        """
+        self.runs += 1
+        if self.runs > 1:
+            with self._timed("reset"):
+                self.engine.reset()
+                self.engine.clear_strategies()
+                # NOTE: resetting the execution engine also resets the cache, which drops
+                # the instrument (the venue and the engine data still have it)
+                self.engine.cache.add_instrument(self.instrument)
+        if fill_model is not None:
+            self.engine.change_fill_model(self.instrument.venue, fill_model)
+        with self._timed("add_strategy"):
+            self.engine.add_strategy(strategy=strategy)
+        with self._timed("run"):
+            self.engine.run()
+        with self._timed("get_result"):
+            result = self.engine.get_result()
+        return result
+
+    def dispose(self) -> None:
+        self.engine.dispose()
+
+
+if __name__ == "__main__":
+    # python -m examples.engine_harness
+    from examples.backtest_eurusd_bar_low_level_api import (
+        get_data,
+        get_instrument,
+        get_strategy,
+    )
+
+    ETHUSDT_BINANCE = get_instrument()
+    harness = EngineHarness(ETHUSDT_BINANCE, get_data(ETHUSDT_BINANCE))
+
+    for fast_ema_period, slow_ema_period in [(10, 20), (20, 50), (50, 100)]:
+        result = harness.run(
+            get_strategy(
+                ETHUSDT_BINANCE,
+                fast_ema_period=fast_ema_period,
+                slow_ema_period=slow_ema_period,
+            )
+        )
+        print(fast_ema_period, slow_ema_period, result.stats_pnls)
+
+    print(harness.timings.pivot_table(index="run", columns="phase", values="seconds"))
+    harness.dispose()
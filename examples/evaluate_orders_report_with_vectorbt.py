@@ -1,20 +1,20 @@
-import pandas as pd
-
-# import os
-# os.environ["NUMBA_DISABLE_JIT"] = "1"
 import vectorbt as vbt
+from data.reports import check_numba_jit, from_orders_kwargs, read_arrays
 
-# Assume you have run order_book_snapshot.py and saved the orders_report.csv
-orders_report = pd.read_csv("orders_report.csv")
+# Assume you have run order_book_snapshot.py and saved the fills.parquet
+fills = read_arrays("fills.parquet")
+if not len(fills["ts_event"]):
+    raise SystemExit("No fills in fills.parquet")
 
 pf = vbt.Portfolio.from_orders(
-    close=orders_report.price,
-    size=orders_report.quantity * orders_report.side.map({"BUY": 1, "SELL": -1}),
+    **from_orders_kwargs(fills),
     # TODO: inherit from the engine (or initial config)
     init_cash=1_000_000,
     freq="1s",
     group_by=None,
 )
+# The float64 arrays run JIT-compiled, without the former NUMBA_DISABLE_JIT=1
+check_numba_jit(compiled=True)
 
 print(pf.stats())
 pf.save("pf.pkl")
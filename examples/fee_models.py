@@ -0,0 +1,195 @@
+from decimal import Decimal
+from nautilus_trader.backtest.models import FeeModel
+from nautilus_trader.model.currencies import Currency
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import FIXED_PRECISION, Money, Price, Quantity
+from nautilus_trader.model.orders import Order
+
+# Fee models computing the commission of a fill in raw fixed-point integers: the rates of
+# an instrument are scaled once, and a fill only costs a few integer operations and a
+# lookup of the (reused) `Money`, instead of Decimal and `Money` temporaries
+# https://nautilustrader.io/docs/latest/concepts/backtesting#fee-models
+
+SCALAR = 10**FIXED_PRECISION
+
+
+def to_raw_rate(rate: Decimal | str | float) -> int:
+    """
+    A rate (fee per contract, fraction of notional, ...) scaled by 10^FIXED_PRECISION.
+    """
+    return int(Decimal(str(rate)).scaleb(FIXED_PRECISION).to_integral_value())
+
+
+def round_div(numerator: int, denominator: int) -> int:
+    """
+    numerator / denominator rounded half away from zero (like `Money`), for an even
+    denominator > 0.
+    """
+    if numerator >= 0:
+        return (numerator + (denominator >> 1)) // denominator
+    return -((-numerator + (denominator >> 1)) // denominator)
+
+
+class _InstrumentFees:
+    __slots__ = ("currency", "step", "denominator", "maker", "taker", "money")
+
+    def __init__(
+        self, currency: Currency, maker: int, taker: int, denominator: int = SCALAR
+    ):
+        self.currency = currency
+        # Raw value of one unit of the currency precision
+        self.step = 10 ** (FIXED_PRECISION - currency.precision)
+        # Turns (raw rate * raw quantity [* raw price]) into units of the precision
+        self.denominator = denominator * self.step
+        self.maker = maker
+        self.taker = taker
+        self.money: dict[int, Money] = {}
+
+
+class RawFeeModel(FeeModel):
+    """
+    Base of the fee models: the rates of each instrument are built once by
+    `instrument_fees`, `commission_units` returns the commission of a fill in units of
+    the currency precision and the `Money` of each amount is reused.
+
+    NOTE: `money_cache_size` bounds the reused amounts per instrument (cleared when full)
+    """
+
+    def __init__(self, money_cache_size: int = 4096):
+        super().__init__()
+        self.money_cache_size = money_cache_size
+        self._fees: dict[InstrumentId, _InstrumentFees] = {}
+        # Hashing an `InstrumentId` costs more than the commission, fills mostly come
+        # for the same instrument object in a row
+        self._last_instrument = None
+        self._last_fees = None
+
+    def instrument_fees(self, instrument: Instrument) -> _InstrumentFees:
+        raise NotImplementedError(
+            "Please implement the `instrument_fees` method in your fee model subclass."
+        )
+
+    def commission_units(
+        self, fees: _InstrumentFees, order: Order, qty_raw: int, px_raw: int
+    ) -> int:
+        raise NotImplementedError(
+            "Please implement the `commission_units` method in your fee model subclass."
+        )
+
+    def get_commission(
+        self,
+        order: Order,
+        fill_qty: Quantity,
+        fill_px: Price,
+        instrument: Instrument,
+    ) -> Money:
+        if instrument is self._last_instrument:
+            fees = self._last_fees
+        else:
+            fees = self._fees.get(instrument.id)
+            if fees is None:
+                fees = self._fees[instrument.id] = self.instrument_fees(instrument)
+            self._last_instrument = instrument
+            self._last_fees = fees
+        units = self.commission_units(fees, order, fill_qty.raw, fill_px.raw)
+        money = fees.money.get(units)
+        if money is None:
+            if len(fees.money) >= self.money_cache_size:
+                fees.money.clear()
+            money = fees.money[units] = Money.from_raw(units * fees.step, fees.currency)
+        return money
+
+
+class PerContractFeeModel(RawFeeModel):
+    """
+    A fixed `commission` per filled contract (e.g. 2.50 USD per contract).
+    """
+
+    def __init__(self, commission: Money, money_cache_size: int = 4096):
+        super().__init__(money_cache_size)
+        self.commission = commission
+
+    def instrument_fees(self, instrument: Instrument) -> _InstrumentFees:
+        rate = self.commission.raw
+        return _InstrumentFees(self.commission.currency, rate, rate)
+
+    def commission_units(
+        self, fees: _InstrumentFees, order: Order, qty_raw: int, px_raw: int
+    ) -> int:
+        return round_div(qty_raw * fees.taker, fees.denominator)
+
+
+class MakerTakerFeeModel(RawFeeModel):
+    """
+    A fraction of the fill notional, by liquidity side: the maker/taker fees of the
+    instrument, or of `fees` ({instrument ID: (maker fee, taker fee)}) to model the fee
+    tier of each instrument. Negative fees are rebates.
+
+    Like the Nautilus `MakerTakerFeeModel`, inverse instruments pay in the base currency.
+    """
+
+    def __init__(
+        self,
+        fees: (
+            dict[str, tuple[Decimal | str | float, Decimal | str | float]] | None
+        ) = None,
+        money_cache_size: int = 4096,
+    ):
+        super().__init__(money_cache_size)
+        self.fees = {
+            InstrumentId.from_str(str(instrument_id)): rates
+            for instrument_id, rates in (fees or {}).items()
+        }
+
+    def get_rates(self, instrument: Instrument) -> tuple[Decimal, Decimal]:
+        return self.fees.get(
+            instrument.id, (instrument.maker_fee, instrument.taker_fee)
+        )
+
+    def instrument_fees(self, instrument: Instrument) -> _InstrumentFees:
+        maker, taker = self.get_rates(instrument)
+        # The multiplier is folded into the rates
+        multiplier = instrument.multiplier.as_decimal()
+        return _InstrumentFees(
+            (
+                instrument.base_currency
+                if instrument.is_inverse
+                else instrument.quote_currency
+            ),
+            to_raw_rate(Decimal(str(maker)) * multiplier),
+            to_raw_rate(Decimal(str(taker)) * multiplier),
+            # Inverse notionals divide by the price (see `commission_units`)
+            denominator=1 if instrument.is_inverse else SCALAR * SCALAR,
+        )
+
+    def commission_units(
+        self, fees: _InstrumentFees, order: Order, qty_raw: int, px_raw: int
+    ) -> int:
+        liquidity_side = order.liquidity_side
+        if liquidity_side == LiquiditySide.TAKER:
+            rate = fees.taker
+        elif liquidity_side == LiquiditySide.MAKER:
+            rate = fees.maker
+        else:
+            raise ValueError(
+                f"invalid `LiquiditySide`, was {LiquiditySide(liquidity_side).name}"
+            )
+        if fees.denominator == fees.step:
+            # Inverse, notional in base currency: quantity * multiplier / price
+            return round_div(qty_raw * rate, px_raw * fees.step)
+        return round_div(qty_raw * px_raw * rate, fees.denominator)
+
+
+class BpsFeeModel(MakerTakerFeeModel):
+    """
+    `bps` basis points of the fill notional, for every instrument and liquidity side.
+    """
+
+    def __init__(self, bps: Decimal | str | float, money_cache_size: int = 4096):
+        super().__init__(money_cache_size=money_cache_size)
+        self.rate = Decimal(str(bps)) / 10_000
+
+    def get_rates(self, instrument: Instrument) -> tuple[Decimal, Decimal]:
+        return self.rate, self.rate
@@ -1,12 +1,14 @@
+import numpy as np
 from nautilus_trader.model import OrderBook
-from nautilus_trader.model import BookOrder
 from nautilus_trader.model.enums import OrderSide, BookType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.model.identifiers import Venue, InstrumentId
 from nautilus_trader.core.datetime import dt_to_unix_nanos
 from datetime import datetime
-from nautilus_trader.model.currencies import USD
-from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.model.currencies import USD, BTC
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.trading.strategy import Strategy
+from data.order_book import snapshot_deltas
 
 # Step 1: Define a simple instrument (e.g., BTC/USD on Binance)
 venue = Venue("BINANCE")
@@ -15,12 +17,10 @@ instrument = TestInstrumentProvider.default_fx_ccy("BTC/USD", venue=venue)
 
 
 # Step 2: Create a 5-level order book snapshot
-# BUG
-# [ERROR] BACKTESTER-001.DataEngine: Cannot handle data: unrecognized type <class 'nautilus_trader.model.book.OrderBook'> OrderBook L3_MBO
-# instrument: BTC/USD.BINANCE
-# sequence: 0
-# ts_last: 1741780800000000000
-# update_count: 10
+# NOTE: an `OrderBook` is not data, the engine rejected it with
+# [ERROR] BACKTESTER-001.DataEngine: Cannot handle data: unrecognized type <class 'nautilus_trader.model.book.OrderBook'>
+# so the snapshot is built as an `OrderBookDeltas` batch (CLEAR + one ADD per order),
+# which both seeds an `OrderBook` and goes to `BacktestEngine.add_data`
 # ╭──────┬─────────────┬──────╮
 # │ bids │ price       │ asks │
 # ├──────┼─────────────┼──────┤
@@ -31,13 +31,9 @@ instrument = TestInstrumentProvider.default_fx_ccy("BTC/USD", venue=venue)
 # │ [1]  │ 19490.00000 │      │
 # │ [1]  │ 19480.00000 │      │
 # ╰──────┴─────────────┴──────╯
-def create_order_book_snapshot(instrument_id: InstrumentId, ts_init: int):
-    order_book = OrderBook(
-        instrument_id=instrument_id,
-        # book_type=BookType.L2_MBP,  # Level 2 Market By Price
-        book_type=BookType.L3_MBO,  # Level 3 Market By Order
-    )
-
+def create_order_book_snapshot(
+    instrument_id: InstrumentId, ts_init: int
+) -> OrderBookDeltas:
     # Simulated 5-level bid and ask data (price, volume)
     bids = [
         (19500.0, 1.0),  # Level 1
@@ -53,30 +49,95 @@ def create_order_book_snapshot(instrument_id: InstrumentId, ts_init: int):
         (19540.0, 0.6),  # Level 4
         (19550.0, 0.5),  # Level 5
     ]
+    prices, sizes = np.array(bids + asks).T
+    return snapshot_deltas(
+        instrument_id.value,
+        sides=np.repeat([OrderSide.BUY, OrderSide.SELL], [len(bids), len(asks)]),
+        prices=prices,
+        sizes=sizes,
+        order_ids=np.arange(len(bids) + len(asks)),
+        ts_event=ts_init,
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+    )
 
-    # Add bids
-    for i, (price, volume) in enumerate(bids):
-        order = BookOrder(
-            price=Price(price, instrument.price_precision),
-            size=Quantity(volume, instrument.size_precision),
-            side=OrderSide.BUY,
-            order_id=i,
-        )
-        order_book.add(order, ts_init)
 
-    # Add asks
-    for i, (price, volume) in enumerate(asks, start=len(bids)):
-        order = BookOrder(
-            price=Price(price, instrument.price_precision),
-            size=Quantity(volume, instrument.size_precision),
-            side=OrderSide.SELL,
-            order_id=i,
-        )
-        order_book.add(order, ts_init)
+def create_random_order_book_snapshot(
+    instrument_id: InstrumentId,
+    ts_init: int,
+    num_orders: int = 50_000,
+    mid_price: float = 19505.0,
+    seed: int = 42,
+) -> OrderBookDeltas:
+    """
+    A deep L3 book of `num_orders` resting orders (several per price level).
+    """
+    rng = np.random.default_rng(seed)
+    sides = np.where(rng.random(num_orders) < 0.5, OrderSide.BUY, OrderSide.SELL)
+    ticks = rng.integers(1, 1_000, num_orders)
+    prices = np.where(sides == OrderSide.BUY, mid_price - ticks, mid_price + ticks)
+    return snapshot_deltas(
+        instrument_id.value,
+        sides=sides,
+        prices=prices,
+        sizes=rng.integers(1, 10, num_orders).astype(np.float64),
+        order_ids=np.arange(1, num_orders + 1),
+        ts_event=ts_init,
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+    )
 
+
+def create_order_book(deltas: OrderBookDeltas) -> OrderBook:
+    order_book = OrderBook(
+        instrument_id=deltas.instrument_id,
+        # book_type=BookType.L2_MBP,  # Level 2 Market By Price
+        book_type=BookType.L3_MBO,  # Level 3 Market By Order
+    )
+    order_book.apply_deltas(deltas)
     return order_book
 
 
-# Create and add the order book snapshot
-ts_init = dt_to_unix_nanos(datetime(2025, 3, 12, 12, 0, 0))
-print(create_order_book_snapshot(instrument_id, ts_init).pprint(num_levels=5))
+class PrintOrderBookStrategy(Strategy):
+    def on_start(self):
+        self.subscribe_order_book_deltas(instrument_id, BookType.L3_MBO)
+
+    def on_stop(self):
+        print(self.cache.order_book(instrument_id).pprint(num_levels=3))
+
+
+def run_backtest(deltas: OrderBookDeltas) -> None:
+    from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+    from nautilus_trader.config import LoggingConfig
+    from nautilus_trader.model.enums import AccountType, OmsType
+    from nautilus_trader.model.objects import Money
+
+    engine = BacktestEngine(
+        BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"))
+    )
+    engine.add_venue(
+        venue,
+        OmsType.NETTING,
+        AccountType.CASH,
+        base_currency=None,
+        starting_balances=[Money(1_000_000, USD), Money(10, BTC)],
+        book_type=BookType.L3_MBO,
+    )
+    engine.add_instrument(instrument)
+    # The whole book in one shot
+    engine.add_data([deltas])
+    engine.add_strategy(PrintOrderBookStrategy())
+    engine.run()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    # python -m examples.mock_orderbook
+    # Create and add the order book snapshot
+    ts_init = dt_to_unix_nanos(datetime(2025, 3, 12, 12, 0, 0))
+    print(
+        create_order_book(create_order_book_snapshot(instrument_id, ts_init)).pprint(
+            num_levels=5
+        )
+    )
+    run_backtest(create_random_order_book_snapshot(instrument_id, ts_init))
@@ -0,0 +1,108 @@
+from collections.abc import Iterable, Sequence
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model import BookOrder
+from nautilus_trader.model.enums import OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.model.orders import LimitOrder
+
+# Helpers of the strategies placing many limit orders per book update: the `Price` and
+# `Quantity` objects are built once per value and reused, and ladders of orders are
+# created together to be submitted as one `OrderList` (see `OrderBookStrategy.submit_orders`)
+
+
+class OrderValues:
+    """
+    The `Price`/`Quantity` objects of an instrument, built once per raw value.
+
+    NOTE: `cache_size` bounds the reused objects of each kind (cleared when full)
+    """
+
+    def __init__(self, instrument: Instrument, cache_size: int = 65_536):
+        self.price_precision = instrument.price_precision
+        self.size_precision = instrument.size_precision
+        # Raw values of one tick and one lot
+        self.tick = instrument.price_increment.raw
+        self.lot = instrument.size_increment.raw
+        self.cache_size = cache_size
+        self._prices: dict[int, Price] = {}
+        self._quantities: dict[int, Quantity] = {}
+
+    def price(self, raw: int) -> Price:
+        price = self._prices.get(raw)
+        if price is None:
+            if len(self._prices) >= self.cache_size:
+                self._prices.clear()
+            price = self._prices[raw] = Price.from_raw(raw, self.price_precision)
+        return price
+
+    def quantity(self, raw: int) -> Quantity:
+        quantity = self._quantities.get(raw)
+        if quantity is None:
+            if len(self._quantities) >= self.cache_size:
+                self._quantities.clear()
+            quantity = self._quantities[raw] = Quantity.from_raw(
+                raw, self.size_precision
+            )
+        return quantity
+
+    def price_ladder(
+        self, start: Price, levels: int, step_ticks: int = 1, away: int = -1
+    ) -> list[Price]:
+        """
+        `levels` prices from `start`, `step_ticks` ticks apart (downwards for bids with
+        `away=-1`, upwards for asks with `away=1`).
+        """
+        step = away * step_ticks * self.tick
+        return [self.price(start.raw + level * step) for level in range(levels)]
+
+    def quantity_ladder(
+        self, lots: int, levels: int, step_lots: int = 0
+    ) -> list[Quantity]:
+        """
+        `levels` quantities of `lots` lots, growing by `step_lots` lots per level.
+        """
+        return [
+            self.quantity((lots + level * step_lots) * self.lot)
+            for level in range(levels)
+        ]
+
+
+def limit_orders(
+    order_factory: OrderFactory,
+    instrument_id: InstrumentId,
+    order_side: OrderSide,
+    prices: Sequence[Price],
+    quantities: Quantity | Sequence[Quantity],
+    time_in_force: TimeInForce = TimeInForce.GTC,
+    post_only: bool = False,
+    reduce_only: bool = False,
+) -> list[LimitOrder]:
+    """
+    One limit order per price (e.g. a ladder across the depth levels), of the same
+    quantity or of one quantity per price.
+    """
+    if isinstance(quantities, Quantity):
+        quantities = [quantities] * len(prices)
+    limit = order_factory.limit
+    return [
+        limit(
+            instrument_id=instrument_id,
+            order_side=order_side,
+            quantity=quantity,
+            price=price,
+            time_in_force=time_in_force,
+            post_only=post_only,
+            reduce_only=reduce_only,
+        )
+        for price, quantity in zip(prices, quantities)
+    ]
+
+
+def depth_prices(orders: Iterable[BookOrder], depth: int = 10) -> list[Price]:
+    """
+    The prices of the first `depth` levels of `OrderBookDepth10.bids`/`asks`
+    (without the zero size padding levels).
+    """
+    return [order.price for order in orders if order.size.raw][:depth]
@@ -1,21 +1,23 @@
 from nautilus_trader.model import OrderBook
-from nautilus_trader.model import BookOrder
-from nautilus_trader.model import OrderBookDelta
 from nautilus_trader.model import OrderBookDepth10
 from nautilus_trader.model.enums import OrderSide, BookType, TimeInForce
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
-from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.model.identifiers import Venue, InstrumentId
 from nautilus_trader.core.datetime import dt_to_unix_nanos
 from datetime import datetime
 from nautilus_trader.model.enums import OmsType, AccountType
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model import Money
-from nautilus_trader.backtest.models import FeeModel
 from nautilus_trader.model.objects import Price, Quantity
 from decimal import Decimal
 import random
+import numpy as np
+from nautilus_trader.model.data import OrderBookDeltas
+from data.order_book import depth10_from_arrays, snapshot_deltas
+from data.reports import fills_arrays, positions_arrays, write_arrays
+from examples.fee_models import PerContractFeeModel
+from examples.order_book_strategy import OrderBookStrategy, OrderBookStrategyConfig
 
 # Step 1: Define a simple instrument (e.g., BTC/USD on Binance)
 venue = Venue("BINANCE")
@@ -23,153 +25,113 @@ instrument_id = InstrumentId.from_str("BTC/USD.BINANCE")
 instrument = TestInstrumentProvider.default_fx_ccy("BTC/USD", venue=venue)
 
 
-# Step 2: Create a 5-level order book snapshot
-def create_order_book_snapshot(
-    instrument_id: InstrumentId,
-    ts_init: int,
-    sequence: int = 0,
-    base_price: float = 19500.0,
-    min_quantity: int = 10000,
-):
+# Step 2: Create 5-level order book snapshots
+def mock_levels(
+    base_prices: np.ndarray, min_quantity: int = 10000
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (N, 5) bid prices, ask prices and sizes around each base price
+    """
+    levels = np.arange(5)
+    base_prices = np.asarray(base_prices, dtype=np.float64)[:, None]
+
     # Generate mock prices around the base price (only 5 levels)
-    bid_prices = [base_price * (1 - 0.001 * (level + 1)) for level in range(5)]
-    ask_prices = [base_price * (1 + 0.001 * (level + 1)) for level in range(5)]
+    bid_prices = base_prices * (1 - 0.001 * (levels + 1))
+    ask_prices = base_prices * (1 + 0.001 * (levels + 1))
 
     # Generate mock sizes for 5 levels
-    bid_sizes = [min_quantity + level * min_quantity for level in range(5)]
-    ask_sizes = [min_quantity + level * min_quantity for level in range(5)]
-
-    # Create BookOrder objects for active levels (first 5)
-    bids = [
-        BookOrder(
-            side=OrderSide.BUY,
-            price=Price(Decimal(str(price)), 5),
-            size=Quantity(Decimal(str(size)), 1),
-            order_id=sequence * 1000 + idx,
-        )
-        for idx, (price, size) in enumerate(zip(bid_prices, bid_sizes))
-    ]
-
-    # Add empty orders for remaining levels (with zero quantity)
-    bids.extend(
-        [
-            BookOrder(
-                side=OrderSide.BUY,
-                price=Price(Decimal(str(bid_prices[-1])), 5),
-                size=Quantity(Decimal("0"), 1),
-                order_id=sequence * 1000 + idx + 5,
-            )
-            for idx in range(5)
-        ]
-    )
-
-    asks = [
-        BookOrder(
-            side=OrderSide.SELL,
-            price=Price(Decimal(str(price)), 5),
-            size=Quantity(Decimal(str(size)), 1),
-            order_id=(sequence * 1000 + idx + 500),
-        )
-        for idx, (price, size) in enumerate(zip(ask_prices, ask_sizes))
-    ]
-
-    # Add empty orders for remaining levels (with zero quantity)
-    asks.extend(
-        [
-            BookOrder(
-                side=OrderSide.SELL,
-                price=Price(Decimal(str(ask_prices[-1])), 5),
-                size=Quantity(Decimal("0"), 1),
-                order_id=sequence * 1000 + idx + 505,
-            )
-            for idx in range(5)
-        ]
+    sizes = np.broadcast_to(
+        (min_quantity + levels * min_quantity).astype(np.float64), bid_prices.shape
     )
+    return bid_prices, ask_prices, sizes
 
-    ts_now = ts_init
 
-    # https://nautilustrader.io/docs/latest/api_reference/model/book/
-    # https://nautilustrader.io/docs/latest/api_reference/model/data/#class-orderbookdepth10
-    depth = OrderBookDepth10(
-        instrument_id=instrument_id,
-        bids=bids,
-        asks=asks,
-        bid_counts=[5, 4, 3, 2, 1, 0, 0, 0, 0, 0],  # Only 5 levels have counts
-        ask_counts=[5, 4, 3, 2, 1, 0, 0, 0, 0, 0],  # Only 5 levels have counts
-        flags=0,
-        sequence=sequence,
-        ts_event=ts_now,
-        ts_init=ts_now,
-    )
+def create_order_book_snapshots(
+    instrument_id: InstrumentId,
+    ts_inits: np.ndarray,
+    base_prices: np.ndarray,
+    min_quantity: int = 10000,
+) -> list[OrderBookDepth10]:
+    """
+    One snapshot per (ts_init, base_price), built in bulk from (N, 10) level arrays
+    """
+    bid_prices, ask_prices, sizes = mock_levels(base_prices, min_quantity)
 
     # BUG: we cannot only pass in 5 levels, we need to pass in 10 levels
     # thread '<unnamed>' panicked at crates/model/src/enums.rs:844:18:
     # Order invariant failed: side must be `Buy` or `Sell`
-    # note: run with `RUST_BACKTRACE=1` environment variable to display a backtrace
-    # [1]    1411 abort      python examples/order_book_snapshot.py
-    # depth = OrderBookDepth10(
-    #     instrument_id=instrument_id,
-    #     bids=bids[:5],
-    #     asks=asks[:5],
-    #     bid_counts=[5, 4, 3, 2, 1, 0, 0, 0, 0, 0][:5],  # Only 5 levels have counts
-    #     ask_counts=[5, 4, 3, 2, 1, 0, 0, 0, 0, 0][:5],  # Only 5 levels have counts
-    #     flags=0,
-    #     sequence=sequence,
-    #     ts_event=ts_now,
-    #     ts_init=ts_now,
-    # )
-
-    return depth
+    # So the remaining levels repeat the last price with zero quantity
+    def pad(values: np.ndarray, fill: np.ndarray | float) -> np.ndarray:
+        return np.concatenate(
+            [values, np.broadcast_to(fill, values.shape).astype(values.dtype)], axis=1
+        )
 
+    # Only 5 levels have counts
+    counts = np.broadcast_to(
+        np.array([5, 4, 3, 2, 1, 0, 0, 0, 0, 0]), (len(ts_inits), 10)
+    )
 
-# Step 3: Define a simple strategy
-class SimpleOrderBookStrategy(Strategy):
+    # https://nautilustrader.io/docs/latest/api_reference/model/book/
+    # https://nautilustrader.io/docs/latest/api_reference/model/data/#class-orderbookdepth10
+    return depth10_from_arrays(
+        instrument_id.value,
+        bid_prices=pad(bid_prices, bid_prices[:, -1:]),
+        bid_sizes=pad(sizes, 0),
+        ask_prices=pad(ask_prices, ask_prices[:, -1:]),
+        ask_sizes=pad(sizes, 0),
+        ts_event=ts_inits,
+        price_precision=instrument.price_precision,
+        size_precision=instrument.size_precision,
+        bid_counts=counts,
+        ask_counts=counts,
+    )
 
-    def __init__(self, instrument_id: str):
-        super().__init__()
-        self.instrument_id = instrument_id
 
-    def on_start(self):
-        """Called when the strategy starts."""
-        self.log.info("Strategy starting...")
-        self.subscribe_order_book_at_interval(
-            self.instrument_id, book_type=BookType.L2_MBP
+def create_order_book_deltas(
+    instrument_id: InstrumentId,
+    ts_inits: np.ndarray,
+    base_prices: np.ndarray,
+    min_quantity: int = 10000,
+) -> list[OrderBookDeltas]:
+    """
+    The same snapshots as `OrderBookDeltas` batches (CLEAR + one ADD per level)
+
+    NOTE: the matching engine of the venue does not apply `OrderBookDepth10` to its
+    book, with the depths only it has no market and every FOK order was canceled
+    """
+    bid_prices, ask_prices, sizes = mock_levels(base_prices, min_quantity)
+    sides = np.repeat([OrderSide.BUY, OrderSide.SELL], 5)
+    return [
+        snapshot_deltas(
+            instrument_id.value,
+            sides=sides,
+            prices=np.r_[bids, asks],
+            sizes=np.r_[size, size],
+            order_ids=np.arange(10),
+            ts_event=int(ts_init),
+            price_precision=instrument.price_precision,
+            size_precision=instrument.size_precision,
         )
-        self.subscribe_order_book_deltas(self.instrument_id, book_type=BookType.L2_MBP)
+        for ts_init, bids, asks, size in zip(ts_inits, bid_prices, ask_prices, sizes)
+    ]
 
-    def on_stop(self):
-        """Called when the strategy stops."""
-        # Unsubscribe from data
-        self.unsubscribe_order_book_deltas(self.instrument_id)
 
-    def on_order_book_delta(self, delta: OrderBookDelta) -> None:
-        """Called when order book delta is received."""
-        # Process order book delta updates
-        self.log.info(f"Received order book delta: {delta}")
+# Step 3: Define a simple strategy
+class SimpleOrderBookStrategy(OrderBookStrategy):
+    """
+    Diagnostics are sampled, e.g. `log_every=100` logs one book in 100
+    (the former full `pprint` and f-strings on every update dominated the runtime).
+    """
 
-    def on_order_book(self, snapshot: OrderBook) -> None:
+    def on_instrument_ready(self, instrument):
+        # Built once instead of on every book
+        self.trade_size = Quantity(Decimal("1000"), precision=0)  # 1000 BTC
+
+    def on_book(self, snapshot: OrderBook) -> None:
         """Called when order book snapshot is received."""
-        # Process the complete order book snapshot
         best_bid = snapshot.best_bid_price()
         best_ask = snapshot.best_ask_price()
 
-        # Add more detailed logging
-        self.log.info("Received order book snapshot:")
-        self.log.info(
-            f"Timestamp: {datetime.fromtimestamp(snapshot.ts_event / 1e9).strftime('%Y-%m-%d %H:%M:%S.%f')}"
-        )
-        self.log.info(f"Best Bid: {best_bid}, Best Ask: {best_ask}")
-
-        if best_bid and best_ask:
-            mid_price = (best_bid + best_ask) / 2
-            spread = best_ask - best_bid
-            self.log.info(f"Mid Price: {mid_price:.2f}, Spread: {spread:.2f}")
-
-        # Optional: Print full order book depth
-        self.log.info("\nFull Order Book:")
-        # self.log.info("\n" + snapshot.pprint(num_levels=5))  # Show top 5 levels
-        self.log.info("\n" + snapshot.pprint(num_levels=10))  # Show top 10 levels
-
         # NOTE: we are not able to submit market orders when we only have order book?!
         # NOTE: we are able to submit limit orders but somehow no cash changes?!
         # NOTE: maybe it is completely fine since we can just backtest using the orders with VectorBT
@@ -185,33 +147,27 @@ class SimpleOrderBookStrategy(Strategy):
                 # Place a buy order slightly below best ask
                 # price = best_ask * Decimal("0.9995")  # 0.05% below ask
                 price = best_ask
-                size = Quantity(Decimal("1000"), precision=0)  # 1000 BTC
 
                 # Create the order using order factory
                 # https://nautilustrader.io/docs/latest/concepts/orders#market
                 # order = self.order_factory.market(
                 #     instrument_id=self.instrument_id,
                 #     order_side=OrderSide.BUY,
-                #     quantity=size,
+                #     quantity=self.trade_size,
                 # )
 
                 # Create limit order instead
                 order = self.order_factory.limit(
                     instrument_id=self.instrument_id,
                     order_side=OrderSide.BUY,
-                    quantity=size,
+                    quantity=self.trade_size,
                     price=price,  # Using the calculated price slightly below ask
                     time_in_force=TimeInForce.FOK,  # Fill-or-Kill
                 )
-
-                # Submit the order
-                self.submit_order(order)
-                self.log.info(f"Submitted BUY LIMIT order: price={price}, size={size}")
             else:
                 # Place a sell order slightly above best bid
                 # price = best_bid * Decimal("1.0005")  # 0.05% above bid
                 price = best_bid
-                size = Quantity(Decimal("1000"), precision=0)  # 1000 BTC
                 # [WARN] BACKTESTER-001.RiskEngine: SubmitOrder for O-20250312-120008-001-000-1 DENIED: quantity 0.1 invalid (precision 1 > 0)
                 # [WARN] BACKTESTER-001.SimpleOrderBookStrategy: <--[EVT] OrderDenied(instrument_id=BTC/USD.BINANCE, client_order_id=O-20250312-120008-001-000-1, reason='quantity 0.1 invalid (precision 1 > 0)')
                 # [WARN] BACKTESTER-001.RiskEngine: SubmitOrder for O-20250312-120009-001-000-8 DENIED: quantity 1 invalid (< minimum trade size of 1000)
@@ -223,21 +179,20 @@ class SimpleOrderBookStrategy(Strategy):
                 # order = self.order_factory.market(
                 #     instrument_id=self.instrument_id,
                 #     order_side=OrderSide.SELL,
-                #     quantity=size,
+                #     quantity=self.trade_size,
                 # )
 
                 # Create limit order instead
                 order = self.order_factory.limit(
                     instrument_id=self.instrument_id,
                     order_side=OrderSide.SELL,
-                    quantity=size,
+                    quantity=self.trade_size,
                     price=price,  # Using the calculated price slightly above bid
                     time_in_force=TimeInForce.FOK,  # Fill-or-Kill
                 )
 
-                # Submit the order
-                self.submit_order(order)
-                self.log.info(f"Submitted SELL LIMIT order: price={price}, size={size}")
+            # Submit the order (the engine already logs the command and its events)
+            self.submit_order(order)
 
 
 # Step 4: Set up the backtest engine
@@ -246,27 +201,15 @@ engine = BacktestEngine()
 
 # Add venue and instrument
 # https://nautilustrader.io/docs/latest/concepts/instruments/#commissions
-
-
-class PerContractFeeModel(FeeModel):
-    def __init__(self, commission: Money):
-        super().__init__()
-        self.commission = commission
-
-    def get_commission(
-        self, Order_order, Quantity_fill_qty, Price_fill_px, Instrument_instrument
-    ):
-        total_commission = Money(
-            self.commission * Quantity_fill_qty, self.commission.currency
-        )
-        return total_commission
-
+# NOTE: computed in raw fixed-point integers (see examples/fee_models.py), the former
+# Decimal `self.commission * fill_qty` model built several temporaries per fill
 
 engine.add_venue(
     venue=venue,
     oms_type=OmsType.NETTING,
     account_type=AccountType.MARGIN,
     base_currency=USD,
+    book_type=BookType.L2_MBP,  # match against the levels of the deltas
     fee_model=PerContractFeeModel(
         Money(2.50, USD)
     ),  # Our custom fee-model injected here: 2.50 USD / per 1 filled contract
@@ -275,21 +218,24 @@ engine.add_venue(
 
 engine.add_instrument(instrument)
 
-# Create and add the order book snapshot
+# Create and add the order book snapshots
 ts_init = dt_to_unix_nanos(datetime(2025, 3, 12, 12, 0, 0))
-order_book_snapshots = [
-    create_order_book_snapshot(
-        instrument_id,
-        ts_init + i * 1_000_000_000,
-        sequence=i,
-        base_price=19500.0 * (1 + (0.0002 * (-1 if i % 2 == 0 else 1))),
-    )
-    for i in range(10)
-]
+steps = np.arange(10)
+ts_inits = ts_init + steps * 1_000_000_000
+base_prices = 19500.0 * (1 + 0.0002 * np.where(steps % 2 == 0, -1, 1))
+order_book_snapshots = create_order_book_snapshots(instrument_id, ts_inits, base_prices)
 engine.add_data(order_book_snapshots)
+engine.add_data(create_order_book_deltas(instrument_id, ts_inits, base_prices))
 
 # Add the strategy
-strategy = SimpleOrderBookStrategy(instrument_id=instrument_id)
+strategy = SimpleOrderBookStrategy(
+    OrderBookStrategyConfig(
+        instrument_id=instrument_id,
+        subscribe_depth=True,
+        feature_levels=5,
+        log_every=1,
+    )
+)
 engine.add_strategy(strategy=strategy)
 
 # Step 5: Run the backtest
@@ -302,5 +248,7 @@ print(account_report := engine.trader.generate_account_report(Venue("SIM")))
 print(orders_report := engine.trader.generate_orders_report())
 print(fills_report := engine.trader.generate_fills_report())
 
-# BlockingIOError: [Errno 35] write could not complete without blocking
-orders_report.to_csv("orders_report.csv")
+# Columnar fills/positions for examples/evaluate_orders_report_with_vectorbt.py
+# (instead of the orders report as CSV)
+write_arrays(fills_arrays(engine.cache.orders()), "fills.parquet")
+write_arrays(positions_arrays(engine.cache.positions()), "positions.parquet")
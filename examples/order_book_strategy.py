@@ -0,0 +1,244 @@
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.core.datetime import unix_nanos_to_iso8601
+from nautilus_trader.model import (
+    OrderBook,
+    OrderBookDelta,
+    OrderBookDeltas,
+    OrderBookDepth10,
+)
+from nautilus_trader.model.enums import BookType, OrderSide, TimeInForce
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Price, Quantity
+from nautilus_trader.model.orders import Order
+from nautilus_trader.trading.strategy import Strategy
+from examples.book_features import BookFeatures
+from examples.order_batching import OrderValues, limit_orders
+
+# Reusable base of the order book strategies: subscriptions, instrument precisions
+# resolved once, and sampled diagnostics which cost nothing on the updates not logged
+
+
+class OrderBookStrategyConfig(StrategyConfig, frozen=True):
+    """
+    `log_every` logs every Nth book and `log_interval_ns` at most one book per interval,
+    `log_deltas_every` every Nth delta (0 disables each of them, the default).
+    `feature_levels` > 0 maintains `BookFeatures` over that many levels from the deltas
+    (and from the `OrderBookDepth10` data if `subscribe_depth`).
+    """
+
+    instrument_id: InstrumentId
+    book_type: BookType = BookType.L2_MBP
+    interval_ms: int = 1000
+    subscribe_deltas: bool = True
+    subscribe_depth: bool = False
+    feature_levels: int = 0
+    log_every: int = 0
+    log_interval_ns: int = 0
+    log_levels: int = 10
+    log_deltas_every: int = 0
+
+
+class OrderBookStrategy(Strategy):
+    """
+    Subclasses implement `on_book` (and optionally `on_delta`), not the `on_order_book*`
+    handlers, and find the instrument and its precisions in `on_start` attributes.
+    `values` reuses the `Price`/`Quantity` objects of the instrument and
+    `submit_orders` submits many orders (e.g. ladders) as one command and
+    `quote_ladder` only replaces the quotes of a ladder which moved.
+    """
+
+    def __init__(self, config: OrderBookStrategyConfig):
+        super().__init__(config)
+        self.instrument_id = config.instrument_id
+        self.instrument: Instrument | None = None
+        self.price_precision = 0
+        self.size_precision = 0
+        self.values: OrderValues | None = None
+        self.book_count = 0
+        self.orders_submitted = 0
+        # The resting orders of `quote_ladder` by side and raw price
+        self._quotes: dict[OrderSide, dict[int, Order]] = {
+            OrderSide.BUY: {},
+            OrderSide.SELL: {},
+        }
+        self.delta_count = 0
+        self.features = (
+            BookFeatures(config.feature_levels) if config.feature_levels else None
+        )
+        self._log_every = config.log_every
+        self._log_interval_ns = config.log_interval_ns
+        self._log_deltas_every = config.log_deltas_every
+        self._next_log_ns = 0
+        # NOTE: there is no `subscribe_order_book_depth` in this version, but the data
+        # engine publishes every `OrderBookDepth10` on this topic
+        self._depth_topic = (
+            f"data.book.depth.{self.instrument_id.venue}.{self.instrument_id.symbol}"
+        )
+
+    def on_start(self):
+        self.instrument = self.cache.instrument(self.instrument_id)
+        if self.instrument is None:
+            self.log.error(f"Could not find instrument for {self.instrument_id}")
+            self.stop()
+            return
+        self.price_precision = self.instrument.price_precision
+        self.size_precision = self.instrument.size_precision
+        self.values = OrderValues(self.instrument)
+        self.on_instrument_ready(self.instrument)
+
+        self.subscribe_order_book_at_interval(
+            self.instrument_id,
+            book_type=self.config.book_type,
+            interval_ms=self.config.interval_ms,
+        )
+        if self.config.subscribe_deltas:
+            self.subscribe_order_book_deltas(
+                self.instrument_id, book_type=self.config.book_type
+            )
+        if self.config.subscribe_depth:
+            self.msgbus.subscribe(self._depth_topic, self.on_order_book_depth)
+
+    def on_stop(self):
+        if self.config.subscribe_deltas:
+            self.unsubscribe_order_book_deltas(self.instrument_id)
+        if self.config.subscribe_depth:
+            self.msgbus.unsubscribe(self._depth_topic, self.on_order_book_depth)
+        self.unsubscribe_order_book_at_interval(
+            self.instrument_id, interval_ms=self.config.interval_ms
+        )
+
+    def on_instrument_ready(self, instrument: Instrument) -> None:
+        """
+        Precompute the `Price`/`Quantity` objects used per update here.
+        """
+
+    def on_book(self, book: OrderBook) -> None:
+        """
+        Called for every book of the interval subscription.
+        """
+
+    def on_delta(self, delta: OrderBookDelta) -> None:
+        """
+        Called for every delta (if `subscribe_deltas`), after `features` are updated.
+        """
+
+    def on_depth(self, depth: OrderBookDepth10) -> None:
+        """
+        Called for every depth (if `subscribe_depth`), after `features` are updated.
+        """
+
+    def on_order_book(self, order_book: OrderBook) -> None:
+        self.book_count += 1
+        if self._log_due(order_book.ts_event):
+            self.log_book(order_book)
+        self.on_book(order_book)
+
+    def on_order_book_deltas(self, deltas: OrderBookDeltas) -> None:
+        # NOTE: subscribers get the deltas of each event as a batch (there is no
+        # `on_order_book_delta` handler, it was never called)
+        features = self.features
+        for delta in deltas.deltas:
+            self.delta_count += 1
+            if features is not None:
+                features.apply_delta(delta)
+            if (
+                self._log_deltas_every
+                and self.delta_count % self._log_deltas_every == 0
+            ):
+                self.log.info(f"Delta #{self.delta_count}: {delta!r}")
+            self.on_delta(delta)
+
+    def on_order_book_depth(self, depth: OrderBookDepth10) -> None:
+        if self.features is not None:
+            self.features.apply_depth(depth)
+        self.on_depth(depth)
+
+    def submit_orders(self, orders: list[Order]) -> None:
+        """
+        Submit the orders (of the instrument) as one `OrderList`: a single command
+        through the `RiskEngine` and the venue instead of one per order.
+
+        NOTE: the list is checked as a whole, if any order fails the pre-trade checks
+        all of them are denied
+        """
+        if not orders:
+            return
+        self.orders_submitted += len(orders)
+        if len(orders) == 1:
+            self.submit_order(orders[0])
+        else:
+            self.submit_order_list(self.order_factory.create_list(orders))
+
+    def quote_ladder(
+        self,
+        order_side: OrderSide,
+        prices: list[Price],
+        quantity: Quantity,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        post_only: bool = True,
+    ) -> None:
+        """
+        Keep one resting limit order of `quantity` at each of `prices` on the side:
+        only the orders off these prices are canceled (one `BatchCancelOrders`) and only
+        the missing prices are submitted (one `OrderList`).
+
+        NOTE: every order event costs the engine more with more open orders, so a ladder
+        moving by a few ticks is cheaper to shift than to cancel and submit again
+        """
+        quotes = self._quotes[order_side]
+        wanted = {price.raw for price in prices}
+        stale = []
+        for raw, order in list(quotes.items()):
+            if order.is_closed:
+                # Filled, canceled or denied
+                del quotes[raw]
+            elif raw not in wanted:
+                del quotes[raw]
+                stale.append(order)
+        if stale:
+            self.cancel_orders(stale)
+        orders = limit_orders(
+            self.order_factory,
+            self.instrument_id,
+            order_side,
+            [price for price in prices if price.raw not in quotes],
+            quantity,
+            time_in_force=time_in_force,
+            post_only=post_only,
+        )
+        for order in orders:
+            quotes[order.price.raw] = order
+        self.submit_orders(orders)
+
+    def _log_due(self, ts_event: int) -> bool:
+        if self._log_every and self.book_count % self._log_every == 0:
+            return True
+        if self._log_interval_ns and ts_event >= self._next_log_ns:
+            self._next_log_ns = ts_event + self._log_interval_ns
+            return True
+        return False
+
+    def log_book(self, book: OrderBook) -> None:
+        """
+        The diagnostics of a sampled book, only formatted when logged.
+        """
+        mid_price = book.midpoint()
+        spread = book.spread()
+        self.log.info(
+            f"Book #{self.book_count} at {unix_nanos_to_iso8601(book.ts_event)}: "
+            f"best bid {book.best_bid_price()}, best ask {book.best_ask_price()}"
+            + (
+                f", mid {mid_price:.{self.price_precision}f}, spread {spread:.{self.price_precision}f}"
+                if mid_price is not None
+                else ""
+            )
+            + f", {self.delta_count} deltas so far"
+            + (
+                f", imbalance {self.features.imbalance:.4f}, microprice {self.features.microprice:.{self.price_precision}f}"
+                if self.features is not None
+                else ""
+            )
+            + "\n"
+            + book.pprint(num_levels=self.config.log_levels)
+        )
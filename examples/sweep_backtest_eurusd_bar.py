@@ -0,0 +1,162 @@
+import itertools
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from data.binance_loader import SHARED_DIR, table_to_ticks
+from data.reports import close_series, fills_arrays, positions_arrays
+from data.stats import portfolio_stats
+from examples.backtest_eurusd_bar_low_level_api import (
+    get_data_table,
+    get_fill_model,
+    get_instrument,
+    get_strategy,
+)
+from examples.engine_harness import EngineHarness
+
+# Grid search of the low-level bar backtest over a process pool,
+# each worker loads the instrument and the bars once into an `EngineHarness` and runs many configs on it,
+# the portfolio stats of each run are computed from its fills in NumPy (see `data.stats`)
+
+DEFAULT_GRID = {
+    "strategy_name": ["ema"],
+    "fast_ema_period": [5, 10, 20],
+    "slow_ema_period": [20, 50, 100],
+    "prob_fill_on_limit": [0.2],
+    "prob_fill_on_stop": [0.95],
+    "prob_slippage": [0.0, 0.5],
+}
+
+_worker_state: dict = {}
+
+
+def expand_grid(grid: dict[str, list]) -> list[dict]:
+    """
+    Cartesian product of the parameter `grid`, skipping EMA configs whose fast period
+    is not shorter than the slow one.
+    """
+    configs = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+    return [
+        config
+        for config in configs
+        if config.get("strategy_name", "ema") != "ema"
+        or config.get("fast_ema_period", 10) < config.get("slow_ema_period", 20)
+    ]
+
+
+def _init_worker(
+    use_1m: bool, cache_dir: str | None, shared_dir: str | None, init_cash: int
+) -> None:
+    instrument = get_instrument()
+    bars = get_data_table(
+        instrument, use_1m=use_1m, cache_dir=cache_dir, shared_dir=shared_dir
+    )
+    _worker_state.update(
+        harness=EngineHarness(instrument, table_to_ticks(bars), init_cash=init_cash),
+        close=close_series(bars),
+        init_cash=init_cash,
+        use_1m=use_1m,
+    )
+
+
+def run_config(config: dict) -> dict:
+    """
+    Run one backtest of `config` on the engine kept by the worker and
+    return the config together with the result stats.
+    """
+    harness = _worker_state["harness"]
+    fill_model = get_fill_model(
+        **{
+            key: config[key]
+            for key in ("prob_fill_on_limit", "prob_fill_on_stop", "prob_slippage")
+            if key in config
+        }
+    )
+    strategy = get_strategy(
+        harness.instrument,
+        use_1m=_worker_state["use_1m"],
+        **{
+            key: config[key]
+            for key in ("strategy_name", "fast_ema_period", "slow_ema_period")
+            if key in config
+        },
+    )
+
+    start_time = time.perf_counter()
+    result = harness.run(strategy, fill_model=fill_model)
+
+    row = dict(config)
+    row.update(
+        total_orders=result.total_orders,
+        total_positions=result.total_positions,
+        total_events=result.total_events,
+        elapsed_time=time.perf_counter() - start_time,
+    )
+    for currency, stats in result.stats_pnls.items():
+        row.update({f"{currency} {name}": value for name, value in stats.items()})
+    row.update(result.stats_returns)
+    cache = harness.engine.cache
+    row.update(
+        portfolio_stats(
+            fills_arrays(cache.orders()),
+            _worker_state["close"],
+            _worker_state["init_cash"],
+            # The closed cycles of the NETTING positions, as `generate_positions_report`
+            positions=positions_arrays(cache.positions() + cache.position_snapshots()),
+        )
+    )
+    return row
+
+
+def run_sweep(
+    grid: dict[str, list] = DEFAULT_GRID,
+    max_workers: int | None = None,
+    use_1m: bool = False,
+    cache_dir: str | None = "cache",
+    shared: bool = True,
+    init_cash: int = 10_000,
+) -> pd.DataFrame:
+    """
+    Run a backtest for every config of the parameter `grid` over a process pool
+    and return one row of stats per config.
+
+    With `shared`, the bars are decoded once into shared memory before the pool starts
+    and every worker attaches to them instead of decoding the day itself.
+    """
+    configs = expand_grid(grid)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(configs))
+    shared_dir = None
+    if shared and max_workers > 1:
+        shared_dir = tempfile.mkdtemp(prefix="sweep-", dir=SHARED_DIR)
+        # Only decodes and publishes the day (the workers build their own `Bar` objects)
+        get_data_table(
+            get_instrument(), use_1m=use_1m, cache_dir=cache_dir, shared_dir=shared_dir
+        )
+    initargs = (use_1m, cache_dir, shared_dir, init_cash)
+    try:
+        if max_workers <= 1:
+            _init_worker(*initargs)
+            rows = list(map(run_config, configs))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=initargs
+            ) as executor:
+                rows = list(executor.map(run_config, configs))
+    finally:
+        if shared_dir is not None:
+            shutil.rmtree(shared_dir, ignore_errors=True)
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    # python -m examples.sweep_backtest_eurusd_bar
+    start_time = time.perf_counter()
+    results = run_sweep(DEFAULT_GRID)
+    print("Time:", time.perf_counter() - start_time)
+
+    pd.set_option("display.max_columns", None)
+    pd.set_option("display.width", None)
+    print(results.sort_values("USDT PnL (total)", ascending=False))
+    results.to_csv("sweep_results.csv", index=False)